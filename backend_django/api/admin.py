@@ -6,10 +6,18 @@ from .models import (
     AssessmentSession,
     AssessmentResponse,
     Project,
+    CheckpointDefinition,
     Checkpoint,
     Decision,
+    CatalogRetrofitRun,
     AITool,
+    ToolCompatibility,
+    ToolSyncRun,
+    ToolSyncChange,
     CheckpointComment,
+    ChangeLogEntry,
+    ChangeLogRecipient,
+    Notification,
 )
 
 admin.site.register(UserProfile)
@@ -17,7 +25,15 @@ admin.site.register(ResearchConsent)
 admin.site.register(AssessmentSession)
 admin.site.register(AssessmentResponse)
 admin.site.register(Project)
+admin.site.register(CheckpointDefinition)
 admin.site.register(Checkpoint)
 admin.site.register(Decision)
+admin.site.register(CatalogRetrofitRun)
 admin.site.register(AITool)
+admin.site.register(ToolCompatibility)
+admin.site.register(ToolSyncRun)
+admin.site.register(ToolSyncChange)
 admin.site.register(CheckpointComment)
+admin.site.register(ChangeLogEntry)
+admin.site.register(ChangeLogRecipient)
+admin.site.register(Notification)
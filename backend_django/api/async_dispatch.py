@@ -0,0 +1,54 @@
+"""Async implementations for hot endpoints in the ASGI deployment mode.
+
+Under ASGI, Django runs every sync view on one shared thread (see
+asgiref's thread_sensitive), so a handful of slow requests queue up all
+the others. The hot read paths therefore get async implementations that
+use the async ORM and never leave the event loop.
+
+``with_async`` attaches one to an existing DRF view. When
+settings.SERVER_MODE is 'asgi', requests with the given methods go to the
+async implementation and everything else (writes, 405s) still goes
+through the DRF view. Under WSGI the DRF view is returned unchanged,
+since an async view there would just add an event loop per request.
+"""
+import json
+from functools import wraps
+from typing import Any, Awaitable, Callable
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import HttpRequest, HttpResponse
+from django.views.decorators.csrf import csrf_exempt
+
+AsyncView = Callable[..., Awaitable[HttpResponse]]
+
+
+def async_views_enabled() -> bool:
+    return getattr(settings, 'SERVER_MODE', 'wsgi') == 'asgi'
+
+
+def json_response(data: Any, status: int = 200) -> HttpResponse:
+    """JSON in the same compact, non-ASCII-escaped form as DRF's JSONRenderer."""
+    body = json.dumps(data, cls=DjangoJSONEncoder, ensure_ascii=False, separators=(',', ':'))
+    return HttpResponse(body.encode(), status=status, content_type='application/json')
+
+
+def with_async(async_view: AsyncView, methods: tuple[str, ...] = ('GET', 'HEAD')) -> Callable:
+    """Route ``methods`` to ``async_view`` in ASGI mode; see the module docstring."""
+    def decorator(sync_view: Callable) -> Callable:
+        if not async_views_enabled():
+            return sync_view
+
+        sync_fallback = sync_to_async(sync_view)
+
+        @csrf_exempt  # as with the DRF views; CORS restricts origins
+        @wraps(sync_view)
+        async def view(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+            if request.method in methods:
+                return await async_view(request, *args, **kwargs)
+            return await sync_fallback(request, *args, **kwargs)
+
+        view.async_view = async_view
+        return view
+    return decorator
@@ -0,0 +1,52 @@
+"""Write the institution-wide compliance export to a file."""
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from api.services.compliance_export import (
+    PROJECT_CHUNK_SIZE,
+    filter_export_projects,
+    stream_bulk_export,
+)
+from api.services.export_formats import EXPORT_FORMATS, format_for_filename
+
+
+class Command(BaseCommand):
+    help = 'Export every matching project with its checkpoints and decisions (CSV, JSONL or Parquet)'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--output', required=True, help='Where to write the export')
+        parser.add_argument('--format', choices=list(EXPORT_FORMATS),
+                            help='Export format (default: from the output file extension, else csv)')
+        parser.add_argument('--use-case', help='Only projects with this ai_use_case')
+        parser.add_argument('--department', help="Only projects whose owner is in this department")
+        parser.add_argument('--created-after', help='Only projects created on or after this date (YYYY-MM-DD)')
+        parser.add_argument('--created-before', help='Only projects created on or before this date (YYYY-MM-DD)')
+        parser.add_argument('--chunk-size', type=int, default=PROJECT_CHUNK_SIZE,
+                            help='Projects fetched per database round trip')
+
+    def _date(self, options, name: str):
+        value = options[name]
+        if not value:
+            return None
+        try:
+            parsed = parse_date(value)
+        except ValueError:
+            parsed = None
+        if parsed is None:
+            raise CommandError(f'--{name.replace("_", "-")} must be a date (YYYY-MM-DD)')
+        return parsed
+
+    def handle(self, *args, **options) -> None:
+        export_format = EXPORT_FORMATS[options['format'] or format_for_filename(options['output'])]
+        projects = filter_export_projects(
+            use_case=options['use_case'],
+            created_after=self._date(options, 'created_after'),
+            created_before=self._date(options, 'created_before'),
+            department=options['department'],
+        )
+
+        with open(options['output'], 'wb') as target:
+            for chunk in stream_bulk_export(projects, export_format, options['chunk_size']):
+                target.write(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f'Done: compliance export written to {options["output"]}'))
@@ -0,0 +1,49 @@
+"""Mail-merge a document template against a file of records."""
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.document_batch import (
+    INPUT_FORMATS,
+    OUTPUT_FORMATS,
+    detect_input_format,
+    iter_records,
+    render_records,
+    stream_jsonl,
+    stream_zip,
+)
+from api.services.ethics_engine import ESCAPERS, get_all_templates
+
+
+class Command(BaseCommand):
+    help = 'Generate one document per record (JSON array, JSONL or CSV) from a template'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('template_key', help='Key from DOCUMENT_TEMPLATES, e.g. syllabus_ai_statement')
+        parser.add_argument('input', help='Path to the records file')
+        parser.add_argument('--output', required=True, help='Where to write the results')
+        parser.add_argument('--input-format', choices=INPUT_FORMATS,
+                            help='Record format (default: from the input file extension)')
+        parser.add_argument('--format', choices=OUTPUT_FORMATS,
+                            help='Output format (default: from the output file extension, else jsonl)')
+        parser.add_argument('--name-field', help='Record field used to name files inside the zip')
+        parser.add_argument('--escape', choices=list(ESCAPERS), help='Escape field values as html or markdown')
+
+    def handle(self, *args, **options) -> None:
+        template_key = options['template_key']
+        if template_key not in get_all_templates():
+            raise CommandError(f'Unknown template: {template_key}')
+
+        input_format = options['input_format'] or detect_input_format(options['input'])
+        if not input_format:
+            raise CommandError('Could not tell the input format; pass --input-format')
+        output_format = options['format'] or ('zip' if options['output'].endswith('.zip') else 'jsonl')
+
+        with open(options['input'], 'rb') as source, open(options['output'], 'wb') as target:
+            documents = render_records(template_key, iter_records(source, input_format), options['escape'])
+            if output_format == 'zip':
+                chunks = stream_zip(documents, options['name_field'])
+            else:
+                chunks = stream_jsonl(documents)
+            for chunk in chunks:
+                target.write(chunk)
+
+        self.stdout.write(self.style.SUCCESS(f'Done: documents written to {options["output"]}'))
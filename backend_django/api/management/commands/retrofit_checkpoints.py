@@ -0,0 +1,71 @@
+"""Apply the current checkpoint catalog to existing projects.
+
+Adds checkpoints that were introduced after a project was created and
+re-points existing ones at the current definitions (label, guidance and
+framework tags). Work is committed in batches and progress is recorded in
+CatalogRetrofitRun, so an interrupted run picks up where it stopped.
+"""
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+from api.models import Project, CatalogRetrofitRun
+from api.services.checkpoint_catalog import get_current_definitions, retrofit_projects
+from api.services.checkpoint_generator import CATALOG_VERSION
+
+
+class Command(BaseCommand):
+    help = 'Apply checkpoint catalog changes to existing projects in resumable batches'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Projects per transaction (default: 500)')
+        parser.add_argument('--restart', action='store_true',
+                            help='Ignore saved progress and start from the first project')
+
+    def handle(self, *args, **options) -> None:
+        batch_size: int = options['batch_size']
+
+        run = None
+        if not options['restart']:
+            run = CatalogRetrofitRun.objects.filter(catalog_version=CATALOG_VERSION).order_by('-id').first()
+            if run and run.finished_at:
+                self.stdout.write(self.style.SUCCESS(
+                    f'Catalog {CATALOG_VERSION} was already applied on {run.finished_at:%Y-%m-%d %H:%M}. '
+                    'Use --restart to run again.'
+                ))
+                return
+        if run is None:
+            run = CatalogRetrofitRun.objects.create(catalog_version=CATALOG_VERSION)
+        elif run.last_project_id:
+            self.stdout.write(f'Resuming after project {run.last_project_id}')
+
+        definitions = get_current_definitions()
+        while True:
+            batch = list(
+                Project.objects.filter(id__gt=run.last_project_id)
+                .order_by('id')
+                .values_list('id', 'ai_use_case')[:batch_size]
+            )
+            if not batch:
+                break
+
+            with transaction.atomic():
+                created, updated = retrofit_projects(batch, definitions)
+                run.last_project_id = batch[-1][0]
+                run.projects_processed += len(batch)
+                run.checkpoints_created += created
+                run.checkpoints_updated += updated
+                run.save()
+
+            self.stdout.write(
+                f'  {run.projects_processed} projects '
+                f'({run.checkpoints_created} created, {run.checkpoints_updated} updated)'
+            )
+
+        run.finished_at = timezone.now()
+        run.save(update_fields=['finished_at', 'updated_at'])
+        self.stdout.write(self.style.SUCCESS(
+            f'\nDone: catalog {CATALOG_VERSION} applied to {run.projects_processed} projects, '
+            f'{run.checkpoints_created} checkpoints created, {run.checkpoints_updated} updated'
+        ))
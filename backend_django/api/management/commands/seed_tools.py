@@ -1,7 +1,15 @@
-"""Seed the Tool Library with AI tools, productivity tools, and compliance guidance."""
-from django.core.management.base import BaseCommand
+"""Seed the Tool Library with AI tools, productivity tools, and compliance guidance.
 
-from api.models import AITool
+Seeding is idempotent: tools are matched by name, only new tools and
+changed fields are written, and a run against an up-to-date registry
+writes nothing. Use --file to load an institutional catalog from JSON or
+CSV instead of the built-in list, and --dry-run to see the diff first.
+"""
+from typing import Any
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.tool_seeding import SeedPlan, apply_seed_plan, load_seed_file, plan_seed
 
 SEED_TOOLS = [
     {
@@ -286,30 +294,47 @@ SEED_TOOLS = [
 ]
 
 
+def _preview(value: Any, width: int = 60) -> str:
+    text = repr(value)
+    return text if len(text) <= width else text[:width - 3] + '...'
+
+
 class Command(BaseCommand):
     help = 'Seed the Tool Library with AI tools, productivity tools, and compliance guidance'
 
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('--file', help='Load tools from a JSON or CSV file instead of the built-in list')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Show what would be created and updated without writing')
+        parser.add_argument('--batch-size', type=int, default=500,
+                            help='Rows per bulk insert/update statement (default: 500)')
+
     def handle(self, *args, **options) -> None:
-        created_count = 0
-        updated_count = 0
+        try:
+            rows = load_seed_file(options['file']) if options['file'] else [dict(row) for row in SEED_TOOLS]
+            plan = plan_seed(rows)
+        except (OSError, ValueError) as e:
+            raise CommandError(str(e))
 
-        for tool_data in SEED_TOOLS:
-            tool, created = AITool.objects.get_or_create(
-                name=tool_data['name'],
-                defaults=tool_data,
-            )
-            if created:
-                created_count += 1
-                self.stdout.write(self.style.SUCCESS(f'  Created: {tool.name}'))
-            else:
-                # Update existing tool with new fields
-                for key, value in tool_data.items():
-                    if key != 'name':
-                        setattr(tool, key, value)
-                tool.save()
-                updated_count += 1
-                self.stdout.write(f'  Updated: {tool.name}')
+        self.report(plan, verbose=options['dry_run'])
+        if options['dry_run']:
+            self.stdout.write(self.style.WARNING('\nDry run: nothing was written'))
+            return
 
+        apply_seed_plan(plan, batch_size=options['batch_size'])
         self.stdout.write(self.style.SUCCESS(
-            f'\nDone: {created_count} created, {updated_count} updated'
+            f'\nDone: {len(plan.to_create)} created, {len(plan.to_update)} updated, {plan.unchanged} unchanged'
         ))
+
+    def report(self, plan: SeedPlan, verbose: bool) -> None:
+        for tool in plan.to_create:
+            self.stdout.write(self.style.SUCCESS(f'  Create: {tool.name}'))
+        for tool, changes in plan.to_update:
+            self.stdout.write(f'  Update: {tool.name} ({", ".join(sorted(changes))})')
+            if verbose:
+                for name, (old, new) in sorted(changes.items()):
+                    self.stdout.write(f'      {name}: {_preview(old)} -> {_preview(new)}')
+        if verbose:
+            self.stdout.write(
+                f'\n{len(plan.to_create)} to create, {len(plan.to_update)} to update, {plan.unchanged} unchanged'
+            )
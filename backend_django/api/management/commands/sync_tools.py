@@ -0,0 +1,48 @@
+"""Sync the Tool Library from an external catalog export (JSONL).
+
+Streams the file in batches, so catalogs of any size run in bounded
+memory. Each run is recorded as a ToolSyncRun with one ToolSyncChange per
+created or updated tool.
+"""
+from functools import partial
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+
+from api.services.tool_sync import SYNC_BATCH_SIZE, sync_tool_catalog
+
+READ_CHUNK_SIZE = 64 * 1024
+
+
+class Command(BaseCommand):
+    help = 'Create and update tools from a JSONL catalog export, matched by external id or name and vendor'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument('path', help='JSONL file, one tool record per line')
+        parser.add_argument('--batch-size', type=int, default=SYNC_BATCH_SIZE,
+                            help=f'Records per transaction (default: {SYNC_BATCH_SIZE})')
+        parser.add_argument('--dry-run', action='store_true',
+                            help='Count what would change without writing tools')
+
+    def handle(self, *args, **options) -> None:
+        path = Path(options['path'])
+        try:
+            with path.open('rb') as f:
+                run = sync_tool_catalog(
+                    iter(partial(f.read, READ_CHUNK_SIZE), b''),
+                    source=path.name,
+                    dry_run=options['dry_run'],
+                    batch_size=options['batch_size'],
+                )
+        except OSError as e:
+            raise CommandError(str(e))
+
+        for error in run.errors:
+            self.stdout.write(self.style.WARNING(f'  {error}'))
+        if run.failed > len(run.errors):
+            self.stdout.write(self.style.WARNING(f'  ... and {run.failed - len(run.errors)} more'))
+        prefix = 'Dry run' if run.dry_run else 'Done'
+        self.stdout.write(self.style.SUCCESS(
+            f'\n{prefix} (run {run.id}): {run.records_read} records, {run.created} created, '
+            f'{run.updated} updated, {run.unchanged} unchanged, {run.failed} failed'
+        ))
@@ -0,0 +1,38 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0008_add_student_collaborator'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CheckpointDefinition',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('catalog_version', models.CharField(max_length=40)),
+                ('checkpoint_id', models.CharField(max_length=50)),
+                ('label', models.CharField(max_length=200)),
+                ('category', models.CharField(max_length=50)),
+                ('what', models.TextField(blank=True)),
+                ('why', models.TextField(blank=True)),
+                ('how', models.TextField(blank=True)),
+                ('frameworks', models.JSONField(blank=True, default=list)),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('catalog_version', 'checkpoint_id'), name='unique_checkpoint_definition_per_version')],
+            },
+        ),
+        migrations.AlterModelOptions(
+            name='checkpoint',
+            options={'ordering': ['id']},
+        ),
+        migrations.AddField(
+            model_name='checkpoint',
+            name='definition',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='checkpoints', to='api.checkpointdefinition'),
+        ),
+    ]
@@ -0,0 +1,67 @@
+"""Move per-project checkpoint text into shared CheckpointDefinition rows.
+
+Existing rows are grouped by their exact text. Each distinct variant gets a
+'legacy-<hash>' catalog version so nothing is lost; retrofit_checkpoints
+later re-points projects at the current catalog.
+"""
+import hashlib
+import json
+
+from django.db import migrations
+
+TEXT_FIELDS = ('label', 'category', 'what', 'why', 'how', 'frameworks')
+BATCH_SIZE = 1000
+
+
+def legacy_version(content: dict) -> str:
+    digest = hashlib.sha256(json.dumps(content, sort_keys=True).encode()).hexdigest()
+    return f"legacy-{digest[:12]}"
+
+
+def forwards(apps, schema_editor):
+    Checkpoint = apps.get_model('api', 'Checkpoint')
+    CheckpointDefinition = apps.get_model('api', 'CheckpointDefinition')
+
+    definitions = {}
+    pending = []
+    for cp in Checkpoint.objects.order_by('id').iterator(chunk_size=BATCH_SIZE):
+        content = {field: getattr(cp, field) for field in TEXT_FIELDS}
+        content['frameworks'] = content['frameworks'] or []
+        key = (cp.checkpoint_id, legacy_version(content))
+        if key not in definitions:
+            definitions[key], _ = CheckpointDefinition.objects.get_or_create(
+                catalog_version=key[1], checkpoint_id=cp.checkpoint_id, defaults=content,
+            )
+        cp.definition = definitions[key]
+        pending.append(cp)
+        if len(pending) >= BATCH_SIZE:
+            Checkpoint.objects.bulk_update(pending, ['definition'])
+            pending = []
+    if pending:
+        Checkpoint.objects.bulk_update(pending, ['definition'])
+
+
+def backwards(apps, schema_editor):
+    Checkpoint = apps.get_model('api', 'Checkpoint')
+
+    pending = []
+    for cp in Checkpoint.objects.select_related('definition').order_by('id').iterator(chunk_size=BATCH_SIZE):
+        for field in TEXT_FIELDS:
+            setattr(cp, field, getattr(cp.definition, field))
+        pending.append(cp)
+        if len(pending) >= BATCH_SIZE:
+            Checkpoint.objects.bulk_update(pending, list(TEXT_FIELDS))
+            pending = []
+    if pending:
+        Checkpoint.objects.bulk_update(pending, list(TEXT_FIELDS))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0009_checkpointdefinition'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
@@ -0,0 +1,52 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0010_backfill_checkpoint_definitions'),
+    ]
+
+    operations = [
+        # Defaults let the reverse migration re-add the columns to existing rows
+        migrations.AlterField(
+            model_name='checkpoint',
+            name='label',
+            field=models.CharField(default='', max_length=200),
+        ),
+        migrations.AlterField(
+            model_name='checkpoint',
+            name='category',
+            field=models.CharField(default='', max_length=50),
+        ),
+        migrations.RemoveField(
+            model_name='checkpoint',
+            name='label',
+        ),
+        migrations.RemoveField(
+            model_name='checkpoint',
+            name='category',
+        ),
+        migrations.RemoveField(
+            model_name='checkpoint',
+            name='what',
+        ),
+        migrations.RemoveField(
+            model_name='checkpoint',
+            name='why',
+        ),
+        migrations.RemoveField(
+            model_name='checkpoint',
+            name='how',
+        ),
+        migrations.RemoveField(
+            model_name='checkpoint',
+            name='frameworks',
+        ),
+        migrations.AlterField(
+            model_name='checkpoint',
+            name='definition',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='checkpoints', to='api.checkpointdefinition'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0011_remove_checkpoint_text_fields'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogRetrofitRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('catalog_version', models.CharField(max_length=40)),
+                ('last_project_id', models.IntegerField(default=0)),
+                ('projects_processed', models.IntegerField(default=0)),
+                ('checkpoints_created', models.IntegerField(default=0)),
+                ('checkpoints_updated', models.IntegerField(default=0)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
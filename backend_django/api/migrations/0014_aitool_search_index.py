@@ -0,0 +1,111 @@
+"""Create the tool search index and fill it from the existing registry.
+
+The table depends on the database: an FTS5 table on SQLite, a tsvector
+table on PostgreSQL, nothing where search falls back to an in-memory index
+(see api.services.tool_search). The SQL is copied from that module as it
+stood when this migration was written, so later changes there do not
+change what the migration does.
+"""
+from django.db import migrations
+
+BATCH_SIZE = 500
+SEARCH_TABLE = 'api_aitool_search'
+# (document field, tsvector weight class)
+SEARCH_FIELDS = [
+    ('name', 'A'),
+    ('vendor', 'B'),
+    ('description', 'C'),
+    ('risk_notes', 'D'),
+    ('guidance', 'D'),
+]
+
+
+def search_row(tool):
+    guidance = tool.compliance_guidance if isinstance(tool.compliance_guidance, dict) else {}
+    return (
+        tool.pk, tool.name, tool.vendor, tool.description, tool.risk_notes,
+        ' '.join(str(text) for text in guidance.values()),
+    )
+
+
+def search_engine(conn):
+    """'fts5', 'tsvector', or None where search uses the in-memory index."""
+    if conn.vendor == 'postgresql':
+        return 'tsvector'
+    if conn.vendor == 'sqlite':
+        with conn.cursor() as cursor:
+            cursor.execute("SELECT 1 FROM pragma_compile_options WHERE compile_options = 'ENABLE_FTS5'")
+            if cursor.fetchone() is not None:
+                return 'fts5'
+    return None
+
+
+def create_table(cursor, engine):
+    if engine == 'fts5':
+        columns = ', '.join(name for name, _ in SEARCH_FIELDS)
+        cursor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+            f"{columns}, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+        )
+    else:
+        cursor.execute(
+            f'CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ('
+            f'tool_id integer PRIMARY KEY REFERENCES api_aitool (id) ON DELETE CASCADE, '
+            f'document tsvector NOT NULL)'
+        )
+        cursor.execute(
+            f'CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document ON {SEARCH_TABLE} USING gin (document)'
+        )
+
+
+def index_rows(cursor, engine, rows):
+    if not rows:
+        return
+    if engine == 'fts5':
+        cursor.executemany(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [(row[0],) for row in rows])
+        placeholders = ', '.join(['%s'] * (len(SEARCH_FIELDS) + 1))
+        cursor.executemany(f'INSERT INTO {SEARCH_TABLE} (rowid, {", ".join(n for n, _ in SEARCH_FIELDS)}) '
+                           f'VALUES ({placeholders})', rows)
+    else:
+        document = ' || '.join(
+            f"setweight(to_tsvector('simple', %s), '{weight_class}')" for _, weight_class in SEARCH_FIELDS
+        )
+        cursor.executemany(
+            f'INSERT INTO {SEARCH_TABLE} (tool_id, document) VALUES (%s, {document}) '
+            f'ON CONFLICT (tool_id) DO UPDATE SET document = EXCLUDED.document',
+            rows,
+        )
+
+
+def forwards(apps, schema_editor):
+    engine = search_engine(schema_editor.connection)
+    if engine is None:
+        return
+    AITool = apps.get_model('api', 'AITool')
+    with schema_editor.connection.cursor() as cursor:
+        create_table(cursor, engine)
+        batch = []
+        for tool in AITool.objects.order_by('id').iterator(chunk_size=BATCH_SIZE):
+            batch.append(search_row(tool))
+            if len(batch) >= BATCH_SIZE:
+                index_rows(cursor, engine, batch)
+                batch = []
+        index_rows(cursor, engine, batch)
+
+
+def backwards(apps, schema_editor):
+    if search_engine(schema_editor.connection) is None:
+        return
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0013_changelogentry'),
+    ]
+
+    operations = [
+        migrations.RunPython(forwards, backwards),
+    ]
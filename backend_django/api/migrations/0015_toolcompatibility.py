@@ -0,0 +1,114 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+# Copied from api.services.tool_compatibility as it stood when this
+# migration was written, so later changes there do not change it
+PROJECT_USE_CASES = [
+    'data_analysis', 'qualitative', 'ml_model', 'writing', 'literature', 'grading', 'teaching', 'admin', 'other',
+]
+REQUIRED_COMPLIANCE = {
+    'grading': ['ferpa'],
+    'admin': ['ferpa'],
+}
+PREFERRED_COMPLIANCE = {
+    'data_analysis': ['ferpa', 'hipaa'],
+    'qualitative': ['ferpa', 'hipaa'],
+    'ml_model': ['ferpa', 'hipaa'],
+}
+COMPLIANCE_FLAGS = {
+    'ferpa': ('ferpa_compliant', 'FERPA'),
+    'hipaa': ('hipaa_compliant', 'HIPAA'),
+}
+STATUS_SCORES = {'approved': 30, 'under_review': 10, 'not_recommended': 0}
+RECOMMENDED_SCORE = 50
+REQUIRED_SCORE = 10
+PREFERRED_SCORE = 5
+
+
+def use_cases_for(tool):
+    recommended = tool.recommended_use_cases or []
+    return PROJECT_USE_CASES + [uc for uc in dict.fromkeys(recommended) if uc not in PROJECT_USE_CASES]
+
+
+def assess(tool, use_case):
+    recommended = use_case in (tool.recommended_use_cases or [])
+    reasons = []
+    score = STATUS_SCORES.get(tool.status, 0)
+    if recommended:
+        score += RECOMMENDED_SCORE
+        reasons.append(f'Recommended for {use_case}')
+
+    missing_required = []
+    for regulation in REQUIRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if getattr(tool, flag):
+            score += REQUIRED_SCORE
+            reasons.append(f'{label} compliant')
+        else:
+            missing_required.append(label)
+            reasons.append(f'Not {label} compliant; {use_case} involves student records')
+    for regulation in PREFERRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if getattr(tool, flag):
+            score += PREFERRED_SCORE
+            reasons.append(f'{label} compliant')
+        else:
+            reasons.append(f'Not {label} compliant; de-identify {label}-covered data first')
+
+    if tool.status == 'not_recommended':
+        verdict = 'not_recommended'
+        score = 0
+        reasons.insert(0, 'Not recommended by the institution')
+    elif missing_required:
+        verdict = 'caution'
+    elif recommended and tool.status == 'approved':
+        verdict = 'recommended'
+    else:
+        verdict = 'compatible'
+    if tool.status == 'under_review':
+        reasons.append('Still under institutional review')
+
+    return {
+        'use_case': use_case,
+        'recommended': recommended,
+        'verdict': verdict,
+        'score': score,
+        'reasons': reasons,
+    }
+
+
+def fill_matrix(apps, schema_editor):
+    AITool = apps.get_model('api', 'AITool')
+    ToolCompatibility = apps.get_model('api', 'ToolCompatibility')
+    ToolCompatibility.objects.bulk_create([
+        ToolCompatibility(tool_id=tool.id, **row)
+        for tool in AITool.objects.all()
+        for row in (assess(tool, use_case) for use_case in use_cases_for(tool))
+    ])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0014_aitool_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ToolCompatibility',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('use_case', models.CharField(max_length=50)),
+                ('recommended', models.BooleanField(default=False)),
+                ('verdict', models.CharField(choices=[('recommended', 'Recommended'), ('compatible', 'Compatible'), ('caution', 'Use with caution'), ('not_recommended', 'Not recommended')], max_length=20)),
+                ('score', models.PositiveSmallIntegerField(default=0)),
+                ('reasons', models.JSONField(blank=True, default=list)),
+                ('tool', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='compatibility', to='api.aitool')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['use_case', 'recommended', '-score'], name='toolcompat_use_case_rank')],
+                'constraints': [models.UniqueConstraint(fields=('tool', 'use_case'), name='unique_tool_use_case')],
+            },
+        ),
+        migrations.RunPython(fill_matrix, migrations.RunPython.noop),
+    ]
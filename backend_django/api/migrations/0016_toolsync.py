@@ -0,0 +1,71 @@
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0015_toolcompatibility'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ToolSyncChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('external_id', models.CharField(blank=True, max_length=100)),
+                ('name', models.CharField(max_length=200)),
+                ('action', models.CharField(choices=[('create', 'Created'), ('update', 'Updated')], max_length=10)),
+                ('changes', models.JSONField(default=dict)),
+            ],
+            options={
+                'ordering': ['id'],
+            },
+        ),
+        migrations.CreateModel(
+            name='ToolSyncRun',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('source', models.CharField(max_length=255)),
+                ('dry_run', models.BooleanField(default=False)),
+                ('records_read', models.IntegerField(default=0)),
+                ('created', models.IntegerField(default=0)),
+                ('updated', models.IntegerField(default=0)),
+                ('unchanged', models.IntegerField(default=0)),
+                ('failed', models.IntegerField(default=0)),
+                ('errors', models.JSONField(blank=True, default=list)),
+                ('started_at', models.DateTimeField(auto_now_add=True)),
+                ('finished_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='aitool',
+            name='external_id',
+            field=models.CharField(blank=True, help_text='Identifier in the procurement catalog, for syncing', max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='aitool',
+            index=models.Index(fields=['name', 'vendor'], name='aitool_name_vendor'),
+        ),
+        migrations.AddConstraint(
+            model_name='aitool',
+            constraint=models.UniqueConstraint(condition=models.Q(('external_id', ''), _negated=True), fields=('external_id',), name='unique_tool_external_id'),
+        ),
+        migrations.AddField(
+            model_name='toolsyncchange',
+            name='tool',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='sync_changes', to='api.aitool'),
+        ),
+        migrations.AddField(
+            model_name='toolsyncrun',
+            name='started_by',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='tool_sync_runs', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='toolsyncchange',
+            name='run',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='changes', to='api.toolsyncrun'),
+        ),
+    ]
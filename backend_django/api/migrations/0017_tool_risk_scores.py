@@ -0,0 +1,111 @@
+from django.db import migrations, models
+
+# Copied from api.services.tool_risk as it stood when this migration was
+# written, so later changes there do not change it
+REQUIRED_COMPLIANCE = {
+    'grading': ['ferpa'],
+    'admin': ['ferpa'],
+}
+PREFERRED_COMPLIANCE = {
+    'data_analysis': ['ferpa', 'hipaa'],
+    'qualitative': ['ferpa', 'hipaa'],
+    'ml_model': ['ferpa', 'hipaa'],
+}
+COMPLIANCE_FLAGS = {
+    'ferpa': ('ferpa_compliant', 'FERPA'),
+    'hipaa': ('hipaa_compliant', 'HIPAA'),
+}
+RETAINS_DATA_RISK = 20
+THIRD_PARTY_RISK = 20
+ENTERPRISE_PLAN_CREDIT = 10
+STATUS_RISK = {
+    'under_review': (15, 'Still under institutional review'),
+    'not_recommended': (40, 'Not recommended by the institution'),
+}
+MISSING_REQUIRED_RISK = 25
+MISSING_PREFERRED_RISK = 10
+NO_GUIDANCE_RISK = 5
+MAX_RISK = 100
+
+
+def base_factors(tool):
+    factors = []
+    if tool.retains_data:
+        factors.append((RETAINS_DATA_RISK, 'Retains user data'))
+    if tool.sends_to_third_party:
+        factors.append((THIRD_PARTY_RISK, 'Data leaves the institution'))
+    if tool.has_enterprise_plan and (tool.retains_data or tool.sends_to_third_party):
+        factors.append((-ENTERPRISE_PLAN_CREDIT, 'Institutional plan with data controls available'))
+    if tool.status in STATUS_RISK:
+        factors.append(STATUS_RISK[tool.status])
+    return factors
+
+
+def score(factors):
+    return max(0, min(MAX_RISK, sum(points for points, _ in factors))), [reason for _, reason in factors]
+
+
+def tool_risk(tool):
+    return score(base_factors(tool))
+
+
+def risk_columns(tool, use_case):
+    factors = base_factors(tool)
+    for regulation in REQUIRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if not getattr(tool, flag):
+            factors.append((MISSING_REQUIRED_RISK, f'Not {label} compliant; required for {use_case}'))
+    for regulation in PREFERRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if not getattr(tool, flag):
+            factors.append((MISSING_PREFERRED_RISK, f'Not {label} compliant'))
+    guidance = tool.compliance_guidance if isinstance(tool.compliance_guidance, dict) else {}
+    if not guidance.get(use_case):
+        factors.append((NO_GUIDANCE_RISK, f'No compliance guidance for {use_case}'))
+    risk_score, risk_factors = score(factors)
+    return {'risk_score': risk_score, 'risk_factors': risk_factors}
+
+
+def score_tools(apps, schema_editor):
+    AITool = apps.get_model('api', 'AITool')
+    ToolCompatibility = apps.get_model('api', 'ToolCompatibility')
+    tools = {tool.id: tool for tool in AITool.objects.all()}
+    for tool in tools.values():
+        tool.risk_score = tool_risk(tool)[0]
+    AITool.objects.bulk_update(tools.values(), ['risk_score'], batch_size=500)
+
+    rows = list(ToolCompatibility.objects.all())
+    for row in rows:
+        for name, value in risk_columns(tools[row.tool_id], row.use_case).items():
+            setattr(row, name, value)
+    ToolCompatibility.objects.bulk_update(rows, ['risk_score', 'risk_factors'], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0016_toolsync'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='aitool',
+            name='risk_score',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='toolcompatibility',
+            name='risk_factors',
+            field=models.JSONField(blank=True, default=list),
+        ),
+        migrations.AddField(
+            model_name='toolcompatibility',
+            name='risk_score',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddIndex(
+            model_name='toolcompatibility',
+            index=models.Index(fields=['use_case', 'risk_score', 'tool'], name='toolcompat_use_case_risk'),
+        ),
+        migrations.RunPython(score_tools, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+BACKFILL_BATCH_SIZE = 2000
+
+
+def add_current_members(apps, schema_editor):
+    """Existing entries go to their project's current members."""
+    Project = apps.get_model('api', 'Project')
+    ChangeLogEntry = apps.get_model('api', 'ChangeLogEntry')
+    ChangeLogRecipient = apps.get_model('api', 'ChangeLogRecipient')
+    members = {
+        project_id: {user_id for user_id in user_ids if user_id}
+        for project_id, *user_ids in Project.objects.values_list(
+            'id', 'user_id', 'faculty_advisor_id', 'student_collaborator_id',
+        )
+    }
+    recipients = []
+    entries = ChangeLogEntry.objects.filter(project_id__isnull=False).values_list('id', 'project_id')
+    for entry_id, project_id in entries.iterator(chunk_size=BACKFILL_BATCH_SIZE):
+        recipients.extend(
+            ChangeLogRecipient(entry_id=entry_id, user_id=user_id) for user_id in members.get(project_id, ())
+        )
+        if len(recipients) >= BACKFILL_BATCH_SIZE:
+            ChangeLogRecipient.objects.bulk_create(recipients)
+            recipients = []
+    ChangeLogRecipient.objects.bulk_create(recipients)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0018_project_tool_risk_notifications'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeLogRecipient',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_id', models.IntegerField()),
+                ('entry', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='recipients', to='api.changelogentry')),
+            ],
+            options={
+                'constraints': [models.UniqueConstraint(fields=('user_id', 'entry'), name='changelog_recipient_unique')],
+            },
+        ),
+        migrations.RunPython(add_current_members, migrations.RunPython.noop),
+    ]
@@ -1,8 +1,10 @@
 from .user import UserProfile
 from .research import ResearchConsent, AssessmentSession, AssessmentResponse
-from .project import Project, Checkpoint, Decision
-from .tools import AITool
+from .project import Project, CheckpointDefinition, Checkpoint, Decision, CatalogRetrofitRun
+from .tools import AITool, ToolCompatibility, ToolSyncRun, ToolSyncChange
 from .comments import CheckpointComment
+from .changes import ChangeLogEntry, ChangeLogRecipient
+from .notifications import Notification
 
 __all__ = [
     'UserProfile',
@@ -10,8 +12,16 @@ __all__ = [
     'AssessmentSession',
     'AssessmentResponse',
     'Project',
+    'CheckpointDefinition',
     'Checkpoint',
     'Decision',
+    'CatalogRetrofitRun',
     'AITool',
+    'ToolCompatibility',
+    'ToolSyncRun',
+    'ToolSyncChange',
     'CheckpointComment',
+    'ChangeLogEntry',
+    'ChangeLogRecipient',
+    'Notification',
 ]
@@ -0,0 +1,52 @@
+from django.db import models
+
+
+class ChangeLogEntry(models.Model):
+    """Append-only record of a create, update or delete, for incremental sync.
+
+    The auto-increment id doubles as the feed cursor. project_id is a plain
+    integer rather than a foreign key so entries outlive deleted projects.
+    The users allowed to see a project entry are recorded when it is
+    written (see ChangeLogRecipient).
+    """
+    ACTION_CHOICES = [
+        ('create', 'Create'),
+        ('update', 'Update'),
+        ('delete', 'Delete'),
+    ]
+
+    model = models.CharField(max_length=30)
+    object_id = models.IntegerField()
+    project_id = models.IntegerField(null=True, blank=True)
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    data = models.JSONField(null=True, blank=True)
+    changed_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['id']
+        indexes = [
+            models.Index(fields=['project_id', 'id'], name='changelog_project_cursor'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.action} {self.model} {self.object_id}"
+
+
+class ChangeLogRecipient(models.Model):
+    """A user who may read a change log entry.
+
+    The project's members when the change was made, plus anyone the change
+    removed from it, so members who lose access still receive the update or
+    delete that cut them off. user_id is a plain integer for the same reason
+    as ChangeLogEntry.project_id.
+    """
+    entry = models.ForeignKey(ChangeLogEntry, on_delete=models.CASCADE, related_name='recipients')
+    user_id = models.IntegerField()
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['user_id', 'entry'], name='changelog_recipient_unique'),
+        ]
+
+    def __str__(self) -> str:
+        return f"user {self.user_id} <- {self.entry}"
@@ -15,4 +15,4 @@ class CheckpointComment(models.Model):
         ordering = ['created_at']
 
     def __str__(self) -> str:
-        return f"Comment by {self.user.username} on {self.checkpoint.label[:30]}"
+        return f"Comment by {self.user.username} on {self.checkpoint.definition.label[:30]}"
@@ -0,0 +1,28 @@
+from django.db import models
+from django.contrib.auth.models import User
+
+
+class Notification(models.Model):
+    """A message for one user, e.g. that a project's tool is no longer recommended."""
+    KIND_CHOICES = [
+        ('tool_not_recommended', 'Tool not recommended'),
+    ]
+
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='notifications')
+    project = models.ForeignKey('api.Project', on_delete=models.CASCADE, null=True, blank=True,
+                                related_name='notifications')
+    tool = models.ForeignKey('api.AITool', on_delete=models.SET_NULL, null=True, blank=True,
+                             related_name='notifications')
+    kind = models.CharField(max_length=30, choices=KIND_CHOICES)
+    message = models.TextField()
+    created_at = models.DateTimeField(auto_now_add=True)
+    read_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['-id']
+        indexes = [
+            models.Index(fields=['user', '-id'], name='notification_user_recent'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.get_kind_display()} for {self.user.username}"
@@ -21,28 +21,56 @@ class Project(models.Model):
     status = models.CharField(max_length=20, default='active')
     ai_tools = models.ManyToManyField('api.AITool', blank=True, related_name='projects')
     created_at = models.DateTimeField(auto_now_add=True)
+    # Set while any of ai_tools is not recommended; maintained by api.services.project_risk
+    tool_risk_flag = models.BooleanField(default=False)
+    tool_risk_flagged_at = models.DateTimeField(null=True, blank=True)
 
     def __str__(self) -> str:
         return f"{self.name} ({self.user.username})"
 
 
-class Checkpoint(models.Model):
-    """Single compliance checkpoint tied to a project."""
-    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='checkpoints')
+class CheckpointDefinition(models.Model):
+    """Static checkpoint text shared by every project on the same catalog version."""
+    catalog_version = models.CharField(max_length=40)
     checkpoint_id = models.CharField(max_length=50)
     label = models.CharField(max_length=200)
     category = models.CharField(max_length=50)
-    assigned_to = models.CharField(max_length=20)
-    completed = models.BooleanField(default=False)
-    completed_at = models.DateTimeField(null=True, blank=True)
     what = models.TextField(blank=True)
     why = models.TextField(blank=True)
     how = models.TextField(blank=True)
     frameworks = models.JSONField(default=list, blank=True)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=['catalog_version', 'checkpoint_id'],
+                name='unique_checkpoint_definition_per_version',
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.label} ({self.catalog_version})"
+
+
+class Checkpoint(models.Model):
+    """Single compliance checkpoint tied to a project.
+
+    Only per-project state lives here; the label and guidance text come
+    from the shared CheckpointDefinition.
+    """
+    project = models.ForeignKey(Project, on_delete=models.CASCADE, related_name='checkpoints')
+    definition = models.ForeignKey(CheckpointDefinition, on_delete=models.PROTECT, related_name='checkpoints')
+    checkpoint_id = models.CharField(max_length=50)
+    assigned_to = models.CharField(max_length=20)
+    completed = models.BooleanField(default=False)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        ordering = ['id']
+
     def __str__(self) -> str:
         status = 'done' if self.completed else 'pending'
-        return f"{self.project.name} - {self.label} ({status})"
+        return f"{self.project.name} - {self.definition.label} ({status})"
 
 
 class Decision(models.Model):
@@ -58,3 +86,23 @@ class Decision(models.Model):
 
     def __str__(self) -> str:
         return f"{self.project.name} - {self.description[:50]}"
+
+
+class CatalogRetrofitRun(models.Model):
+    """Progress of applying a checkpoint catalog version to existing projects.
+
+    Projects are processed in id order, so last_project_id is enough to
+    resume an interrupted run.
+    """
+    catalog_version = models.CharField(max_length=40)
+    last_project_id = models.IntegerField(default=0)
+    projects_processed = models.IntegerField(default=0)
+    checkpoints_created = models.IntegerField(default=0)
+    checkpoints_updated = models.IntegerField(default=0)
+    started_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        state = 'finished' if self.finished_at else f'at project {self.last_project_id}'
+        return f"Retrofit {self.catalog_version} ({state})"
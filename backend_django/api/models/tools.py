@@ -33,6 +33,8 @@ class AITool(models.Model):
 
     tool_type = models.CharField(max_length=10, choices=TOOL_TYPE_CHOICES, default='ai')
     name = models.CharField(max_length=200)
+    external_id = models.CharField(max_length=100, blank=True,
+        help_text='Identifier in the procurement catalog, for syncing')
     description = models.TextField(blank=True)
     vendor = models.CharField(max_length=200, blank=True)
     category = models.CharField(max_length=30, choices=CATEGORY_CHOICES)
@@ -56,8 +58,99 @@ class AITool(models.Model):
     recommended_use_cases = models.JSONField(default=list, blank=True,
         help_text='List of use case keys this tool is suitable for')
 
+    # Derived by api.services.tool_risk on every save; 0 (no concerns) to 100
+    risk_score = models.PositiveSmallIntegerField(default=0)
+
     class Meta:
         ordering = ['name']
+        constraints = [
+            models.UniqueConstraint(fields=['external_id'], condition=~models.Q(external_id=''),
+                                    name='unique_tool_external_id'),
+        ]
+        indexes = [
+            models.Index(fields=['name', 'vendor'], name='aitool_name_vendor'),
+        ]
 
     def __str__(self) -> str:
         return f"{self.name} ({self.get_tool_type_display()})"
+
+
+class ToolCompatibility(models.Model):
+    """Precomputed fit of one tool for one project use case.
+
+    Derived from the tool's recommended_use_cases, FERPA/HIPAA flags and
+    status by api.services.tool_compatibility, with the use case's risk
+    from api.services.tool_risk; rewritten whenever the tool is saved.
+    """
+    VERDICT_CHOICES = [
+        ('recommended', 'Recommended'),
+        ('compatible', 'Compatible'),
+        ('caution', 'Use with caution'),
+        ('not_recommended', 'Not recommended'),
+    ]
+
+    tool = models.ForeignKey(AITool, on_delete=models.CASCADE, related_name='compatibility')
+    use_case = models.CharField(max_length=50)
+    recommended = models.BooleanField(default=False)
+    verdict = models.CharField(max_length=20, choices=VERDICT_CHOICES)
+    score = models.PositiveSmallIntegerField(default=0)
+    reasons = models.JSONField(default=list, blank=True)
+    risk_score = models.PositiveSmallIntegerField(default=0)
+    risk_factors = models.JSONField(default=list, blank=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=['tool', 'use_case'], name='unique_tool_use_case'),
+        ]
+        indexes = [
+            models.Index(fields=['use_case', 'recommended', '-score'], name='toolcompat_use_case_rank'),
+            models.Index(fields=['use_case', 'risk_score', 'tool'], name='toolcompat_use_case_risk'),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.tool.name} for {self.use_case}: {self.verdict}"
+
+
+class ToolSyncRun(models.Model):
+    """One import of an external tool catalog, with its totals.
+
+    Per-record differences are kept as ToolSyncChange rows; the first
+    invalid records are kept in errors.
+    """
+    source = models.CharField(max_length=255)
+    started_by = models.ForeignKey(User, on_delete=models.SET_NULL, null=True, blank=True,
+                                   related_name='tool_sync_runs')
+    dry_run = models.BooleanField(default=False)
+    records_read = models.IntegerField(default=0)
+    created = models.IntegerField(default=0)
+    updated = models.IntegerField(default=0)
+    unchanged = models.IntegerField(default=0)
+    failed = models.IntegerField(default=0)
+    errors = models.JSONField(default=list, blank=True)
+    started_at = models.DateTimeField(auto_now_add=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self) -> str:
+        state = 'finished' if self.finished_at else f'{self.records_read} records read'
+        return f"Tool sync from {self.source} ({state})"
+
+
+class ToolSyncChange(models.Model):
+    """A tool created or updated by a sync run, with {field: [old, new]}."""
+    ACTION_CHOICES = [
+        ('create', 'Created'),
+        ('update', 'Updated'),
+    ]
+
+    run = models.ForeignKey(ToolSyncRun, on_delete=models.CASCADE, related_name='changes')
+    tool = models.ForeignKey(AITool, on_delete=models.SET_NULL, null=True, blank=True, related_name='sync_changes')
+    external_id = models.CharField(max_length=100, blank=True)
+    name = models.CharField(max_length=200)
+    action = models.CharField(max_length=10, choices=ACTION_CHOICES)
+    changes = models.JSONField(default=dict)
+
+    class Meta:
+        ordering = ['id']
+
+    def __str__(self) -> str:
+        return f"{self.get_action_display()} {self.name}"
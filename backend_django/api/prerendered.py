@@ -0,0 +1,40 @@
+"""Pre-rendered JSON responses for data that only changes on deploy.
+
+The ethics decision tree, research scenarios and document templates are
+module-level constants, so their responses are rendered once per process
+and served with a strong ETag derived from the body. Clients revalidate
+with If-None-Match and get a 304 without a body.
+"""
+import hashlib
+from dataclasses import dataclass
+from typing import Any
+
+from django.http import HttpRequest, HttpResponse
+from django.utils.cache import get_conditional_response, patch_cache_control
+
+from api.services.ethics_engine import render_json
+
+# Content only changes on deploy; clients revalidate with the ETag after this
+STATIC_MAX_AGE = 60 * 60 * 24
+
+
+@dataclass(frozen=True)
+class PrerenderedPayload:
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_data(cls, data: Any, version: str | None = None) -> 'PrerenderedPayload':
+        """Render data; the ETag is the given version or a hash of the body."""
+        body = render_json(data)
+        return cls(body=body, etag=f'"{version or hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def prerendered_response(request: HttpRequest, payload: PrerenderedPayload) -> HttpResponse:
+    """Return the payload, or a 304 if the client already has this version."""
+    response = get_conditional_response(request, etag=payload.etag)
+    if response is None:
+        response = HttpResponse(payload.body, content_type='application/json')
+    response['ETag'] = payload.etag
+    patch_cache_control(response, public=True, max_age=STATIC_MAX_AGE)
+    return response
@@ -0,0 +1,76 @@
+"""Run slow follow-up work outside the request.
+
+Views call enqueue_task() for work the response does not need to wait
+for (e.g. propagating a tool status change to thousands of projects).
+The task is handed to the runner once the current transaction commits,
+so it never sees, or acts on, a rolled-back change.
+
+The default ThreadPoolTaskRunner runs tasks on a small per-process thread
+pool (BACKGROUND_WORKERS threads, default 2); queued tasks are lost if
+the process exits. Set BACKGROUND_TASK_RUNNER in settings to the dotted
+path of a class with the same submit() method to use a durable queue,
+or to ImmediateTaskRunner to run tasks inline (tests, management
+commands). Tasks must be importable functions taking plain, picklable
+arguments, so a queue-backed runner can ship them to another process.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable
+
+from django.conf import settings
+from django.db import close_old_connections, connection, transaction
+from django.utils.module_loading import import_string
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKERS = 2
+
+
+def run_task(func: Callable[..., Any], *args: Any) -> None:
+    """Run one task, logging rather than raising its errors."""
+    try:
+        func(*args)
+    except Exception:
+        logger.exception('Background task %s failed', func.__qualname__)
+
+
+class ImmediateTaskRunner:
+    """Runs each task inline when submitted."""
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> None:
+        run_task(func, *args)
+
+
+class ThreadPoolTaskRunner:
+    """Runs tasks on a per-process thread pool."""
+
+    def __init__(self) -> None:
+        self.executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'BACKGROUND_WORKERS', DEFAULT_WORKERS),
+            thread_name_prefix='raise-task',
+        )
+
+    def submit(self, func: Callable[..., Any], *args: Any) -> None:
+        self.executor.submit(self._run, func, *args)
+
+    @staticmethod
+    def _run(func: Callable[..., Any], *args: Any) -> None:
+        # Worker threads get their own connection; drop it after each task
+        # so a long-lived thread never holds a stale one
+        close_old_connections()
+        try:
+            run_task(func, *args)
+        finally:
+            connection.close()
+
+
+@lru_cache(maxsize=None)
+def get_task_runner() -> ThreadPoolTaskRunner | ImmediateTaskRunner:
+    runner_path = getattr(settings, 'BACKGROUND_TASK_RUNNER', 'api.services.background.ThreadPoolTaskRunner')
+    return import_string(runner_path)()
+
+
+def enqueue_task(func: Callable[..., Any], *args: Any) -> None:
+    """Run ``func(*args)`` in the background once the current transaction commits."""
+    transaction.on_commit(lambda: get_task_runner().submit(func, *args))
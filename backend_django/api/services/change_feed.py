@@ -0,0 +1,238 @@
+"""Append-only change log behind the /api/changes sync feed.
+
+Signal handlers in api.signals call record_change() for every save and
+delete of the tracked models. Code that writes with bulk_create or
+bulk_update (which send no signals) calls record_changes() itself.
+
+Each entry stores a compact snapshot of the row, so consumers can upsert
+it directly instead of re-reading the full project payload, and the users
+who may read it: the project's members at the time, plus any member the
+change removed, so they still receive the update or delete that cut them
+off.
+
+Entry ids are assigned when a row is inserted, not when its transaction
+commits, so an entry can become visible after a higher id already has.
+changes_since() therefore only moves the cursor past an id that is still
+missing once the entry after it is older than COMMIT_GRACE; a missing id
+that old is taken to be a rollback.
+"""
+from datetime import timedelta
+from typing import Any, Callable, Iterable
+
+from django.db.models import Model, Q
+from django.utils import timezone
+
+from api.models import (
+    AITool,
+    ChangeLogEntry,
+    ChangeLogRecipient,
+    Checkpoint,
+    CheckpointComment,
+    Decision,
+    Project,
+)
+
+CHANGES_PAGE_SIZE = 500
+MAX_CHANGES_PAGE_SIZE = 1000
+COMMIT_GRACE = timedelta(seconds=60)
+
+MEMBER_FIELDS = ('user_id', 'faculty_advisor_id', 'student_collaborator_id')
+
+
+def _iso(value) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _project_data(project: Project) -> dict[str, Any]:
+    return {
+        'name': project.name,
+        'description': project.description,
+        'aiUseCase': project.ai_use_case,
+        'status': project.status,
+        'ownerId': project.user_id,
+        'facultyAdvisorId': project.faculty_advisor_id,
+        'studentCollaboratorId': project.student_collaborator_id,
+        'aiToolIds': sorted(tool.id for tool in project.ai_tools.all()),
+        'createdAt': _iso(project.created_at),
+    }
+
+
+def _checkpoint_data(cp: Checkpoint) -> dict[str, Any]:
+    return {
+        'checkpointId': cp.checkpoint_id,
+        'definitionId': cp.definition_id,
+        'assignedTo': cp.assigned_to,
+        'completed': cp.completed,
+        'completedAt': _iso(cp.completed_at),
+    }
+
+
+def _decision_data(d: Decision) -> dict[str, Any]:
+    return {
+        'checkpointDbId': d.checkpoint_id,
+        'description': d.description,
+        'notes': d.notes,
+        'proofType': d.proof_type or None,
+        'proofValue': d.proof_value or None,
+        'toolUsedId': d.tool_used_id,
+        'loggedAt': _iso(d.logged_at),
+    }
+
+
+def _comment_data(comment: CheckpointComment) -> dict[str, Any]:
+    return {
+        'checkpointDbId': comment.checkpoint_id,
+        'userId': comment.user_id,
+        'text': comment.text,
+        'createdAt': _iso(comment.created_at),
+    }
+
+
+def _tool_data(tool: AITool) -> dict[str, Any]:
+    return {
+        'name': tool.name,
+        'toolType': tool.tool_type,
+        'category': tool.category,
+        'status': tool.status,
+        'vendor': tool.vendor,
+    }
+
+
+def _comment_project_id(comment: CheckpointComment) -> int | None:
+    try:
+        return comment.checkpoint.project_id
+    except Checkpoint.DoesNotExist:
+        return None
+
+
+# model -> (feed name, project id getter, snapshot)
+TRACKED_MODELS: dict[type[Model], tuple[str, Callable[[Any], int | None], Callable[[Any], dict[str, Any]]]] = {
+    Project: ('project', lambda p: p.pk, _project_data),
+    Checkpoint: ('checkpoint', lambda cp: cp.project_id, _checkpoint_data),
+    Decision: ('decision', lambda d: d.project_id, _decision_data),
+    CheckpointComment: ('comment', _comment_project_id, _comment_data),
+    AITool: ('tool', lambda t: None, _tool_data),
+}
+
+
+def _entry(instance: Model, action: str) -> ChangeLogEntry:
+    name, get_project_id, snapshot = TRACKED_MODELS[type(instance)]
+    return ChangeLogEntry(
+        model=name,
+        object_id=instance.pk,
+        project_id=get_project_id(instance),
+        action=action,
+        data=None if action == 'delete' else snapshot(instance),
+    )
+
+
+def project_member_ids(project: Project) -> set[int]:
+    return {getattr(project, name) for name in MEMBER_FIELDS} - {None}
+
+
+def _recipient_ids(instances: list[Model], entries: list[ChangeLogEntry]) -> list[set[int]]:
+    """Who may read each entry, in one query for the members of non-project rows' projects."""
+    lookup = {
+        entry.project_id for instance, entry in zip(instances, entries)
+        if entry.project_id is not None and not isinstance(instance, Project)
+    }
+    members: dict[int, set[int]] = {}
+    if lookup:
+        members = {
+            project_id: {user_id for user_id in user_ids if user_id}
+            for project_id, *user_ids in Project.objects.filter(id__in=lookup).values_list('id', *MEMBER_FIELDS)
+        }
+    recipients = []
+    for instance, entry in zip(instances, entries):
+        if isinstance(instance, Project):
+            # Members this save removed, stashed by a pre_save handler in api.signals
+            recipients.append(project_member_ids(instance) | instance.__dict__.pop('_previous_member_ids', set()))
+        else:
+            recipients.append(members.get(entry.project_id, set()))
+    return recipients
+
+
+def record_change(instance: Model, action: str) -> None:
+    record_changes([instance], action)
+
+
+def record_changes(instances: Iterable[Model], action: str) -> None:
+    """Log rows with their recipients; for signal handlers and callers using bulk_create/bulk_update."""
+    instances = list(instances)
+    entries = [_entry(instance, action) for instance in instances]
+    if not entries:
+        return
+    recipients = _recipient_ids(instances, entries)
+    ChangeLogEntry.objects.bulk_create(entries)
+    ChangeLogRecipient.objects.bulk_create([
+        ChangeLogRecipient(entry=entry, user_id=user_id)
+        for entry, user_ids in zip(entries, recipients)
+        for user_id in user_ids
+    ])
+
+
+def _settled_through(cursor: int, last: int) -> int:
+    """The highest id up to ``last`` that no late-committing entry can still appear before.
+
+    Entries written within COMMIT_GRACE, and the ids from the last older
+    entry on, must be contiguous; the cursor stops before the first gap.
+    """
+    recent = list(
+        ChangeLogEntry.objects.filter(id__gt=cursor, id__lte=last, changed_at__gte=timezone.now() - COMMIT_GRACE)
+        .order_by('id')
+        .values_list('id', flat=True)
+    )
+    if not recent:
+        return last
+    previous = (
+        ChangeLogEntry.objects.filter(id__gt=cursor, id__lt=recent[0])
+        .order_by('-id')
+        .values_list('id', flat=True)
+        .first()
+    )
+    expected = (previous or cursor) + 1
+    for entry_id in recent:
+        if entry_id != expected:
+            return expected - 1
+        expected += 1
+    return last
+
+
+def changes_since(
+    cursor: int,
+    limit: int = CHANGES_PAGE_SIZE,
+    user_id: int | None = None,
+) -> tuple[list[ChangeLogEntry], bool, int]:
+    """Entries after ``cursor``, oldest first, whether more are waiting and the next cursor.
+
+    With ``user_id``, only entries recorded for that user and changes to the
+    shared tool registry are returned. A page stops early, with no more
+    waiting, at an id that may still commit.
+    """
+    entries = ChangeLogEntry.objects.filter(id__gt=cursor)
+    if user_id is not None:
+        entries = entries.filter(
+            Q(model='tool') | Q(id__in=ChangeLogRecipient.objects.filter(user_id=user_id).values('entry_id'))
+        )
+    page = list(entries.order_by('id')[:limit + 1])
+    has_more = len(page) > limit
+    page = page[:limit]
+    if not page:
+        return [], False, cursor
+
+    settled = _settled_through(cursor, page[-1].id)
+    if settled < page[-1].id:
+        return [entry for entry in page if entry.id <= settled], False, settled
+    return page, has_more, settled
+
+
+def serialize_change(entry: ChangeLogEntry) -> dict[str, Any]:
+    return {
+        'cursor': entry.id,
+        'model': entry.model,
+        'id': entry.object_id,
+        'projectId': entry.project_id,
+        'action': entry.action,
+        'data': entry.data,
+        'changedAt': entry.changed_at.isoformat(),
+    }
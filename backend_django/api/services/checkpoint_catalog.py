@@ -0,0 +1,128 @@
+"""Shared checkpoint definitions for projects.
+
+Checkpoint text (label, what/why/how, frameworks) is the same for every
+project, so it is stored once per catalog version in CheckpointDefinition.
+Project checkpoints only keep a foreign key plus their own progress.
+
+When the catalog changes, retrofit_projects() brings existing projects up
+to date in bulk (see the retrofit_checkpoints management command).
+"""
+from typing import Any
+
+from django.db.models import Prefetch, QuerySet
+
+from api.models import Project, Checkpoint, CheckpointDefinition
+from api.services.change_feed import record_changes
+from api.services.checkpoint_generator import (
+    CATALOG_VERSION,
+    CHECKPOINT_CATALOG,
+    generate_checkpoints_for_use_case,
+)
+
+
+def get_current_definitions() -> dict[str, CheckpointDefinition]:
+    """Return definitions for the current catalog version, creating any missing rows."""
+    definitions = {
+        d.checkpoint_id: d
+        for d in CheckpointDefinition.objects.filter(catalog_version=CATALOG_VERSION).only('id', 'checkpoint_id')
+    }
+    missing = [cid for cid in CHECKPOINT_CATALOG if cid not in definitions]
+    if missing:
+        CheckpointDefinition.objects.bulk_create(
+            [
+                CheckpointDefinition(catalog_version=CATALOG_VERSION, checkpoint_id=cid, **CHECKPOINT_CATALOG[cid])
+                for cid in missing
+            ],
+            ignore_conflicts=True,
+        )
+        definitions = {
+            d.checkpoint_id: d
+            for d in CheckpointDefinition.objects.filter(catalog_version=CATALOG_VERSION).only('id', 'checkpoint_id')
+        }
+    return definitions
+
+
+def create_project_checkpoints(project: Project) -> list[Checkpoint]:
+    """Create the checkpoints for a new project's use case in a single insert."""
+    definitions = get_current_definitions()
+    checkpoints = Checkpoint.objects.bulk_create([
+        Checkpoint(
+            project=project,
+            definition=definitions[cp['checkpoint_id']],
+            checkpoint_id=cp['checkpoint_id'],
+            assigned_to=cp['assigned_to'],
+        )
+        for cp in generate_checkpoints_for_use_case(project.ai_use_case)
+    ])
+    record_changes(checkpoints, 'create')
+    return checkpoints
+
+
+def retrofit_projects(
+    projects: list[tuple[int, str]],
+    definitions: dict[str, CheckpointDefinition],
+) -> tuple[int, int]:
+    """Bring a batch of projects in line with the current catalog.
+
+    ``projects`` is a list of (project id, ai_use_case) pairs. Checkpoints
+    the catalog now expects are bulk-created; existing checkpoints still
+    pointing at an older definition (changed text or framework tags) are
+    re-pointed in one bulk update. Checkpoints dropped from the catalog are
+    left alone since they may carry decisions and comments.
+
+    Returns (checkpoints created, checkpoints updated).
+    """
+    existing: dict[int, dict[str, Checkpoint]] = {project_id: {} for project_id, _ in projects}
+    for cp in Checkpoint.objects.filter(project_id__in=existing).only('id', 'project_id', 'checkpoint_id', 'definition_id'):
+        existing[cp.project_id][cp.checkpoint_id] = cp
+
+    expected_by_use_case: dict[str, list[dict[str, Any]]] = {}
+    to_create: list[Checkpoint] = []
+    to_update: list[Checkpoint] = []
+    for project_id, ai_use_case in projects:
+        if ai_use_case not in expected_by_use_case:
+            expected_by_use_case[ai_use_case] = generate_checkpoints_for_use_case(ai_use_case)
+        for cp_def in expected_by_use_case[ai_use_case]:
+            definition = definitions[cp_def['checkpoint_id']]
+            cp = existing[project_id].get(cp_def['checkpoint_id'])
+            if cp is None:
+                to_create.append(Checkpoint(
+                    project_id=project_id,
+                    definition=definition,
+                    checkpoint_id=cp_def['checkpoint_id'],
+                    assigned_to=cp_def['assigned_to'],
+                ))
+            elif cp.definition_id != definition.id:
+                cp.definition = definition
+                to_update.append(cp)
+
+    Checkpoint.objects.bulk_create(to_create)
+    Checkpoint.objects.bulk_update(to_update, ['definition'])
+    # Bulk writes skip signals, so log them for the change feed here
+    record_changes(to_create, 'create')
+    record_changes(to_update, 'update')
+    return len(to_create), len(to_update)
+
+
+def with_checkpoint_definitions(queryset: QuerySet[Project]) -> QuerySet[Project]:
+    """Prefetch checkpoints and their definitions.
+
+    Definitions are fetched once per distinct row rather than joined onto
+    every checkpoint, so the text is read once per request, not per project.
+    """
+    return queryset.prefetch_related(
+        Prefetch('checkpoints', queryset=Checkpoint.objects.order_by('id')),
+        'checkpoints__definition',
+    )
+
+
+def serialize_definition(definition: CheckpointDefinition) -> dict[str, Any]:
+    """Static fields of a checkpoint as they appear in serialized projects."""
+    return {
+        'label': definition.label,
+        'category': definition.category,
+        'what': definition.what,
+        'why': definition.why,
+        'how': definition.how,
+        'frameworks': definition.frameworks or [],
+    }
@@ -0,0 +1,207 @@
+"""Compliance report rows for export.
+
+A single project's export reads checkpoints in one query and streams
+decisions in a second, ordered the same way, so the two can be
+merge-joined without holding the decision history in memory.
+
+The institution-wide export walks projects with iterator(chunk_size=...),
+prefetching checkpoints and decisions one chunk at a time, so memory stays
+flat however many projects match.
+
+Rows carry typed values (bool, datetime, None); api.services.export_formats
+encodes them as CSV, JSON Lines or Parquet as they are produced.
+"""
+import datetime
+from typing import Any, Iterable, Iterator
+
+from django.db.models import Prefetch, QuerySet
+
+from api.models import Project, Checkpoint, Decision
+from api.services.export_formats import Columns, ExportFormat, encode_export
+
+EXPORT_COLUMNS: Columns = [
+    ('checkpoint_id', 'string'),
+    ('label', 'string'),
+    ('category', 'string'),
+    ('assigned_to', 'string'),
+    ('completed', 'bool'),
+    ('completed_at', 'timestamp'),
+    ('decision_description', 'string'),
+    ('decision_notes', 'string'),
+    ('proof_type', 'string'),
+    ('proof_value', 'string'),
+    ('logged_at', 'timestamp'),
+]
+BULK_EXPORT_COLUMNS: Columns = [
+    ('project_id', 'int'),
+    ('project_name', 'string'),
+    ('owner_email', 'string'),
+    ('department', 'string'),
+    ('ai_use_case', 'string'),
+    ('project_created_at', 'timestamp'),
+    *EXPORT_COLUMNS,
+]
+
+DECISION_CHUNK_SIZE = 2000
+PROJECT_CHUNK_SIZE = 500
+
+_DECISION_FIELDS = ('project_id', 'checkpoint_id', 'description', 'notes', 'proof_type', 'proof_value', 'logged_at')
+
+
+def _checkpoint_columns(cp: Checkpoint) -> list[Any]:
+    return [
+        cp.checkpoint_id, cp.definition.label, cp.definition.category, cp.assigned_to,
+        cp.completed, cp.completed_at,
+    ]
+
+
+def _decision_columns(d: Decision) -> list[Any]:
+    return [d.description, d.notes, d.proof_type or None, d.proof_value or None, d.logged_at]
+
+
+def _merge_rows(checkpoints: Iterable[Checkpoint], decisions: Iterable[Decision]) -> Iterator[list[Any]]:
+    """Join checkpoints (by id) with decisions (by checkpoint id, then logged_at).
+
+    One row per decision, or a single blank-decision row for checkpoints
+    without any.
+    """
+    decisions = iter(decisions)
+    pending = next(decisions, None)
+    for cp in checkpoints:
+        columns = _checkpoint_columns(cp)
+        # Skip decisions pointing at a checkpoint outside this project
+        while pending is not None and pending.checkpoint_id < cp.id:
+            pending = next(decisions, None)
+        if pending is None or pending.checkpoint_id != cp.id:
+            yield columns + [None] * 5
+            continue
+        while pending is not None and pending.checkpoint_id == cp.id:
+            yield columns + _decision_columns(pending)
+            pending = next(decisions, None)
+
+
+def project_export_rows(project: Project) -> Iterator[list[Any]]:
+    """Rows for one project's compliance report."""
+    checkpoints = project.checkpoints.select_related('definition').order_by('id')
+    decisions = (
+        project.decisions.order_by('checkpoint_id', 'logged_at', 'id')
+        .only(*_DECISION_FIELDS)
+        .iterator(chunk_size=DECISION_CHUNK_SIZE)
+    )
+    return _merge_rows(checkpoints, decisions)
+
+
+def filter_export_projects(
+    use_case: str | None = None,
+    created_after: datetime.date | None = None,
+    created_before: datetime.date | None = None,
+    department: str | None = None,
+) -> QuerySet[Project]:
+    """Projects matching the bulk export filters; dates are inclusive."""
+    projects = Project.objects.all()
+    if use_case:
+        projects = projects.filter(ai_use_case=use_case)
+    if created_after:
+        projects = projects.filter(created_at__date__gte=created_after)
+    if created_before:
+        projects = projects.filter(created_at__date__lte=created_before)
+    if department:
+        projects = projects.filter(user__profile__department__iexact=department)
+    return projects
+
+
+def iter_export_projects(projects: QuerySet[Project], chunk_size: int = PROJECT_CHUNK_SIZE) -> Iterator[Project]:
+    """Projects in id order with owner, checkpoints and decisions, fetched chunk by chunk."""
+    return (
+        projects.select_related('user__profile')
+        .prefetch_related(
+            Prefetch('checkpoints', queryset=Checkpoint.objects.select_related('definition').order_by('id')),
+            Prefetch(
+                'decisions',
+                queryset=Decision.objects.only(*_DECISION_FIELDS).order_by('checkpoint_id', 'logged_at', 'id'),
+            ),
+        )
+        .order_by('id')
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def _department(project: Project) -> str:
+    profile = getattr(project.user, 'profile', None)
+    return profile.department if profile else ''
+
+
+def bulk_export_rows(projects: Iterable[Project]) -> Iterator[list[Any]]:
+    """Flat rows for many projects, each prefixed with project columns.
+
+    A project without checkpoints gets one row with blank checkpoint and
+    decision columns.
+    """
+    for project in projects:
+        prefix = [
+            project.id, project.name, project.user.email, _department(project),
+            project.ai_use_case, project.created_at,
+        ]
+        checkpoints = project.checkpoints.all()
+        if not checkpoints:
+            # Still list the project, as _merge_rows does for checkpoints without decisions
+            yield prefix + [None] * len(EXPORT_COLUMNS)
+            continue
+        for row in _merge_rows(checkpoints, project.decisions.all()):
+            yield prefix + row
+
+
+def bulk_export_records(projects: Iterable[Project]) -> Iterator[dict[str, Any]]:
+    """One nested record per project: checkpoints with their decisions."""
+    for project in projects:
+        decisions_by_checkpoint: dict[int, list[dict[str, Any]]] = {}
+        for d in project.decisions.all():
+            decisions_by_checkpoint.setdefault(d.checkpoint_id, []).append({
+                'description': d.description,
+                'notes': d.notes,
+                'proofType': d.proof_type or None,
+                'proofValue': d.proof_value or None,
+                'loggedAt': d.logged_at.isoformat(),
+            })
+        yield {
+            'id': project.id,
+            'name': project.name,
+            'ownerEmail': project.user.email,
+            'department': _department(project),
+            'aiUseCase': project.ai_use_case,
+            'status': project.status,
+            'createdAt': project.created_at.isoformat(),
+            'checkpoints': [
+                {
+                    'id': cp.checkpoint_id,
+                    'label': cp.definition.label,
+                    'category': cp.definition.category,
+                    'assignedTo': cp.assigned_to,
+                    'completed': cp.completed,
+                    'completedAt': cp.completed_at.isoformat() if cp.completed_at else None,
+                    'decisions': decisions_by_checkpoint.get(cp.id, []),
+                }
+                for cp in project.checkpoints.all()
+            ],
+        }
+
+
+def stream_project_export(project: Project, export_format: ExportFormat) -> Iterator[bytes]:
+    """One project's compliance report, encoded as it is read."""
+    return encode_export(export_format, EXPORT_COLUMNS, project_export_rows(project))
+
+
+def stream_bulk_export(
+    projects: QuerySet[Project],
+    export_format: ExportFormat,
+    chunk_size: int = PROJECT_CHUNK_SIZE,
+) -> Iterator[bytes]:
+    """The institution-wide export.
+
+    JSON Lines formats get one nested record per project; the tabular
+    formats get one flat row per decision.
+    """
+    chunks = iter_export_projects(projects, chunk_size)
+    if export_format.encoding == 'jsonl':
+        return encode_export(export_format, BULK_EXPORT_COLUMNS, [], bulk_export_records(chunks))
+    return encode_export(export_format, BULK_EXPORT_COLUMNS, bulk_export_rows(chunks))
@@ -0,0 +1,190 @@
+"""Batch (mail-merge) document generation.
+
+Renders one template against a stream of field-value records and streams
+the documents back out, so memory use does not grow with the number of
+records. Records can come from a JSON array, JSON Lines or CSV; output is
+JSON Lines or a zip archive with one markdown file per record.
+"""
+import csv
+import io
+import json
+import re
+import zipfile
+from typing import Any, BinaryIO, Iterable, Iterator
+
+from api.services.ethics_engine import COMPILED_TEMPLATES, render_template
+
+INPUT_FORMATS = ('json', 'jsonl', 'csv')
+OUTPUT_FORMATS = ('jsonl', 'zip')
+
+CHUNK_SIZE = 64 * 1024
+# Longest single record in a JSON array input
+MAX_RECORD_CHARS = 1024 * 1024
+
+_WHITESPACE = re.compile(r'[ \t\n\r]*')
+_UNSAFE_FILENAME_CHARS = re.compile(r'[^A-Za-z0-9._-]+')
+
+
+def detect_input_format(filename: str) -> str | None:
+    """Guess the record format from a file extension."""
+    suffix = filename.rsplit('.', 1)[-1].lower() if '.' in filename else ''
+    if suffix == 'ndjson':
+        return 'jsonl'
+    return suffix if suffix in INPUT_FORMATS else None
+
+
+def _iter_json_array(stream: io.TextIOBase) -> Iterator[Any]:
+    """Yield the items of a top-level JSON array without loading the whole file.
+
+    Only the item being read is buffered. Anything but a comma or the
+    closing bracket after an item, or an item longer than MAX_RECORD_CHARS,
+    fails straight away rather than reading on to the end of the input.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, eof = '', 0, False
+    # 'open': before '['; 'first': after '['; 'item': after ','; 'separator': after an item
+    state = 'open'
+    while True:
+        pos = _WHITESPACE.match(buffer, pos).end()
+        if pos < len(buffer):
+            char = buffer[pos]
+            if state == 'open':
+                if char != '[':
+                    raise ValueError('JSON input must be an array of records')
+                state, pos = 'first', pos + 1
+                continue
+            if state == 'separator' or (state == 'first' and char == ']'):
+                if char == ']':
+                    return
+                if char != ',':
+                    raise ValueError(f"Expected ',' or ']' after a record, got {char!r}")
+                state, pos = 'item', pos + 1
+                continue
+            try:
+                item, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                if eof:
+                    raise ValueError('Malformed JSON array')
+                if len(buffer) - pos > MAX_RECORD_CHARS:
+                    raise ValueError(f'Record is malformed or longer than {MAX_RECORD_CHARS} characters')
+            else:
+                # A number at the end of the buffer may go on in the next chunk
+                if end < len(buffer) or eof:
+                    yield item
+                    state, pos = 'separator', end
+                    continue
+        elif eof:
+            raise ValueError('Unexpected end of JSON array')
+
+        chunk = stream.read(CHUNK_SIZE)
+        eof = not chunk
+        buffer, pos = buffer[pos:] + chunk, 0
+
+
+def iter_records(stream: BinaryIO, input_format: str) -> Iterator[Any]:
+    """Read field-value records one at a time from a binary stream."""
+    text = io.TextIOWrapper(stream, encoding='utf-8', newline='')
+    if input_format == 'csv':
+        yield from csv.DictReader(text)
+    elif input_format == 'jsonl':
+        for line in text:
+            if line.strip():
+                yield json.loads(line)
+    elif input_format == 'json':
+        yield from _iter_json_array(text)
+    else:
+        raise ValueError(f"input format must be one of: {', '.join(INPUT_FORMATS)}")
+
+
+def render_records(template_key: str, records: Iterable[Any], escape: str | None = None) -> Iterator[dict[str, Any]]:
+    """Render each record with the shared compiled template.
+
+    Invalid records produce an ``error`` entry instead of raising, since the
+    response is already streaming by the time they are read. Unreadable
+    input ends the batch with a final error entry.
+    """
+    compiled = COMPILED_TEMPLATES[template_key]
+    records = iter(records)
+    index = 0
+    while True:
+        index += 1
+        try:
+            record = next(records)
+        except StopIteration:
+            return
+        except (ValueError, csv.Error) as exc:
+            yield {'index': index, 'error': f'could not read record: {exc}'}
+            return
+
+        if not isinstance(record, dict):
+            yield {'index': index, 'error': 'record must be an object of field values'}
+            continue
+        content, missing, unknown = render_template(compiled, record, escape)
+        yield {
+            'index': index,
+            'content': content,
+            'missing_fields': missing,
+            'unknown_fields': unknown,
+            'record': record,
+        }
+
+
+def stream_jsonl(documents: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    """One JSON object per line; the source record is not echoed back."""
+    for doc in documents:
+        doc = {key: value for key, value in doc.items() if key != 'record'}
+        yield json.dumps(doc, ensure_ascii=False).encode() + b'\n'
+
+
+class _StreamBuffer:
+    """Write-only sink that hands back what was written since the last drain.
+
+    Having no seek()/tell() makes zipfile write data descriptors, which lets
+    the archive be produced front to back.
+    """
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+
+    def write(self, data: bytes) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self) -> None:
+        pass
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def _entry_name(doc: dict[str, Any], name_field: str | None, used: set[str]) -> str:
+    stem = f"document-{doc['index']:05d}"
+    if name_field and doc['record'].get(name_field):
+        stem = _UNSAFE_FILENAME_CHARS.sub('_', str(doc['record'][name_field])).strip('._')[:100] or stem
+    name = f'{stem}.md'
+    if name in used:
+        name = f"{stem}-{doc['index']}.md"
+    used.add(name)
+    return name
+
+
+def stream_zip(documents: Iterable[dict[str, Any]], name_field: str | None = None) -> Iterator[bytes]:
+    """A zip with one markdown file per document, yielded as it is built.
+
+    Records that failed are listed in errors.jsonl at the end of the archive.
+    """
+    buffer = _StreamBuffer()
+    errors: list[dict[str, Any]] = []
+    used_names: set[str] = set()
+    with zipfile.ZipFile(buffer, mode='w', compression=zipfile.ZIP_DEFLATED) as archive:
+        for doc in documents:
+            if 'error' in doc:
+                errors.append(doc)
+                continue
+            archive.writestr(_entry_name(doc, name_field, used_names), doc['content'])
+            yield buffer.drain()
+        if errors:
+            archive.writestr('errors.jsonl', ''.join(json.dumps(e) + '\n' for e in errors))
+    yield buffer.drain()
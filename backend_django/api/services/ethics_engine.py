@@ -1,5 +1,14 @@
 # Decision engine for AI research ethics guidance
 
+import hashlib
+import html
+import json
+import re
+from dataclasses import dataclass
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping
+
 RESEARCH_SCENARIOS = {
     "qualitative_analysis": {
         "name": "Qualitative Data Analysis",
@@ -679,6 +688,104 @@ All content was reviewed and verified by the investigators, who take full respon
 }
 
 
+# ============== Compiled Decision Tree ==============
+# DECISION_TREE is compiled once at import: each node's options become a
+# value -> next dict, and the tree is checked for dangling links, unreachable
+# nodes and cycles so a bad edit fails at startup instead of inside a request.
+# Terminal results are frozen: they are shared by every request and thread,
+# so each evaluation builds its own response on top of them.
+
+MAX_DECISION_DEPTH = 32
+
+
+class DecisionTreeError(ValueError):
+    """DECISION_TREE is malformed (dangling link, cycle or unreachable node)."""
+
+
+@dataclass(frozen=True)
+class CompiledDecisionTree:
+    index: dict[str, dict[Any, str]]
+    terminal_results: dict[str, Mapping[str, Any]]
+    paths: list[dict[str, Any]]
+    max_depth: int
+
+
+def freeze(value):
+    """Recursively convert dicts and lists to read-only mappings and tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def compile_decision_tree(tree, terminals, templates, root="start"):
+    """Index and validate a decision tree for O(depth) evaluation."""
+    index: dict[str, dict[Any, str]] = {}
+    for key, node in tree.items():
+        edges: dict[Any, str] = {}
+        for option in node["options"]:
+            next_key = option.get("next")
+            if next_key not in tree and next_key not in terminals:
+                raise DecisionTreeError(f"{key}: option {option['value']!r} leads to unknown node {next_key!r}")
+            if option["value"] in edges:
+                raise DecisionTreeError(f"{key}: duplicate option value {option['value']!r}")
+            edges[option["value"]] = next_key
+        index[key] = edges
+
+    # Depth-first walk from the root: records every root-to-terminal path and
+    # fails on any edge back into the current path.
+    paths: list[dict[str, Any]] = []
+    visited: set[str] = set()
+
+    def walk(key, steps, on_path):
+        if key in terminals:
+            paths.append({"steps": list(steps), "terminal_key": key})
+            return
+        if key in on_path:
+            raise DecisionTreeError(f"cycle through {key!r}: {' -> '.join(s['node'] for s in steps)}")
+        if len(steps) >= MAX_DECISION_DEPTH:
+            raise DecisionTreeError(f"path deeper than {MAX_DECISION_DEPTH} nodes at {key!r}")
+        visited.add(key)
+        on_path.add(key)
+        for value, next_key in index[key].items():
+            steps.append({"node": key, "answer": value})
+            walk(next_key, steps, on_path)
+            steps.pop()
+        on_path.discard(key)
+
+    walk(root, [], set())
+
+    unreachable = set(tree) - visited
+    if unreachable:
+        raise DecisionTreeError(f"unreachable nodes: {', '.join(sorted(unreachable))}")
+
+    terminal_results = {
+        key: freeze({
+            **terminal,
+            "available_templates": [
+                {"key": t, "name": templates[t]["name"], "description": templates[t]["description"]}
+                for t in terminal.get("templates", [])
+                if t in templates
+            ],
+        })
+        for key, terminal in terminals.items()
+    }
+
+    return CompiledDecisionTree(
+        index=index,
+        terminal_results=terminal_results,
+        paths=paths,
+        max_depth=max(len(p["steps"]) for p in paths),
+    )
+
+
+COMPILED_TREE = compile_decision_tree(DECISION_TREE, TERMINAL_NODES, DOCUMENT_TEMPLATES)
+
+# Result base when the answers stop before reaching a terminal node
+_NO_RESULT = freeze({"available_templates": []})
+
+
 def get_scenarios():
     return RESEARCH_SCENARIOS
 
@@ -688,7 +795,7 @@ def get_decision_node(node_key):
 
 
 def get_terminal_result(terminal_key):
-    return TERMINAL_NODES.get(terminal_key)
+    return COMPILED_TREE.terminal_results.get(terminal_key)
 
 
 def get_template(template_key):
@@ -699,60 +806,200 @@ def get_all_templates():
     return DOCUMENT_TEMPLATES
 
 
-def process_decision_path(answers):
-    """Process a complete set of answers and return the result."""
+def build_decision_bundle():
+    """The whole tree, terminal results and template metadata in one payload.
+
+    Lets the client walk the tree locally instead of fetching each node.
+    ``version`` is a hash of the content so clients can tell whether their
+    copy is current.
+    """
+    bundle = {
+        "root": "start",
+        "nodes": {key: {"key": key, **node} for key, node in DECISION_TREE.items()},
+        "terminals": dict(COMPILED_TREE.terminal_results),
+        "templates": {
+            key: {"name": t["name"], "description": t["description"]}
+            for key, t in DOCUMENT_TEMPLATES.items()
+        },
+    }
+    version = hashlib.sha256(render_json(bundle)).hexdigest()[:16]
+    return {"version": version, **bundle}
+
+
+def get_decision_paths():
+    """Every root-to-terminal path through the tree, for analytics."""
+    return COMPILED_TREE.paths
+
+
+def walk_decision_tree(answers):
+    """Follow answers from the root; return (path, terminal key or None)."""
     current_node = "start"
     path = []
 
-    while current_node and not current_node.startswith("terminal_"):
-        node = DECISION_TREE.get(current_node)
-        if not node:
+    # The compiled tree is acyclic, so max_depth steps always reach the end
+    for _ in range(COMPILED_TREE.max_depth):
+        edges = COMPILED_TREE.index.get(current_node)
+        if edges is None:
             break
 
         answer = answers.get(current_node)
         path.append({"node": current_node, "answer": answer})
 
-        # Find next node based on answer
-        next_node = None
-        for option in node["options"]:
-            if option["value"] == answer:
-                next_node = option.get("next")
-                break
-
-        current_node = next_node
-
-    # Get terminal result
-    result = TERMINAL_NODES.get(current_node, {})
-    result["path"] = path
-    result["terminal_key"] = current_node
-
-    # Get applicable templates
-    templates = []
-    for template_key in result.get("templates", []):
-        template = DOCUMENT_TEMPLATES.get(template_key)
-        if template:
-            templates.append({
-                "key": template_key,
-                "name": template["name"],
-                "description": template["description"]
-            })
-    result["available_templates"] = templates
-
-    return result
-
-
-def generate_document(template_key, field_values):
-    """Generate a document from a template with filled values."""
+        try:
+            current_node = edges.get(answer)
+        except TypeError:  # unhashable answer (list/dict) matches no option
+            current_node = None
+        if current_node is None:
+            break
+
+    return path, current_node
+
+
+def process_decision_path(answers):
+    """Process a complete set of answers and return the result."""
+    path, current_node = walk_decision_tree(answers)
+
+    # Never write into the shared terminal result; build a fresh response
+    base = COMPILED_TREE.terminal_results.get(current_node, _NO_RESULT)
+    return {**base, "path": path, "terminal_key": current_node}
+
+
+# ============== Evaluation Cache ==============
+# The tree is small and deterministic, so responses are cached as rendered
+# JSON bytes keyed on the answers to the nodes actually visited. Every
+# well-formed path is rendered at import and paths that stop at a missing
+# answer go through a bounded LRU. A path with an answer that is not one of
+# the node's options is arbitrary client input of any size, so it is
+# rendered without caching.
+
+EVALUATION_CACHE_SIZE = 1024
+
+
+def _json_default(value):
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+
+def render_json(data):
+    """Render JSON the same way DRF's JSONRenderer does (compact, UTF-8)."""
+    return json.dumps(data, ensure_ascii=False, separators=(",", ":"), default=_json_default).encode()
+
+
+def _path_key(path):
+    # json.dumps keeps 1 and true apart, and makes list/dict answers hashable
+    return tuple((step["node"], json.dumps(step["answer"], sort_keys=True)) for step in path)
+
+
+# Options are strings and booleans; 1 and 1.0 also match True, a bounded
+# handful of extra keys
+SCALAR_ANSWER_TYPES = (str, bool, int, float)
+
+
+def _is_known_path(path):
+    """True if every answer on the path is one of its node's options, or missing.
+
+    Only scalars are looked up: lists and dicts are unhashable and can
+    never be an option.
+    """
+    return all(
+        step["answer"] is None
+        or (
+            isinstance(step["answer"], SCALAR_ANSWER_TYPES)
+            and step["answer"] in COMPILED_TREE.index[step["node"]]
+        )
+        for step in path
+    )
+
+
+@lru_cache(maxsize=EVALUATION_CACHE_SIZE)
+def _render_path(path_key):
+    answers = {node: json.loads(answer) for node, answer in path_key}
+    return render_json(process_decision_path(answers))
+
+
+_RENDERED_PATHS = {
+    _path_key(p["steps"]): render_json(process_decision_path({s["node"]: s["answer"] for s in p["steps"]}))
+    for p in COMPILED_TREE.paths
+}
+
+
+def evaluate_decision_path_json(answers):
+    """Same result as process_decision_path, as ready-to-send JSON bytes."""
+    path, _ = walk_decision_tree(answers)
+    if not _is_known_path(path):
+        return render_json(process_decision_path(answers))
+    key = _path_key(path)
+    rendered = _RENDERED_PATHS.get(key)
+    if rendered is None:
+        rendered = _render_path(key)
+    return rendered
+
+
+# ============== Compiled Templates ==============
+# Each template is split once at import into alternating literal and
+# placeholder segments, so rendering is a single join whatever the number
+# of fields or the size of the values.
+
+PLACEHOLDER_PATTERN = re.compile(r"\{\{(\w+)\}\}")
+MARKDOWN_SPECIAL = re.compile(r"([\\`*_{}\[\]<>()#+!|-])")
+
+ESCAPERS = {
+    "html": html.escape,
+    "markdown": lambda value: MARKDOWN_SPECIAL.sub(r"\\\1", value),
+}
+
+
+@dataclass(frozen=True)
+class CompiledTemplate:
+    # Even indices are literal text, odd indices are field names
+    segments: tuple[str, ...]
+    fields: frozenset[str]
+
+
+def compile_template(content):
+    segments = tuple(PLACEHOLDER_PATTERN.split(content))
+    return CompiledTemplate(segments=segments, fields=frozenset(segments[1::2]))
+
+
+def render_template(compiled, field_values, escape=None):
+    """Fill a compiled template; return (content, missing fields, unknown fields).
+
+    Fields without a value keep their {{placeholder}} so the user can see
+    what is left to fill in.
+    """
+    escaper = ESCAPERS[escape] if escape else str
+    parts = []
+    missing = set()
+    for i, segment in enumerate(compiled.segments):
+        if i % 2 == 0:
+            parts.append(segment)
+        elif segment in field_values:
+            parts.append(escaper(str(field_values[segment])))
+        else:
+            parts.append("{{" + segment + "}}")
+            missing.add(segment)
+    unknown = set(field_values) - compiled.fields
+    return "".join(parts), sorted(missing), sorted(unknown)
+
+
+COMPILED_TEMPLATES = {key: compile_template(t["content"]) for key, t in DOCUMENT_TEMPLATES.items()}
+
+
+def generate_document(template_key, field_values, escape=None):
+    """Generate a document from a template with filled values.
+
+    ``escape`` may be "html" or "markdown" to escape the supplied values.
+    """
     template = DOCUMENT_TEMPLATES.get(template_key)
     if not template:
         return None
 
-    content = template["content"]
-    for field, value in field_values.items():
-        placeholder = "{{" + field + "}}"
-        content = content.replace(placeholder, str(value))
+    content, missing, unknown = render_template(COMPILED_TEMPLATES[template_key], field_values, escape)
 
     return {
         "name": template["name"],
-        "content": content
+        "content": content,
+        "missing_fields": missing,
+        "unknown_fields": unknown,
     }
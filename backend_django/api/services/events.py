@@ -0,0 +1,115 @@
+"""Per-project push events for the server-sent events channel.
+
+Views call publish_project_event() after a checkpoint toggle, decision or
+comment; once the transaction commits, the broker fans the event out to
+every open /api/projects/<id>/events stream for that project.
+
+The default InProcessBroker only reaches clients connected to the same
+process. Set EVENT_BROKER in settings to the dotted path of a class with
+the same subscribe/unsubscribe/publish methods to fan out across workers.
+
+Each subscriber has a bounded queue. A client that falls behind by more
+than SUBSCRIBER_QUEUE_SIZE events is sent a ``resync`` event and
+disconnected, so one slow connection cannot hold memory for the others;
+the client reconnects and refetches the project.
+"""
+import asyncio
+import itertools
+import json
+import threading
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.module_loading import import_string
+
+SUBSCRIBER_QUEUE_SIZE = 100
+KEEPALIVE_SECONDS = 15
+
+RESYNC_FRAME = b'event: resync\ndata: {}\n\n'
+
+
+def encode_event(event_id: int, event_type: str, data: dict[str, Any]) -> bytes:
+    """One SSE frame; encoded once and shared by every subscriber."""
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return f'id: {event_id}\nevent: {event_type}\ndata: {payload}\n\n'.encode()
+
+
+class Subscription:
+    """One client's stream: a bounded queue owned by the client's event loop."""
+
+    def __init__(self, project_id: int, loop: asyncio.AbstractEventLoop) -> None:
+        self.project_id = project_id
+        self.loop = loop
+        self.queue: asyncio.Queue[bytes] = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self.overflowed = False
+
+    def offer(self, frame: bytes) -> None:
+        """Queue a frame; runs on the subscriber's loop."""
+        if self.overflowed:
+            return
+        try:
+            self.queue.put_nowait(frame)
+        except asyncio.QueueFull:
+            # Too far behind: drop the backlog and tell the client to resync
+            self.overflowed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(RESYNC_FRAME)
+
+
+class InProcessBroker:
+    """Fan-out to subscribers in this process.
+
+    publish() may be called from any thread (sync views run outside the
+    event loop); frames are handed to each subscriber's loop thread-safely.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[int, set[Subscription]] = {}
+        self._ids = itertools.count(1)
+
+    def subscribe(self, project_id: int) -> Subscription:
+        subscription = Subscription(project_id, asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    def subscriber_count(self, project_id: int) -> int:
+        with self._lock:
+            return len(self._subscribers.get(project_id, ()))
+
+    def publish(self, project_id: int, event_type: str, data: dict[str, Any]) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+            event_id = next(self._ids)
+        if not subscribers:
+            return
+        frame = encode_event(event_id, event_type, data)
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.offer, frame)
+            except RuntimeError:
+                # The client's loop has shut down
+                self.unsubscribe(subscription)
+
+
+@lru_cache(maxsize=None)
+def get_broker() -> InProcessBroker:
+    broker_path = getattr(settings, 'EVENT_BROKER', 'api.services.events.InProcessBroker')
+    return import_string(broker_path)()
+
+
+def publish_project_event(project_id: int, event_type: str, data: dict[str, Any]) -> None:
+    """Push an event to the project's listeners once the current transaction commits."""
+    transaction.on_commit(lambda: get_broker().publish(project_id, event_type, data))
@@ -0,0 +1,203 @@
+"""Streaming encoders for compliance exports.
+
+Each format turns typed rows (str, int, bool, datetime or None, described
+by a column list) into an iterator of bytes, so responses and files can be
+written as rows are produced:
+
+- csv, csv.gz, csv.zst
+- jsonl, jsonl.gz, jsonl.zst
+- parquet (one row group per PARQUET_ROW_GROUP_SIZE rows)
+
+zstd uses the ``zstandard`` package and Parquet uses ``pyarrow`` (both in
+requirements.txt). pyarrow is slow to import, so it is loaded on the first
+Parquet export rather than at startup.
+"""
+import csv
+import datetime
+import json
+import zlib
+from dataclasses import dataclass
+from typing import Any, Iterable, Iterator
+
+import zstandard
+
+# (column name, type) where type is one of COLUMN_TYPES
+Columns = list[tuple[str, str]]
+COLUMN_TYPES = ('string', 'int', 'bool', 'timestamp')
+
+PARQUET_ROW_GROUP_SIZE = 10_000
+
+
+@dataclass(frozen=True)
+class ExportFormat:
+    name: str
+    encoding: str  # csv, jsonl or parquet
+    compression: str | None
+    content_type: str
+
+
+EXPORT_FORMATS: dict[str, ExportFormat] = {
+    f.name: f for f in [
+        ExportFormat('csv', 'csv', None, 'text/csv'),
+        ExportFormat('csv.gz', 'csv', 'gzip', 'application/gzip'),
+        ExportFormat('csv.zst', 'csv', 'zstd', 'application/zstd'),
+        ExportFormat('jsonl', 'jsonl', None, 'application/x-ndjson'),
+        ExportFormat('jsonl.gz', 'jsonl', 'gzip', 'application/gzip'),
+        ExportFormat('jsonl.zst', 'jsonl', 'zstd', 'application/zstd'),
+        ExportFormat('parquet', 'parquet', None, 'application/vnd.apache.parquet'),
+    ]
+}
+
+
+def format_for_filename(filename: str, default: str = 'csv') -> str:
+    """Pick the export format whose extension the filename ends with."""
+    for name in sorted(EXPORT_FORMATS, key=len, reverse=True):
+        if filename.endswith(f'.{name}'):
+            return name
+    return default
+
+
+def _csv_value(value: Any) -> Any:
+    if value is None:
+        return ''
+    if isinstance(value, datetime.datetime):
+        return value.isoformat()
+    return value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, (datetime.datetime, datetime.date)):
+        return value.isoformat()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+class _Echo:
+    """File-like object whose write() hands the formatted line straight back."""
+
+    def write(self, value: str) -> str:
+        return value
+
+
+def encode_csv(columns: Columns, rows: Iterable[list[Any]]) -> Iterator[bytes]:
+    writer = csv.writer(_Echo())
+    yield writer.writerow([name for name, _ in columns]).encode()
+    for row in rows:
+        yield writer.writerow([_csv_value(v) for v in row]).encode()
+
+
+def encode_jsonl(records: Iterable[dict[str, Any]]) -> Iterator[bytes]:
+    for record in records:
+        yield json.dumps(record, ensure_ascii=False, default=_json_default).encode() + b'\n'
+
+
+class _ParquetSink:
+    """Append-only file object; pyarrow needs tell() to lay out the footer."""
+
+    closed = False
+
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def write(self, data: bytes) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def flush(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def parquet_schema(columns: Columns):
+    import pyarrow as pa
+
+    types = {
+        'string': pa.string(),
+        'int': pa.int64(),
+        'bool': pa.bool_(),
+        'timestamp': pa.timestamp('us', tz='UTC'),
+    }
+    return pa.schema([(name, types[kind]) for name, kind in columns])
+
+
+def encode_parquet(columns: Columns, rows: Iterable[list[Any]]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    schema = parquet_schema(columns)
+    sink = _ParquetSink()
+    writer = pq.ParquetWriter(sink, schema, compression='zstd')
+    group: list[list[Any]] = []
+
+    def write_group() -> None:
+        arrays = [pa.array(values, type=field.type) for values, field in zip(zip(*group), schema)]
+        writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+        group.clear()
+
+    for row in rows:
+        group.append(row)
+        if len(group) >= PARQUET_ROW_GROUP_SIZE:
+            write_group()
+            yield sink.drain()
+    if group:
+        write_group()
+    writer.close()
+    yield sink.drain()
+
+
+def _gzip(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(wbits=31)  # 16 + 15: gzip container
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _zstd(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zstandard.ZstdCompressor().compressobj()
+    for chunk in chunks:
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def encode_export(
+    export_format: ExportFormat,
+    columns: Columns,
+    rows: Iterable[list[Any]],
+    records: Iterable[dict[str, Any]] | None = None,
+) -> Iterator[bytes]:
+    """Encode rows in ``export_format``.
+
+    JSON Lines formats write ``records`` when given (e.g. nested documents),
+    otherwise one object per row keyed by column name.
+    """
+    if export_format.encoding == 'parquet':
+        return encode_parquet(columns, rows)
+    if export_format.encoding == 'jsonl':
+        if records is None:
+            names = [name for name, _ in columns]
+            records = (dict(zip(names, row)) for row in rows)
+        chunks = encode_jsonl(records)
+    else:
+        chunks = encode_csv(columns, rows)
+
+    if export_format.compression == 'gzip':
+        return _gzip(chunks)
+    if export_format.compression == 'zstd':
+        return _zstd(chunks)
+    return chunks
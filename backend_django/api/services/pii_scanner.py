@@ -4,9 +4,11 @@ PII Scanner — Detects personally identifiable information in uploaded data fil
 Supports CSV files and plain text. Uses regex pattern matching on both
 column headers and cell values to identify potential PII.
 """
+import codecs
 import csv
 import io
 import re
+from typing import Iterable, Iterator
 
 
 # Column header patterns that suggest PII
@@ -46,15 +48,48 @@ CLASSIFICATION_KEYWORDS = {
 }
 
 
+# Only the header and this many rows are sampled
+SCAN_ROW_LIMIT = 100
+
+
 def scan_csv_for_pii(file_content):
     """Scan CSV content for PII patterns.
 
     Returns a dict with findings grouped by type.
     """
+    return _scan_rows(csv.reader(io.StringIO(file_content)))
+
+
+def iter_lines(chunks: Iterable[bytes], encoding: str = 'utf-8') -> Iterator[str]:
+    """Decode byte chunks lazily into newline-terminated lines."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pending = ''
+    for chunk in chunks:
+        pending += decoder.decode(chunk)
+        *lines, pending = pending.split('\n')
+        for line in lines:
+            yield line + '\n'
+    pending += decoder.decode(b'', final=True)
+    if pending:
+        yield pending
+
+
+def scan_csv_stream(chunks: Iterable[bytes]):
+    """Scan CSV bytes for PII, reading only as far as the sampled rows.
+
+    Takes an iterable of byte chunks (e.g. UploadedFile.chunks()), so a
+    large upload is never decoded in full. Raises UnicodeDecodeError if
+    the sampled part is not valid UTF-8.
+    """
+    return _scan_rows(csv.reader(iter_lines(chunks)))
+
+
+def _scan_rows(reader):
     findings = []
     try:
-        reader = csv.reader(io.StringIO(file_content))
         headers = next(reader, [])
+    except UnicodeDecodeError:
+        raise
     except Exception:
         return {'error': 'Could not parse file as CSV', 'findings': [], 'summary': {}}
 
@@ -74,12 +109,12 @@ def scan_csv_for_pii(file_content):
                     'severity': 'high' if pii_type in ('ssn', 'name', 'email', 'dob') else 'medium',
                 })
 
-    # Sample cell values (first 100 rows)
+    # Sample cell values (first SCAN_ROW_LIMIT rows)
     value_flags = {}
     row_count = 0
     for row in reader:
         row_count += 1
-        if row_count > 100:
+        if row_count > SCAN_ROW_LIMIT:
             break
         for i, cell in enumerate(row):
             if i in flagged_columns:
@@ -111,7 +146,7 @@ def scan_csv_for_pii(file_content):
         'hasPII': has_pii,
         'findings': findings,
         'totalColumns': len(headers),
-        'rowsScanned': min(row_count, 100),
+        'rowsScanned': min(row_count, SCAN_ROW_LIMIT),
         'flaggedColumns': len(set(f['column_index'] for f in findings)),
         'piiTypesFound': pii_types_found,
         'verdict': 'PII detected — data de-identification is required before processing'
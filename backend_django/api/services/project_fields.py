@@ -0,0 +1,109 @@
+"""Template field values resolved from an existing project.
+
+Documents generated for a project (IRB amendments, code documentation,
+reproducibility logs, ...) mostly repeat what the project already records:
+its name, people, AI tools and decision history. resolve_project_fields()
+builds that map once and caches it per project in the shared cache;
+api.signals clears the entry whenever the project, its tools or its
+decisions change.
+"""
+from typing import Any
+
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import Prefetch
+
+from api.models import Project, Decision
+from api.services.ethics_engine import COMPILED_TEMPLATES
+
+PROJECT_FIELDS_CACHE_TIMEOUT = 60 * 60
+
+
+def project_fields_cache_key(project_id: int) -> str:
+    return f'project_fields_{project_id}'
+
+
+def invalidate_project_fields(*project_ids: int) -> None:
+    """Drop cached field maps; called from signal handlers."""
+    cache.delete_many([project_fields_cache_key(pid) for pid in project_ids])
+
+
+def _display_name(user: User) -> str:
+    return user.first_name or user.email or user.username
+
+
+def build_project_fields(project: Project) -> dict[str, str]:
+    """Field values for every template, from a project fetched with its tools and decisions.
+
+    Values the project has nothing for are left out so the template keeps
+    its placeholder and reports the field as missing.
+    """
+    decisions = list(project.decisions.all())
+    tool_names = {t.name for t in project.ai_tools.all()}
+    tool_names.update(d.tool_used.name for d in decisions if d.tool_used)
+
+    start = project.created_at.date()
+    last = decisions[-1].logged_at.date() if decisions else start
+    history = '\n'.join(
+        f"- {d.logged_at.date().isoformat()}: {d.description}"
+        + (f" ({d.tool_used.name})" if d.tool_used else '')
+        for d in decisions
+    )
+
+    fields = {
+        'project_name': project.name,
+        'protocol_title': project.name,
+        'proposal_title': project.name,
+        'purpose': project.description,
+        'researcher_name': _display_name(project.user),
+        'pi_name': _display_name(project.faculty_advisor or project.user),
+        'ai_tool': ', '.join(sorted(tool_names)),
+        'ai_tools_used': ', '.join(sorted(tool_names)),
+        'date': last.isoformat(),
+        'date_range': f"{start.isoformat()} to {last.isoformat()}",
+        'specific_uses': history,
+        'ai_uses': history,
+        'ai_sections': history,
+    }
+    return {key: value for key, value in fields.items() if value}
+
+
+def resolve_project_fields(project_id: int) -> dict[str, str] | None:
+    """Cached field map for a project, or None if it does not exist."""
+    key = project_fields_cache_key(project_id)
+    fields = cache.get(key)
+    if fields is not None:
+        return fields
+
+    project = (
+        Project.objects.select_related('user', 'faculty_advisor')
+        .prefetch_related(
+            'ai_tools',
+            Prefetch('decisions', queryset=Decision.objects.select_related('tool_used').order_by('logged_at', 'id')),
+        )
+        .filter(id=project_id)
+        .first()
+    )
+    if project is None:
+        return None
+
+    fields = build_project_fields(project)
+    cache.set(key, fields, timeout=PROJECT_FIELDS_CACHE_TIMEOUT)
+    return fields
+
+
+def prefill_fields(template_key: str, project_id: int, field_values: dict[str, Any]) -> dict[str, Any] | None:
+    """Project values for the template's fields, overridden by what the client sent.
+
+    Only fields the template uses are taken from the project, so they do not
+    show up as unknown fields in the result.
+    """
+    resolved = resolve_project_fields(project_id)
+    if resolved is None:
+        return None
+    compiled = COMPILED_TEMPLATES.get(template_key)
+    wanted = compiled.fields if compiled else frozenset()
+    return {
+        **{name: value for name, value in resolved.items() if name in wanted},
+        **field_values,
+    }
@@ -0,0 +1,89 @@
+"""Project-level tool risk: the stored flag and owner/advisor notifications.
+
+Project.tool_risk_flag is set while any of a project's tools is not
+recommended. When a tool's status moves to or from not_recommended,
+ai_tool_update (or tool_seeding.apply_seed_plan, for seed_tools and
+catalog syncs) enqueues propagate_tool_status() as a background task
+(api.services.background), so a tool used by thousands of projects does
+not hold up the request. The task flags or clears every affected project
+with one UPDATE through the ai_tools table, then notifies owners and
+faculty advisors in keyset-paginated batches, so memory stays bounded.
+
+Signal handlers in api.signals call refresh_project_risk_flags() when a
+project's own tools change and when a tool is deleted.
+"""
+from typing import Iterable
+
+from django.db import transaction
+from django.db.models import Case, Exists, OuterRef, Value, When
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from api.models import AITool, Notification, Project
+
+NOTIFY_BATCH_SIZE = 1000
+
+
+def refresh_project_risk_flags(project_ids: Iterable[int]) -> None:
+    """Recompute the flag for specific projects after their tools changed, in one UPDATE."""
+    risky = Exists(Project.ai_tools.through.objects.filter(
+        project_id=OuterRef('pk'), aitool__status='not_recommended',
+    ))
+    Project.objects.filter(id__in=list(project_ids)).update(
+        tool_risk_flag=risky,
+        tool_risk_flagged_at=Case(
+            When(risky, then=Coalesce('tool_risk_flagged_at', Value(timezone.now()))),
+            default=None,
+        ),
+    )
+
+
+def notify_project_members(tool: AITool, batch_size: int = NOTIFY_BATCH_SIZE) -> int:
+    """Tell the owner and faculty advisor of every project using ``tool``; returns the count."""
+    message_template = '{tool} is no longer recommended for institutional use. Review its use in "{project}".'
+    sent = 0
+    last_id = 0
+    while True:
+        batch = list(
+            Project.objects.filter(ai_tools=tool, id__gt=last_id)
+            .order_by('id')
+            .values_list('id', 'name', 'user_id', 'faculty_advisor_id')[:batch_size]
+        )
+        if not batch:
+            return sent
+        notifications = [
+            Notification(
+                user_id=user_id,
+                project_id=project_id,
+                tool=tool,
+                kind='tool_not_recommended',
+                message=message_template.format(tool=tool.name, project=name),
+            )
+            for project_id, name, owner_id, advisor_id in batch
+            for user_id in dict.fromkeys(filter(None, (owner_id, advisor_id)))
+        ]
+        with transaction.atomic():
+            Notification.objects.bulk_create(notifications, batch_size=batch_size)
+        sent += len(notifications)
+        last_id = batch[-1][0]
+
+
+def propagate_tool_status(tool_id: int) -> None:
+    """Bring the projects using a tool in line with its current status.
+
+    Reads the status when it runs, so a task that lands after a later
+    status change still leaves the flags right.
+    """
+    tool = AITool.objects.filter(id=tool_id).only('id', 'name', 'status').first()
+    if tool is None:
+        return
+    if tool.status == 'not_recommended':
+        Project.objects.filter(ai_tools=tool, tool_risk_flag=False).update(
+            tool_risk_flag=True, tool_risk_flagged_at=timezone.now(),
+        )
+        notify_project_members(tool)
+    else:
+        # Projects with another not-recommended tool stay flagged
+        Project.objects.filter(ai_tools=tool, tool_risk_flag=True).exclude(
+            ai_tools__status='not_recommended',
+        ).update(tool_risk_flag=False, tool_risk_flagged_at=None)
@@ -0,0 +1,191 @@
+"""In-memory catalog of the AI tool registry.
+
+The registry is read on every tool list, tool detail and dashboard, but
+only changes when faculty edit a tool or seed_tools runs. Each process
+therefore keeps the serialized tools in memory, with secondary indexes by
+tool type, category, status and recommended use case, and serves filtered
+listings from there.
+
+Freshness is tracked by a version number in the shared cache (the
+database cache by default, see CACHES in settings), so every worker
+process sees every bump. Signal handlers in api.signals call
+invalidate_tool_catalog() on any AITool save or delete. Each request
+reads the version once and rebuilds the catalog if it has moved. Code
+that writes tools with bulk_create or bulk_update must call
+invalidate_tool_catalog() itself.
+
+Usage counts change with every project, so they are not part of the
+catalog: project_counts() reads them per request in one grouped query.
+"""
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Iterable
+
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count
+
+from api.models import AITool, Project
+from api.services.tool_risk import serialize_risk
+
+CATALOG_VERSION_KEY = 'tool_catalog:version'
+
+
+def serialize_ai_tool(
+    tool: AITool, include_guidance: bool = False, include_project_count: bool = True,
+) -> dict[str, Any]:
+    """Serialize an AITool instance to a camelCase dict for the frontend.
+
+    ``projectCount`` costs a query per tool; the catalog leaves it out.
+    """
+    result = {
+        'id': tool.id,
+        'toolType': tool.tool_type,
+        'toolTypeDisplay': tool.get_tool_type_display(),
+        'name': tool.name,
+        'description': tool.description,
+        'vendor': tool.vendor,
+        'category': tool.category,
+        'categoryDisplay': tool.get_category_display(),
+        'status': tool.status,
+        'statusDisplay': tool.get_status_display(),
+        'riskNotes': tool.risk_notes,
+        'websiteUrl': tool.website_url,
+        'addedBy': tool.added_by.first_name or tool.added_by.email if tool.added_by else None,
+        'createdAt': tool.created_at.isoformat(),
+        # Data handling
+        'retainsData': tool.retains_data,
+        'dataRetentionDetails': tool.data_retention_details,
+        'sendsToThirdParty': tool.sends_to_third_party,
+        'hipaaCompliant': tool.hipaa_compliant,
+        'ferpaCompliant': tool.ferpa_compliant,
+        'hasEnterprisePlan': tool.has_enterprise_plan,
+        'recommendedUseCases': tool.recommended_use_cases or [],
+        **serialize_risk(tool.risk_score),
+    }
+    if include_project_count:
+        result['projectCount'] = tool.projects.count()
+    if include_guidance:
+        result['complianceGuidance'] = tool.compliance_guidance or {}
+    return result
+
+
+def project_counts(tool_id: int | None = None) -> dict[int, int]:
+    """{tool id: number of projects using it} for every used tool, or just ``tool_id``."""
+    links = Project.ai_tools.through.objects.all()
+    if tool_id is not None:
+        links = links.filter(aitool_id=tool_id)
+    return dict(links.values('aitool_id').annotate(count=Count('id')).values_list('aitool_id', 'count'))
+
+
+@dataclass
+class ToolCatalog:
+    """Serialized tools in name order plus id lists per indexed value.
+
+    The dicts are shared between requests; callers must copy before
+    changing them. They have no projectCount (see project_counts()).
+    """
+    version: Any
+    tools: dict[int, dict[str, Any]] = field(default_factory=dict)
+    guidance: dict[int, dict[str, Any]] = field(default_factory=dict)
+    ordered_ids: list[int] = field(default_factory=list)
+    by_tool_type: dict[str, list[int]] = field(default_factory=dict)
+    by_category: dict[str, list[int]] = field(default_factory=dict)
+    by_status: dict[str, list[int]] = field(default_factory=dict)
+    by_use_case: dict[str, list[int]] = field(default_factory=dict)
+
+    @classmethod
+    def build(cls, version: Any, tools: Iterable[AITool]) -> 'ToolCatalog':
+        catalog = cls(version=version)
+        for tool in tools:
+            data = serialize_ai_tool(tool, include_project_count=False)
+            catalog.tools[tool.id] = data
+            catalog.guidance[tool.id] = tool.compliance_guidance or {}
+            catalog.ordered_ids.append(tool.id)
+            catalog.by_tool_type.setdefault(tool.tool_type, []).append(tool.id)
+            catalog.by_category.setdefault(tool.category, []).append(tool.id)
+            catalog.by_status.setdefault(tool.status, []).append(tool.id)
+            for use_case in set(data['recommendedUseCases']):
+                catalog.by_use_case.setdefault(use_case, []).append(tool.id)
+        return catalog
+
+    def get(self, tool_id: int, include_guidance: bool = False) -> dict[str, Any] | None:
+        """A copy of one serialized tool, or None."""
+        data = self.tools.get(tool_id)
+        if data is None:
+            return None
+        data = dict(data)
+        if include_guidance:
+            data['complianceGuidance'] = self.guidance[tool_id]
+        return data
+
+    def filter(
+        self,
+        tool_type: str | None = None,
+        category: str | None = None,
+        status: str | None = None,
+        use_case: str | None = None,
+        ids: Iterable[int] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Tools matching every given filter, in name order."""
+        candidates = [
+            index.get(value, [])
+            for index, value in [
+                (self.by_tool_type, tool_type),
+                (self.by_category, category),
+                (self.by_status, status),
+                (self.by_use_case, use_case),
+            ]
+            if value
+        ]
+        if ids is not None:
+            candidates.append([tool_id for tool_id in ids if tool_id in self.tools])
+        if not candidates:
+            return [self.tools[tool_id] for tool_id in self.ordered_ids]
+
+        # Walk the shortest list, checking membership in the others
+        candidates.sort(key=len)
+        others = [set(ids_) for ids_ in candidates[1:]]
+        matched = {tool_id for tool_id in candidates[0] if all(tool_id in s for s in others)}
+        return [self.tools[tool_id] for tool_id in self.ordered_ids if tool_id in matched]
+
+
+_catalog: ToolCatalog | None = None
+_catalog_lock = threading.Lock()
+
+
+def catalog_version() -> Any:
+    # A missing key (first use, eviction) gets a fresh value so no process
+    # mistakes it for the version it already holds
+    return cache.get_or_set(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def bump_catalog_version() -> None:
+    try:
+        cache.incr(CATALOG_VERSION_KEY)
+    except ValueError:
+        cache.set(CATALOG_VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def invalidate_tool_catalog() -> None:
+    """Make every process rebuild its catalog.
+
+    Bumped now, for reads later in this transaction, and again on commit:
+    another process may rebuild in between from the uncommitted state.
+    """
+    bump_catalog_version()
+    transaction.on_commit(bump_catalog_version)
+
+
+def get_tool_catalog() -> ToolCatalog:
+    """The current catalog, rebuilt first if the shared version has moved."""
+    global _catalog
+    version = catalog_version()
+    catalog = _catalog
+    if catalog is not None and catalog.version == version:
+        return catalog
+    with _catalog_lock:
+        if _catalog is None or _catalog.version != version:
+            _catalog = ToolCatalog.build(version, AITool.objects.select_related('added_by').order_by('name', 'id'))
+        return _catalog
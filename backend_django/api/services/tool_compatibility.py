@@ -0,0 +1,167 @@
+"""Tool/use-case compatibility matrix.
+
+Each tool gets one ToolCompatibility row per project use case (plus any
+other use case it lists as recommended). A row combines whether the use
+case is in the tool's recommended_use_cases, the FERPA/HIPAA flags the
+use case calls for and the tool's review status into a verdict and a
+score, so "tools for grading, best first" is one indexed query.
+
+Rows also carry the use case's risk score (see api.services.tool_risk).
+Rows are rewritten by a signal handler in api.signals whenever a tool is
+saved; code that writes tools with bulk_create/bulk_update must call
+refresh_tool_compatibility() itself.
+"""
+from typing import Any, Iterable
+
+from django.db import transaction
+
+from api.models import AITool, ToolCompatibility
+from api.services.checkpoint_generator import USE_CASE_CHECKPOINTS
+from api.services.tool_risk import (
+    COMPLIANCE_FLAGS,
+    PREFERRED_COMPLIANCE,
+    REQUIRED_COMPLIANCE,
+    risk_columns,
+    serialize_risk,
+    use_case_risk,
+)
+
+PROJECT_USE_CASES: list[str] = [*USE_CASE_CHECKPOINTS, 'other']
+
+STATUS_SCORES = {'approved': 30, 'under_review': 10, 'not_recommended': 0}
+RECOMMENDED_SCORE = 50
+REQUIRED_SCORE = 10
+PREFERRED_SCORE = 5
+
+
+def use_cases_for(tool: Any) -> list[str]:
+    recommended = tool.recommended_use_cases or []
+    return PROJECT_USE_CASES + [uc for uc in dict.fromkeys(recommended) if uc not in PROJECT_USE_CASES]
+
+
+def assess(tool: Any, use_case: str) -> dict[str, Any]:
+    """Verdict, score and reasons for one tool and use case."""
+    recommended = use_case in (tool.recommended_use_cases or [])
+    reasons: list[str] = []
+    score = STATUS_SCORES.get(tool.status, 0)
+    if recommended:
+        score += RECOMMENDED_SCORE
+        reasons.append(f'Recommended for {use_case}')
+
+    missing_required = []
+    for regulation in REQUIRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if getattr(tool, flag):
+            score += REQUIRED_SCORE
+            reasons.append(f'{label} compliant')
+        else:
+            missing_required.append(label)
+            reasons.append(f'Not {label} compliant; {use_case} involves student records')
+    for regulation in PREFERRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if getattr(tool, flag):
+            score += PREFERRED_SCORE
+            reasons.append(f'{label} compliant')
+        else:
+            reasons.append(f'Not {label} compliant; de-identify {label}-covered data first')
+
+    if tool.status == 'not_recommended':
+        verdict = 'not_recommended'
+        score = 0
+        reasons.insert(0, 'Not recommended by the institution')
+    elif missing_required:
+        verdict = 'caution'
+    elif recommended and tool.status == 'approved':
+        verdict = 'recommended'
+    else:
+        verdict = 'compatible'
+    if tool.status == 'under_review':
+        reasons.append('Still under institutional review')
+
+    return {
+        'use_case': use_case,
+        'recommended': recommended,
+        'verdict': verdict,
+        'score': score,
+        'reasons': reasons,
+    }
+
+
+def compatibility_rows(tool: Any) -> list[dict[str, Any]]:
+    return [assess(tool, use_case) for use_case in use_cases_for(tool)]
+
+
+def refresh_tool_compatibility(tools: Iterable[AITool]) -> None:
+    """Rewrite the matrix rows for the given tools."""
+    tools = list(tools)
+    with transaction.atomic():
+        ToolCompatibility.objects.filter(tool__in=tools).delete()
+        ToolCompatibility.objects.bulk_create([
+            ToolCompatibility(tool=tool, **row, **risk_columns(tool, row['use_case']))
+            for tool in tools for row in compatibility_rows(tool)
+        ])
+
+
+def ranked_tools_for_use_case(use_case: str, limit: int | None = None) -> list[dict[str, Any]]:
+    """Tools recommended for a use case, best first, in one indexed query."""
+    rows = ToolCompatibility.objects.filter(use_case=use_case, recommended=True).order_by(
+        '-score', 'tool__name',
+    ).values('tool_id', 'verdict', 'score', 'reasons', 'risk_score')
+    if limit is not None:
+        rows = rows[:limit]
+    return list(rows)
+
+
+def risk_for_use_case(use_case: str, tool_ids: Iterable[int] | None = None) -> list[dict[str, Any]]:
+    """Risk of each tool (or of the given tools) for a use case, lowest first.
+
+    Read from the stored rows with one query on the (use_case, risk_score,
+    tool) index. A use case outside PROJECT_USE_CASES only has rows for
+    the tools recommending it; the others are scored on the fly.
+    """
+    rows = ToolCompatibility.objects.filter(use_case=use_case)
+    if tool_ids is not None:
+        tool_ids = list(tool_ids)
+        rows = rows.filter(tool_id__in=tool_ids)
+    scored = [
+        {'toolId': row['tool_id'], 'name': row['tool__name'], **serialize_risk(row['risk_score'], row['risk_factors'])}
+        for row in rows.order_by('risk_score', 'tool_id').values('tool_id', 'tool__name', 'risk_score', 'risk_factors')
+    ]
+    if use_case in PROJECT_USE_CASES:
+        return scored
+
+    unscored = AITool.objects.exclude(compatibility__use_case=use_case)
+    if tool_ids is not None:
+        unscored = unscored.filter(id__in=tool_ids)
+    for tool in unscored:
+        scored.append({'toolId': tool.id, 'name': tool.name, **serialize_risk(*use_case_risk(tool, use_case))})
+    return sorted(scored, key=lambda s: (s['riskScore'], s['toolId']))
+
+
+def serialize_compatibility(row: dict[str, Any]) -> dict[str, Any]:
+    return {
+        'verdict': row['verdict'],
+        'score': row['score'],
+        'reasons': row['reasons'],
+        **serialize_risk(row['risk_score']),
+    }
+
+
+def compatibility_matrix() -> dict[str, Any]:
+    """Every tool against every use case, for the matrix view."""
+    tools: dict[int, dict[str, Any]] = {}
+    use_cases = list(PROJECT_USE_CASES)
+    rows = ToolCompatibility.objects.order_by('tool__name', 'tool_id').values(
+        'tool_id', 'tool__name', 'tool__status', 'use_case', 'verdict', 'score', 'reasons', 'risk_score',
+    )
+    for row in rows:
+        tool = tools.setdefault(row['tool_id'], {
+            'id': row['tool_id'],
+            'name': row['tool__name'],
+            'status': row['tool__status'],
+            'useCases': {},
+        })
+        tool['useCases'][row['use_case']] = serialize_compatibility(row)
+        if row['use_case'] not in use_cases:
+            use_cases.append(row['use_case'])
+    return {'useCases': use_cases, 'tools': list(tools.values())}
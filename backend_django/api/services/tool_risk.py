@@ -0,0 +1,115 @@
+"""Risk scores for AI tools, overall and per project use case.
+
+Scores run from 0 (no concerns) to 100 and are built from the tool's
+data-handling flags, its review status, the FERPA/HIPAA compliance a use
+case calls for and whether the tool has compliance guidance for the use
+case. Every point comes with a factor explaining it.
+
+The overall score is stored on AITool.risk_score (set by a pre_save
+handler in api.signals); per-use-case scores are stored on the tool's
+ToolCompatibility rows when they are rewritten. Code that writes tools
+with bulk_create/bulk_update must set risk_score itself (see
+tool_seeding.apply_seed_plan).
+"""
+from typing import Any
+
+# Use cases that put student records into the tool
+REQUIRED_COMPLIANCE: dict[str, list[str]] = {
+    'grading': ['ferpa'],
+    'admin': ['ferpa'],
+}
+
+# Use cases that may involve student or health data depending on the study
+PREFERRED_COMPLIANCE: dict[str, list[str]] = {
+    'data_analysis': ['ferpa', 'hipaa'],
+    'qualitative': ['ferpa', 'hipaa'],
+    'ml_model': ['ferpa', 'hipaa'],
+}
+
+COMPLIANCE_FLAGS = {
+    'ferpa': ('ferpa_compliant', 'FERPA'),
+    'hipaa': ('hipaa_compliant', 'HIPAA'),
+}
+
+RETAINS_DATA_RISK = 20
+THIRD_PARTY_RISK = 20
+# An institutional plan offers contractual data controls
+ENTERPRISE_PLAN_CREDIT = 10
+STATUS_RISK = {
+    'under_review': (15, 'Still under institutional review'),
+    'not_recommended': (40, 'Not recommended by the institution'),
+}
+MISSING_REQUIRED_RISK = 25
+MISSING_PREFERRED_RISK = 10
+NO_GUIDANCE_RISK = 5
+MAX_RISK = 100
+
+# (exclusive upper bound, level)
+RISK_LEVELS = [(30, 'low'), (60, 'medium'), (MAX_RISK + 1, 'high')]
+
+
+def risk_level(score: int) -> str:
+    return next(level for bound, level in RISK_LEVELS if score < bound)
+
+
+def risk_range(level: str) -> tuple[int, int] | None:
+    """Inclusive (min, max) scores of a level, or None if unknown."""
+    lower = 0
+    for bound, name in RISK_LEVELS:
+        if name == level:
+            return lower, bound - 1
+        lower = bound
+    return None
+
+
+def _base_factors(tool: Any) -> list[tuple[int, str]]:
+    factors = []
+    if tool.retains_data:
+        factors.append((RETAINS_DATA_RISK, 'Retains user data'))
+    if tool.sends_to_third_party:
+        factors.append((THIRD_PARTY_RISK, 'Data leaves the institution'))
+    if tool.has_enterprise_plan and (tool.retains_data or tool.sends_to_third_party):
+        factors.append((-ENTERPRISE_PLAN_CREDIT, 'Institutional plan with data controls available'))
+    if tool.status in STATUS_RISK:
+        factors.append(STATUS_RISK[tool.status])
+    return factors
+
+
+def _score(factors: list[tuple[int, str]]) -> tuple[int, list[str]]:
+    score = max(0, min(MAX_RISK, sum(points for points, _ in factors)))
+    return score, [reason for _, reason in factors]
+
+
+def tool_risk(tool: Any) -> tuple[int, list[str]]:
+    """Use-case-independent score and factors."""
+    return _score(_base_factors(tool))
+
+
+def use_case_risk(tool: Any, use_case: str) -> tuple[int, list[str]]:
+    """Score and factors for using ``tool`` in ``use_case``."""
+    factors = _base_factors(tool)
+    for regulation in REQUIRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if not getattr(tool, flag):
+            factors.append((MISSING_REQUIRED_RISK, f'Not {label} compliant; required for {use_case}'))
+    for regulation in PREFERRED_COMPLIANCE.get(use_case, []):
+        flag, label = COMPLIANCE_FLAGS[regulation]
+        if not getattr(tool, flag):
+            factors.append((MISSING_PREFERRED_RISK, f'Not {label} compliant'))
+    guidance = tool.compliance_guidance if isinstance(tool.compliance_guidance, dict) else {}
+    if not guidance.get(use_case):
+        factors.append((NO_GUIDANCE_RISK, f'No compliance guidance for {use_case}'))
+    return _score(factors)
+
+
+def risk_columns(tool: Any, use_case: str) -> dict[str, Any]:
+    """ToolCompatibility field values for a use case's risk."""
+    score, factors = use_case_risk(tool, use_case)
+    return {'risk_score': score, 'risk_factors': factors}
+
+
+def serialize_risk(score: int, factors: list[str] | None = None) -> dict[str, Any]:
+    result: dict[str, Any] = {'riskScore': score, 'riskLevel': risk_level(score)}
+    if factors is not None:
+        result['riskFactors'] = factors
+    return result
@@ -0,0 +1,282 @@
+"""Full-text search over the AI tool registry.
+
+Tools are indexed on name, vendor, description, risk notes and the text of
+their compliance guidance, with matches in the name ranked highest. Every
+query term is a prefix, so "chat gp" finds ChatGPT for typeahead. Only
+when that finds nothing does search scan names for the terms anywhere, so
+"gpt" still finds ChatGPT.
+
+The index lives in the database where the backend supports it:
+
+- SQLite: an FTS5 virtual table ranked with bm25().
+- PostgreSQL: a weighted tsvector table with a GIN index, ranked with ts_rank().
+
+Other databases, or SQLite builds without FTS5, fall back to an in-memory
+inverted index built from the tool table, rebuilt whenever the tool
+catalog version moves (see api.services.tool_catalog). Signal handlers in
+api.signals keep the database index in step with AITool saves and
+deletes. Code that writes tools with bulk_create/bulk_update must call
+index_tools() itself.
+"""
+import re
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any, Iterable
+
+from django.db import connection
+
+from api.models import AITool
+from api.services.tool_catalog import catalog_version
+
+SEARCH_TABLE = 'api_aitool_search'
+
+# (document field, bm25 weight, tsvector weight class)
+SEARCH_FIELDS = [
+    ('name', 10.0, 'A'),
+    ('vendor', 4.0, 'B'),
+    ('description', 2.0, 'C'),
+    ('risk_notes', 1.0, 'D'),
+    ('guidance', 1.0, 'D'),
+]
+
+# Letters and digits; underscores split terms, as in the FTS5 and tsvector parsers
+TOKEN_RE = re.compile(r'[^\W_]+')
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+def search_document(tool: AITool) -> dict[str, str]:
+    """The indexed text of a tool, one entry per SEARCH_FIELDS field."""
+    guidance = tool.compliance_guidance if isinstance(tool.compliance_guidance, dict) else {}
+    return {
+        'name': tool.name,
+        'vendor': tool.vendor,
+        'description': tool.description,
+        'risk_notes': tool.risk_notes,
+        'guidance': ' '.join(str(text) for text in guidance.values()),
+    }
+
+
+class SQLiteSearchBackend:
+    """FTS5 table keyed by tool id (the FTS rowid)."""
+
+    @staticmethod
+    def create(conn) -> None:
+        columns = ', '.join(name for name, _, _ in SEARCH_FIELDS)
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5("
+                f"{columns}, tokenize='unicode61 remove_diacritics 2', prefix='2 3')"
+            )
+
+    @staticmethod
+    def drop(conn) -> None:
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+    def index(self, conn, tools: Iterable[Any]) -> None:
+        rows = [(tool.pk, *search_document(tool).values()) for tool in tools]
+        if not rows:
+            return
+        with conn.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [(row[0],) for row in rows])
+            placeholders = ', '.join(['%s'] * (len(SEARCH_FIELDS) + 1))
+            cursor.executemany(f'INSERT INTO {SEARCH_TABLE} (rowid, {", ".join(n for n, _, _ in SEARCH_FIELDS)}) '
+                               f'VALUES ({placeholders})', rows)
+
+    def remove(self, conn, tool_ids: Iterable[int]) -> None:
+        with conn.cursor() as cursor:
+            cursor.executemany(f'DELETE FROM {SEARCH_TABLE} WHERE rowid = %s', [(pk,) for pk in tool_ids])
+
+    def search(self, conn, terms: list[str], limit: int | None) -> list[int]:
+        match = ' '.join(f'"{term}"*' for term in terms)
+        weights = ', '.join(str(weight) for _, weight, _ in SEARCH_FIELDS)
+        sql = (f'SELECT rowid FROM {SEARCH_TABLE} WHERE {SEARCH_TABLE} MATCH %s '
+               f'ORDER BY bm25({SEARCH_TABLE}, {weights}), rowid')
+        params: list[Any] = [match]
+        if limit is not None:
+            sql += ' LIMIT %s'
+            params.append(limit)
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+
+class PostgresSearchBackend:
+    """Weighted tsvector per tool, one row per tool id, GIN-indexed."""
+
+    # 'simple' rather than a language config: no stemming, so prefixes match as typed
+    DOCUMENT_SQL = ' || '.join(
+        f"setweight(to_tsvector('simple', %s), '{weight_class}')" for _, _, weight_class in SEARCH_FIELDS
+    )
+
+    @staticmethod
+    def create(conn) -> None:
+        with conn.cursor() as cursor:
+            cursor.execute(
+                f'CREATE TABLE IF NOT EXISTS {SEARCH_TABLE} ('
+                f'tool_id integer PRIMARY KEY REFERENCES api_aitool (id) ON DELETE CASCADE, '
+                f'document tsvector NOT NULL)'
+            )
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {SEARCH_TABLE}_document ON {SEARCH_TABLE} USING gin (document)'
+            )
+
+    @staticmethod
+    def drop(conn) -> None:
+        with conn.cursor() as cursor:
+            cursor.execute(f'DROP TABLE IF EXISTS {SEARCH_TABLE}')
+
+    def index(self, conn, tools: Iterable[Any]) -> None:
+        rows = [(tool.pk, *search_document(tool).values()) for tool in tools]
+        if not rows:
+            return
+        with conn.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {SEARCH_TABLE} (tool_id, document) VALUES (%s, {self.DOCUMENT_SQL}) '
+                f'ON CONFLICT (tool_id) DO UPDATE SET document = EXCLUDED.document',
+                rows,
+            )
+
+    def remove(self, conn, tool_ids: Iterable[int]) -> None:
+        with conn.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {SEARCH_TABLE} WHERE tool_id = ANY(%s)', [list(tool_ids)])
+
+    def search(self, conn, terms: list[str], limit: int | None) -> list[int]:
+        # Terms are letters and digits only, so they are safe inside a tsquery
+        query = ' & '.join(f'{term}:*' for term in terms)
+        sql = (f"SELECT tool_id FROM {SEARCH_TABLE}, to_tsquery('simple', %s) AS query "
+               f'WHERE document @@ query ORDER BY ts_rank(document, query) DESC, tool_id')
+        params: list[Any] = [query]
+        if limit is not None:
+            sql += ' LIMIT %s'
+            params.append(limit)
+        with conn.cursor() as cursor:
+            cursor.execute(sql, params)
+            return [row[0] for row in cursor.fetchall()]
+
+
+class InvertedIndex:
+    """In-memory term -> {tool id: weight} index with prefix lookup."""
+
+    def __init__(self, tools: Iterable[Any]) -> None:
+        postings: dict[str, dict[int, float]] = defaultdict(lambda: defaultdict(float))
+        for tool in tools:
+            document = search_document(tool)
+            for field, weight, _ in SEARCH_FIELDS:
+                for term in tokenize(document[field]):
+                    postings[term][tool.pk] += weight
+        self.postings = {term: dict(scores) for term, scores in postings.items()}
+        self.terms = sorted(self.postings)
+
+    def _prefix_scores(self, prefix: str) -> dict[int, float]:
+        scores: dict[int, float] = defaultdict(float)
+        for i in range(bisect_left(self.terms, prefix), len(self.terms)):
+            term = self.terms[i]
+            if not term.startswith(prefix):
+                break
+            for tool_id, weight in self.postings[term].items():
+                scores[tool_id] += weight
+        return scores
+
+    def search(self, terms: list[str], limit: int | None = None) -> list[int]:
+        """Tools matching every term as a prefix, best first."""
+        totals: dict[int, float] | None = None
+        for term in terms:
+            scores = self._prefix_scores(term)
+            if totals is None:
+                totals = dict(scores)
+            else:
+                totals = {tool_id: total + scores[tool_id] for tool_id, total in totals.items() if tool_id in scores}
+            if not totals:
+                return []
+        ranked = sorted(totals or {}, key=lambda tool_id: (-totals[tool_id], tool_id))
+        return ranked[:limit] if limit is not None else ranked
+
+
+class FallbackSearchBackend:
+    """Per-process InvertedIndex, rebuilt when the catalog version changes."""
+
+    def __init__(self) -> None:
+        self._index: InvertedIndex | None = None
+        self._version: int | None = None
+
+    @staticmethod
+    def create(conn) -> None:
+        pass
+
+    @staticmethod
+    def drop(conn) -> None:
+        pass
+
+    def index(self, conn, tools: Iterable[Any]) -> None:
+        pass  # the catalog version bump triggers a rebuild
+
+    def remove(self, conn, tool_ids: Iterable[int]) -> None:
+        pass
+
+    def search(self, conn, terms: list[str], limit: int | None) -> list[int]:
+        version = catalog_version()
+        if self._index is None or self._version != version:
+            self._index = InvertedIndex(AITool.objects.only(
+                'id', 'name', 'vendor', 'description', 'risk_notes', 'compliance_guidance',
+            ))
+            self._version = version
+        return self._index.search(terms, limit)
+
+
+def _fts5_available(conn) -> bool:
+    with conn.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pragma_compile_options WHERE compile_options = 'ENABLE_FTS5'")
+        return cursor.fetchone() is not None
+
+
+def backend_for(conn) -> SQLiteSearchBackend | PostgresSearchBackend | FallbackSearchBackend:
+    """The search backend for a database connection."""
+    if conn.vendor == 'postgresql':
+        return PostgresSearchBackend()
+    if conn.vendor == 'sqlite' and _fts5_available(conn):
+        return SQLiteSearchBackend()
+    return FallbackSearchBackend()
+
+
+@lru_cache(maxsize=None)
+def _backend_for_vendor(vendor: str) -> SQLiteSearchBackend | PostgresSearchBackend | FallbackSearchBackend:
+    # Keyed by vendor so the FTS5 probe runs once per process
+    return backend_for(connection)
+
+
+def get_search_backend() -> SQLiteSearchBackend | PostgresSearchBackend | FallbackSearchBackend:
+    return _backend_for_vendor(connection.vendor)
+
+
+def index_tools(tools: Iterable[AITool]) -> None:
+    """Add or refresh tools in the search index."""
+    get_search_backend().index(connection, tools)
+
+
+def unindex_tools(tool_ids: Iterable[int]) -> None:
+    get_search_backend().remove(connection, tool_ids)
+
+
+def search_tool_ids(query: str, limit: int | None = None) -> list[int]:
+    """Ids of tools matching every term of ``query`` (as prefixes), best match first.
+
+    If the index finds nothing, falls back to tools whose name contains
+    every term mid-word, in name order. That is an unindexed scan, so it
+    only runs on a miss.
+    """
+    terms = tokenize(query)
+    if not terms:
+        return []
+    ids = get_search_backend().search(connection, terms, limit)
+    if ids:
+        return ids
+    infix = AITool.objects.all()
+    for term in terms:
+        infix = infix.filter(name__icontains=term)
+    infix_ids = infix.order_by('name', 'id').values_list('id', flat=True)
+    return list(infix_ids if limit is None else infix_ids[:limit])
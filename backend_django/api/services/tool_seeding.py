@@ -0,0 +1,224 @@
+"""Bulk, idempotent loading of tool definitions into the registry.
+
+Seed rows (the built-in SEED_TOOLS list, or a JSON/CSV file) are matched
+to existing tools by name with a single query and diffed in memory. New
+tools are written with bulk_create and changed tools with bulk_update on
+just the fields that differ, so re-running a seed that is already applied
+writes nothing.
+
+Bulk writes do not send model signals, so apply_seed_plan() does their
+work for the tools it touched: it sets the risk score, refreshes the
+search index, compatibility matrix and tool catalog, writes change feed
+entries, and propagates status changes to or from not_recommended to the
+projects using the tool.
+"""
+import csv
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+
+from api.models import AITool
+from api.services.background import enqueue_task
+from api.services.change_feed import record_changes
+from api.services.project_risk import propagate_tool_status
+from api.services.tool_catalog import invalidate_tool_catalog
+from api.services.tool_compatibility import refresh_tool_compatibility
+from api.services.tool_risk import tool_risk
+from api.services.tool_search import index_tools
+
+SEED_FIELDS = [
+    'tool_type', 'name', 'external_id', 'description', 'vendor', 'category', 'status', 'risk_notes', 'website_url',
+    'retains_data', 'data_retention_details', 'sends_to_third_party', 'hipaa_compliant', 'ferpa_compliant',
+    'has_enterprise_plan', 'compliance_guidance', 'recommended_use_cases',
+]
+BOOLEAN_FIELDS = {'retains_data', 'sends_to_third_party', 'hipaa_compliant', 'ferpa_compliant', 'has_enterprise_plan'}
+CHOICE_FIELDS = {
+    'tool_type': {value for value, _ in AITool.TOOL_TYPE_CHOICES},
+    'category': {value for value, _ in AITool.CATEGORY_CHOICES},
+    'status': {value for value, _ in AITool.STATUS_CHOICES},
+}
+# JSON fields the registry reads as a particular shape
+JSON_SHAPES = {'compliance_guidance': (dict, 'an object'), 'recommended_use_cases': (list, 'a list')}
+
+# CSV columns named guidance.<use_case> fill compliance_guidance
+CSV_GUIDANCE_PREFIX = 'guidance.'
+CSV_TRUE = {'1', 'true', 'yes', 'y'}
+CSV_FALSE = {'0', 'false', 'no', 'n', ''}
+
+
+@dataclass
+class SeedPlan:
+    """What applying a seed would change."""
+    to_create: list[AITool] = field(default_factory=list)
+    # (tool with new values set, {field: (old, new)})
+    to_update: list[tuple[AITool, dict[str, tuple[Any, Any]]]] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.to_create or self.to_update)
+
+
+def _csv_row(row: dict[str, str], line: int) -> dict[str, Any]:
+    tool: dict[str, Any] = {}
+    guidance: dict[str, str] = {}
+    for column, value in row.items():
+        column = (column or '').strip()
+        value = (value or '').strip()
+        if column.startswith(CSV_GUIDANCE_PREFIX):
+            if value:
+                guidance[column[len(CSV_GUIDANCE_PREFIX):]] = value
+        elif column in BOOLEAN_FIELDS:
+            if value.lower() not in CSV_TRUE | CSV_FALSE:
+                raise ValueError(f'Line {line}: {column} must be true or false, got "{value}"')
+            tool[column] = value.lower() in CSV_TRUE
+        elif column == 'recommended_use_cases':
+            tool[column] = [use_case.strip() for use_case in value.split(';') if use_case.strip()]
+        elif column == 'compliance_guidance':
+            if value:
+                guidance.update(json.loads(value))
+        else:
+            tool[column] = value
+    if guidance:
+        tool['compliance_guidance'] = guidance
+    return tool
+
+
+def load_seed_file(path: str | Path) -> list[dict[str, Any]]:
+    """Seed rows from a JSON list of objects or a CSV with a header row.
+
+    In CSV, booleans are true/false (or yes/no, 1/0), recommended use cases
+    are separated by semicolons and guidance goes either in a
+    compliance_guidance column as JSON or in guidance.<use_case> columns.
+    """
+    path = Path(path)
+    if path.suffix.lower() == '.json':
+        with path.open(encoding='utf-8') as f:
+            rows = json.load(f)
+        if not isinstance(rows, list) or not all(isinstance(row, dict) for row in rows):
+            raise ValueError('A JSON seed file must be a list of tool objects')
+        return rows
+    if path.suffix.lower() == '.csv':
+        with path.open(encoding='utf-8-sig', newline='') as f:
+            # Line 1 is the header
+            return [_csv_row(row, line) for line, row in enumerate(csv.DictReader(f), start=2)]
+    raise ValueError(f'Unsupported seed file type "{path.suffix}"; use .json or .csv')
+
+
+def check_seed_row(row: dict[str, Any], label: str) -> dict[str, Any]:
+    """Check one row's field names and values; strips the name and converts values in place.
+
+    Values go through the model field's clean(), so a value that could
+    not be saved (a string for a boolean, an overlong name) fails here as
+    a ValueError rather than in the bulk write.
+    """
+    unknown = set(row) - set(SEED_FIELDS)
+    if unknown:
+        raise ValueError(f'{label}: unknown fields {", ".join(sorted(unknown))}')
+    name = str(row.get('name', '')).strip()
+    if not name:
+        raise ValueError(f'{label}: name is required')
+    row['name'] = name
+    for field_name, choices in CHOICE_FIELDS.items():
+        if field_name in row and row[field_name] not in choices:
+            raise ValueError(f'{name}: invalid {field_name} "{row[field_name]}"')
+    for field_name, value in list(row.items()):
+        try:
+            row[field_name] = AITool._meta.get_field(field_name).clean(value, None)
+        except ValidationError as e:
+            raise ValueError(f'{name}: invalid {field_name} ({" ".join(e.messages)})') from None
+        if field_name in JSON_SHAPES:
+            shape, description = JSON_SHAPES[field_name]
+            if not isinstance(row[field_name], shape):
+                raise ValueError(f'{name}: {field_name} must be {description}')
+    return row
+
+
+def validate_seed_rows(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Check every row, and that no name appears twice."""
+    rows = list(rows)
+    seen: set[str] = set()
+    for i, row in enumerate(rows, start=1):
+        name = check_seed_row(row, f'Tool {i}')['name']
+        if name in seen:
+            raise ValueError(f'Tool {i}: "{name}" appears more than once')
+        seen.add(name)
+    return rows
+
+
+def new_tool(row: dict[str, Any]) -> AITool:
+    if not row.get('category'):
+        raise ValueError(f'{row["name"]}: category is required for a new tool')
+    return AITool(**row)
+
+
+def tool_changes(tool: AITool, row: dict[str, Any]) -> dict[str, tuple[Any, Any]]:
+    """{field: (old, new)} for the fields in ``row`` that differ on ``tool``."""
+    return {name: (getattr(tool, name), value) for name, value in row.items() if getattr(tool, name) != value}
+
+
+def plan_seed(rows: Iterable[dict[str, Any]]) -> SeedPlan:
+    """Diff seed rows against the registry in one query.
+
+    Only fields present in a row are compared, so a file with a few
+    columns leaves the others alone. New tools need a category.
+    """
+    rows = validate_seed_rows(rows)
+    existing: dict[str, AITool] = {}
+    for tool in AITool.objects.filter(name__in=[row['name'] for row in rows]).order_by('id'):
+        existing.setdefault(tool.name, tool)
+
+    plan = SeedPlan()
+    for row in rows:
+        tool = existing.get(row['name'])
+        if tool is None:
+            plan.to_create.append(new_tool(row))
+            continue
+        changes = tool_changes(tool, row)
+        if changes:
+            for name, (_, value) in changes.items():
+                setattr(tool, name, value)
+            plan.to_update.append((tool, changes))
+        else:
+            plan.unchanged += 1
+    return plan
+
+
+def apply_seed_plan(plan: SeedPlan, batch_size: int = 500) -> None:
+    """Write a plan with bulk_create and per-field-set bulk_update, then refresh derived data."""
+    if not plan.has_changes:
+        return
+    for tool in plan.to_create:
+        tool.risk_score = tool_risk(tool)[0]
+    with transaction.atomic():
+        created = AITool.objects.bulk_create(plan.to_create, batch_size=batch_size)
+        if any(tool.pk is None for tool in created):
+            # Backends that do not return ids from bulk inserts
+            created = list(AITool.objects.filter(name__in=[tool.name for tool in created]))
+
+        by_fields: dict[tuple[str, ...], list[AITool]] = {}
+        for tool, changes in plan.to_update:
+            fields = set(changes)
+            risk_score = tool_risk(tool)[0]
+            if risk_score != tool.risk_score:
+                tool.risk_score = risk_score
+                fields.add('risk_score')
+            by_fields.setdefault(tuple(sorted(fields)), []).append(tool)
+        for fields, tools in by_fields.items():
+            AITool.objects.bulk_update(tools, fields, batch_size=batch_size)
+
+        updated = [tool for tool, _ in plan.to_update]
+        touched = [*created, *updated]
+        index_tools(touched)
+        refresh_tool_compatibility(touched)
+        invalidate_tool_catalog()
+        record_changes(created, 'create')
+        record_changes(updated, 'update')
+        # New tools have no projects yet
+        for tool, changes in plan.to_update:
+            if 'status' in changes and 'not_recommended' in changes['status']:
+                enqueue_task(propagate_tool_status, tool.pk)
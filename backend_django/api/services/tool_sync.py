@@ -0,0 +1,230 @@
+"""Sync the tool registry from an external catalog (JSONL).
+
+The procurement system exports one JSON object per line, using the
+registry's field names (see tool_seeding.SEED_FIELDS) plus an optional
+``external_id``. Records are matched to existing tools by external_id,
+then by name and vendor; a tool matched by name and vendor adopts the
+record's external_id.
+
+The file is read as a stream and processed in batches: each batch costs
+one lookup query, a bulk insert, bulk updates of the changed fields and a
+bulk insert of ToolSyncChange rows, in one transaction. Memory stays
+bounded by the batch size whatever the catalog's length. Invalid records
+are counted and the first MAX_RECORDED_ERRORS are kept on the run; they do
+not stop the sync; that includes lines that are not valid UTF-8. Tools
+missing from the catalog are left alone.
+"""
+import json
+from itertools import islice
+from typing import Any, Iterable, Iterator
+
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from api.models import AITool, ToolSyncChange, ToolSyncRun
+from api.services.tool_seeding import SeedPlan, apply_seed_plan, check_seed_row, new_tool, tool_changes
+
+SYNC_BATCH_SIZE = 1000
+MAX_RECORDED_ERRORS = 100
+
+
+def _iter_byte_lines(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    # Split before decoding, so one bad line does not lose its neighbours;
+    # a newline byte never occurs inside a multi-byte UTF-8 character
+    pending = b''
+    for chunk in chunks:
+        pending += chunk
+        *lines, pending = pending.split(b'\n')
+        yield from lines
+    if pending:
+        yield pending
+
+
+def iter_catalog_records(chunks: Iterable[bytes]) -> Iterator[tuple[int, dict[str, Any] | str]]:
+    """(line number, record) per non-blank line; the record is an error message if the line is not an object."""
+    for line_no, raw_line in enumerate(_iter_byte_lines(chunks), start=1):
+        try:
+            line = raw_line.decode('utf-8').strip()
+        except UnicodeDecodeError:
+            yield line_no, 'not valid UTF-8'
+            continue
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_no, f'invalid JSON ({e.msg})'
+            continue
+        yield line_no, record if isinstance(record, dict) else 'expected a JSON object'
+
+
+def _jsonable(value: Any) -> Any:
+    return value if isinstance(value, (str, int, float, bool, list, dict, type(None))) else str(value)
+
+
+def _change_row(run: ToolSyncRun, tool: AITool, action: str, changes: dict[str, tuple[Any, Any]]) -> ToolSyncChange:
+    return ToolSyncChange(
+        run=run,
+        tool=tool if tool.pk else None,
+        external_id=tool.external_id,
+        name=tool.name,
+        action=action,
+        changes={name: [_jsonable(old), _jsonable(new)] for name, (old, new) in changes.items()},
+    )
+
+
+def _created_fields(tool: AITool) -> dict[str, Any]:
+    return {name: getattr(tool, name) for name in ('name', 'vendor', 'category', 'status', 'external_id')}
+
+
+def _record_error(run: ToolSyncRun, line_no: int, error: Exception | str) -> None:
+    run.failed += 1
+    if len(run.errors) < MAX_RECORDED_ERRORS:
+        message = str(error)
+        run.errors.append(message if message.startswith('Line ') else f'Line {line_no}: {message}')
+
+
+def plan_sync_batch(
+    records: list[tuple[int, dict[str, Any]]],
+) -> tuple[SeedPlan, list[tuple[int, ValueError]]]:
+    """Match a batch of checked (line number, record) pairs to the registry and diff them.
+
+    One query. A tool named more than once in the batch takes the later
+    values. Returns the plan and the records that could not be planned.
+    """
+    external_ids = {r['external_id'] for _, r in records if r.get('external_id')}
+    names = {r['name'] for _, r in records}
+    by_external_id: dict[str, AITool] = {}
+    by_name_vendor: dict[tuple[str, str], AITool] = {}
+    for tool in AITool.objects.filter(Q(external_id__in=external_ids) | Q(name__in=names)).order_by('id'):
+        if tool.external_id:
+            by_external_id[tool.external_id] = tool
+        by_name_vendor.setdefault((tool.name, tool.vendor), tool)
+
+    plan = SeedPlan()
+    errors: list[tuple[int, ValueError]] = []
+    matched: dict[int, AITool] = {}
+    changes: dict[int, dict[str, tuple[Any, Any]]] = {}
+    for line_no, record in records:
+        external_id = record.get('external_id', '')
+        tool = by_external_id.get(external_id) if external_id else None
+        if tool is None:
+            tool = by_name_vendor.get((record['name'], record.get('vendor', '')))
+            if tool is not None and external_id and tool.external_id not in ('', external_id):
+                tool = None  # same name and vendor, but a different catalog entry
+
+        if tool is None:
+            try:
+                tool = new_tool(record)
+            except ValueError as e:
+                errors.append((line_no, e))
+                continue
+            plan.to_create.append(tool)
+        elif tool.pk is None:
+            for name, value in record.items():
+                setattr(tool, name, value)
+        else:
+            matched[tool.pk] = tool
+            tool_diff = changes.setdefault(tool.pk, {})
+            for name, (old, new) in tool_changes(tool, record).items():
+                setattr(tool, name, new)
+                tool_diff[name] = (tool_diff[name][0] if name in tool_diff else old, new)
+
+        if tool.external_id:
+            by_external_id[tool.external_id] = tool
+        by_name_vendor.setdefault((tool.name, tool.vendor), tool)
+
+    for pk, tool in matched.items():
+        if changes[pk]:
+            plan.to_update.append((tool, changes[pk]))
+        else:
+            plan.unchanged += 1
+    return plan, errors
+
+
+def sync_tool_catalog(
+    chunks: Iterable[bytes],
+    source: str,
+    user: User | None = None,
+    dry_run: bool = False,
+    batch_size: int = SYNC_BATCH_SIZE,
+) -> ToolSyncRun:
+    """Stream a JSONL catalog into the registry and return the finished run.
+
+    With ``dry_run`` the totals are computed but no tools or changes are
+    written (only the run itself). Takes an iterable of byte chunks, e.g.
+    an open file or UploadedFile.chunks(). The run is finished even if a
+    batch raises; batches already committed stay applied.
+    """
+    run = ToolSyncRun.objects.create(source=source[:255], started_by=user, dry_run=dry_run)
+    try:
+        _sync_batches(run, iter_catalog_records(chunks), dry_run, batch_size)
+    finally:
+        run.finished_at = timezone.now()
+        run.save(update_fields=['finished_at'])
+    return run
+
+
+def _sync_batches(
+    run: ToolSyncRun,
+    records: Iterator[tuple[int, dict[str, Any] | str]],
+    dry_run: bool,
+    batch_size: int,
+) -> None:
+    while batch := list(islice(records, batch_size)):
+        checked: list[tuple[int, dict[str, Any]]] = []
+        for line_no, record in batch:
+            run.records_read += 1
+            try:
+                if isinstance(record, str):
+                    raise ValueError(record)
+                checked.append((line_no, check_seed_row(record, f'Line {line_no}')))
+            except ValueError as e:
+                _record_error(run, line_no, e)
+
+        plan, errors = plan_sync_batch(checked)
+        for line_no, error in errors:
+            _record_error(run, line_no, error)
+        run.created += len(plan.to_create)
+        run.updated += len(plan.to_update)
+        run.unchanged += plan.unchanged
+        with transaction.atomic():
+            if not dry_run:
+                apply_seed_plan(plan, batch_size=batch_size)
+                ToolSyncChange.objects.bulk_create([
+                    *(_change_row(run, tool, 'create', {
+                        name: (None, value) for name, value in _created_fields(tool).items()
+                    }) for tool in plan.to_create),
+                    *(_change_row(run, tool, 'update', tool_diff) for tool, tool_diff in plan.to_update),
+                ], batch_size=batch_size)
+            run.save()
+
+
+def serialize_sync_run(run: ToolSyncRun) -> dict[str, Any]:
+    return {
+        'id': run.id,
+        'source': run.source,
+        'startedBy': run.started_by.first_name or run.started_by.email if run.started_by else None,
+        'dryRun': run.dry_run,
+        'recordsRead': run.records_read,
+        'created': run.created,
+        'updated': run.updated,
+        'unchanged': run.unchanged,
+        'failed': run.failed,
+        'errors': run.errors,
+        'startedAt': run.started_at.isoformat(),
+        'finishedAt': run.finished_at.isoformat() if run.finished_at else None,
+    }
+
+
+def serialize_sync_change(change: ToolSyncChange) -> dict[str, Any]:
+    return {
+        'id': change.id,
+        'toolId': change.tool_id,
+        'externalId': change.external_id,
+        'name': change.name,
+        'action': change.action,
+        'changes': change.changes,
+    }
@@ -0,0 +1,113 @@
+"""Signal handlers that keep derived data in step with the database.
+
+They clear cached project field maps, append to the change log and keep
+project tool risk flags, the tool search index, compatibility matrix and
+in-memory tool catalog current.
+Connected in ApiConfig.ready(). Bulk operations (bulk_create, update())
+do not send these signals; code that uses them must do both directly.
+"""
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete, pre_save
+from django.dispatch import receiver
+
+from api.models import AITool, Decision, Project
+from api.services.change_feed import MEMBER_FIELDS, TRACKED_MODELS, record_change, record_changes
+from api.services.project_risk import refresh_project_risk_flags
+from api.services.project_fields import invalidate_project_fields
+from api.services.tool_catalog import invalidate_tool_catalog
+from api.services.tool_compatibility import refresh_tool_compatibility
+from api.services.tool_risk import tool_risk
+from api.services.tool_search import index_tools, unindex_tools
+
+
+@receiver(post_save, sender=Project)
+@receiver(post_delete, sender=Project)
+def project_changed(sender, instance: Project, **kwargs) -> None:
+    invalidate_project_fields(instance.pk)
+
+
+@receiver(pre_save, sender=Project)
+def project_members_before_save(sender, instance: Project, raw: bool = False, update_fields=None, **kwargs) -> None:
+    # A member this save removes must still receive its change log entry
+    if raw or instance.pk is None:
+        return
+    if update_fields is not None and not {'user', 'faculty_advisor', 'student_collaborator'} & set(update_fields):
+        return
+    previous = Project.objects.filter(pk=instance.pk).values_list(*MEMBER_FIELDS).first()
+    instance._previous_member_ids = {user_id for user_id in previous or () if user_id}
+
+
+@receiver(post_save, sender=Decision)
+@receiver(post_delete, sender=Decision)
+def decision_changed(sender, instance: Decision, **kwargs) -> None:
+    invalidate_project_fields(instance.project_id)
+
+
+@receiver(m2m_changed, sender=Project.ai_tools.through)
+def project_tools_changed(sender, instance, action: str, reverse: bool, pk_set, **kwargs) -> None:
+    if not reverse:
+        if action.startswith('post_'):
+            invalidate_project_fields(instance.pk)
+            refresh_project_risk_flags([instance.pk])
+            record_change(instance, 'update')
+    elif action == 'pre_clear':
+        # instance is an AITool; its projects are only known before the clear
+        instance._cleared_project_ids = list(instance.projects.values_list('id', flat=True))
+    elif action.startswith('post_'):
+        project_ids = pk_set if action != 'post_clear' else instance.__dict__.pop('_cleared_project_ids', [])
+        invalidate_project_fields(*project_ids)
+        refresh_project_risk_flags(project_ids)
+        record_changes(Project.objects.filter(id__in=project_ids).prefetch_related('ai_tools'), 'update')
+
+
+@receiver(post_save, sender=AITool)
+@receiver(pre_delete, sender=AITool)
+def tool_changed(sender, instance: AITool, **kwargs) -> None:
+    # Renaming or deleting a tool changes the ai_tool fields of every project using it
+    if kwargs.get('created'):
+        return
+    project_ids = set(instance.projects.values_list('id', flat=True))
+    project_ids.update(instance.decisions.values_list('project_id', flat=True))
+    invalidate_project_fields(*project_ids)
+
+
+@receiver(pre_save, sender=AITool)
+def tool_risk_scored(sender, instance: AITool, raw: bool = False, **kwargs) -> None:
+    if not raw:
+        instance.risk_score = tool_risk(instance)[0]
+
+
+@receiver(post_save, sender=AITool)
+def tool_saved(sender, instance: AITool, raw: bool = False, **kwargs) -> None:
+    if not raw:
+        index_tools([instance])
+        refresh_tool_compatibility([instance])
+        invalidate_tool_catalog()
+
+
+@receiver(pre_delete, sender=AITool)
+def tool_deleting(sender, instance: AITool, **kwargs) -> None:
+    # Its ai_tools rows go without an m2m_changed signal; only flagged projects can change
+    instance._flagged_project_ids = list(instance.projects.filter(tool_risk_flag=True).values_list('id', flat=True))
+
+
+@receiver(post_delete, sender=AITool)
+def tool_deleted(sender, instance: AITool, **kwargs) -> None:
+    unindex_tools([instance.pk])
+    invalidate_tool_catalog()
+    project_ids = instance.__dict__.pop('_flagged_project_ids', None)
+    if project_ids:
+        refresh_project_risk_flags(project_ids)
+
+
+def log_saved(sender, instance, created: bool, raw: bool = False, **kwargs) -> None:
+    if not raw:
+        record_change(instance, 'create' if created else 'update')
+
+
+def log_deleted(sender, instance, **kwargs) -> None:
+    record_change(instance, 'delete')
+
+
+for tracked_model in TRACKED_MODELS:
+    post_save.connect(log_saved, sender=tracked_model, dispatch_uid=f'changelog_save_{tracked_model.__name__}')
+    post_delete.connect(log_deleted, sender=tracked_model, dispatch_uid=f'changelog_delete_{tracked_model.__name__}')
@@ -0,0 +1,291 @@
+import asyncio
+import copy
+import io
+import json
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+from django.contrib.auth.models import User
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase, Client
+from rest_framework.renderers import JSONRenderer
+
+from api.services.ethics_engine import (
+    DECISION_TREE,
+    DOCUMENT_TEMPLATES,
+    TERMINAL_NODES,
+    DecisionTreeError,
+    _RENDERED_PATHS,
+    _path_key,
+    _render_path,
+    compile_decision_tree,
+    evaluate_decision_path_json,
+    get_decision_paths,
+    process_decision_path,
+    walk_decision_tree,
+)
+from api.services.document_batch import iter_records
+from api.services.pii_scanner import SCAN_ROW_LIMIT, scan_csv_for_pii, scan_csv_stream
+from api.views.ethics import ethics_evaluate_async
+
+
+class DecisionTreeCompileTest(SimpleTestCase):
+    """Tests for the import-time decision tree compiler."""
+
+    def test_every_path_ends_at_a_terminal(self) -> None:
+        paths = get_decision_paths()
+        self.assertTrue(paths)
+        for p in paths:
+            self.assertIn(p['terminal_key'], TERMINAL_NODES)
+            self.assertEqual(p['steps'][0]['node'], 'start')
+
+    def test_rejects_cycle(self) -> None:
+        tree = copy.deepcopy(DECISION_TREE)
+        tree['journal_policy']['options'][0]['next'] = 'publication_intent'
+        with self.assertRaises(DecisionTreeError):
+            compile_decision_tree(tree, TERMINAL_NODES, DOCUMENT_TEMPLATES)
+
+    def test_rejects_dangling_link(self) -> None:
+        tree = copy.deepcopy(DECISION_TREE)
+        tree['funder_policy']['options'][0]['next'] = 'missing_node'
+        with self.assertRaises(DecisionTreeError):
+            compile_decision_tree(tree, TERMINAL_NODES, DOCUMENT_TEMPLATES)
+
+
+class EthicsEvaluateTest(SimpleTestCase):
+    """Tests for the /api/ethics/evaluate endpoint."""
+
+    def setUp(self) -> None:
+        self.client = Client()
+
+    def test_evaluate_follows_answers(self) -> None:
+        response = self.client.post(
+            '/api/ethics/evaluate',
+            data={'answers': {'start': 'code_generation', 'code_context': 'internal'}},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['terminal_key'], 'terminal_code_internal')
+        self.assertEqual(len(response.json()['path']), 2)
+
+    def test_cached_json_matches_drf_rendering(self) -> None:
+        answer_sets = [{s['node']: s['answer'] for s in p['steps']} for p in get_decision_paths()]
+        answer_sets += [{}, {'start': 'code_generation'}, {'start': 'grant_writing', 'funder_policy': 1}]
+        for answers in answer_sets:
+            self.assertEqual(
+                evaluate_decision_path_json(answers),
+                JSONRenderer().render(process_decision_path(answers)),
+            )
+
+    def test_unmatched_answer_stops_walk(self) -> None:
+        response = self.client.post(
+            '/api/ethics/evaluate',
+            data={'answers': {'start': ['not', 'an', 'option']}},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNone(response.json()['terminal_key'])
+
+    def test_unmatched_answers_are_not_cached(self) -> None:
+        _render_path.cache_clear()
+        evaluate_decision_path_json({'start': 'code_generation'})
+        self.assertEqual(_render_path.cache_info().currsize, 1)
+        for i in range(5):
+            answers = {'start': 'code_generation', 'code_context': 'x' * 1000 + str(i)}
+            self.assertEqual(
+                evaluate_decision_path_json(answers),
+                JSONRenderer().render(process_decision_path(answers)),
+            )
+        self.assertEqual(_render_path.cache_info().currsize, 1)
+
+    def test_boolean_answer_paths_are_precomputed(self) -> None:
+        path = next(p for p in get_decision_paths() if any(isinstance(s['answer'], bool) for s in p['steps']))
+        answers = {step['node']: step['answer'] for step in path['steps']}
+        _render_path.cache_clear()
+        rendered = evaluate_decision_path_json(answers)
+        self.assertIs(rendered, _RENDERED_PATHS[_path_key(walk_decision_tree(answers)[0])])
+        self.assertEqual(_render_path.cache_info().misses, 0)
+
+    def test_evaluation_does_not_mutate_terminal_nodes(self) -> None:
+        result = process_decision_path({'start': 'grant_writing', 'funder_policy': 'yes'})
+        result['path'].append('tampered')
+        self.assertNotIn('path', TERMINAL_NODES['terminal_grant'])
+        with self.assertRaises(TypeError):
+            result['considerations'][0]['title'] = 'tampered'
+
+    def test_concurrent_evaluations_keep_their_own_paths(self) -> None:
+        cases = [
+            ({step['node']: step['answer'] for step in p['steps']}, p['terminal_key'])
+            for p in get_decision_paths()
+        ] * 4
+
+        def evaluate(case):
+            answers, terminal_key = case
+            response = Client().post(
+                '/api/ethics/evaluate', data={'answers': answers}, content_type='application/json',
+            )
+            return answers, terminal_key, response.json()
+
+        with ThreadPoolExecutor(max_workers=16) as pool:
+            results = list(pool.map(evaluate, cases))
+
+        for answers, terminal_key, body in results:
+            self.assertEqual(body['terminal_key'], terminal_key)
+            self.assertEqual({step['node']: step['answer'] for step in body['path']}, answers)
+
+
+class StaticPayloadTest(SimpleTestCase):
+    """Tests for ETag handling on the pre-rendered ethics and template endpoints."""
+
+    def setUp(self) -> None:
+        self.client = Client()
+
+    def test_node_has_strong_etag_and_cache_headers(self) -> None:
+        response = self.client.get('/api/ethics/node/human_subjects')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['key'], 'human_subjects')
+        self.assertTrue(response['ETag'].startswith('"'))
+        self.assertIn('max-age', response['Cache-Control'])
+
+    def test_matching_if_none_match_returns_304(self) -> None:
+        etag = self.client.get('/api/templates').headers['ETag']
+        response = self.client.get('/api/templates', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_bundle_etag_is_its_version(self) -> None:
+        response = self.client.get('/api/ethics/bundle')
+        bundle = response.json()
+        self.assertEqual(response['ETag'], f'"{bundle["version"]}"')
+        self.assertEqual(set(bundle['nodes']), set(DECISION_TREE))
+        self.assertEqual(set(bundle['terminals']), set(TERMINAL_NODES))
+
+        response = self.client.get('/api/ethics/bundle', HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_node_is_404(self) -> None:
+        response = self.client.get('/api/ethics/node/missing')
+        self.assertEqual(response.status_code, 404)
+
+
+class DocumentGenerateTest(SimpleTestCase):
+    """Tests for the /api/documents/generate endpoint."""
+
+    def setUp(self) -> None:
+        self.client = Client()
+
+    def test_reports_missing_and_unknown_fields(self) -> None:
+        response = self.client.post(
+            '/api/documents/generate',
+            data={'template_key': 'disclosure_statement', 'fields': {'ai_tool': 'ChatGPT', 'colour': 'blue'}},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertIn('**AI Tool(s) Used:** ChatGPT', body['content'])
+        self.assertIn('{{purpose}}', body['content'])
+        self.assertIn('purpose', body['missing_fields'])
+        self.assertEqual(body['unknown_fields'], ['colour'])
+
+    def test_values_are_not_reinterpreted_as_placeholders(self) -> None:
+        response = self.client.post(
+            '/api/documents/generate',
+            data={
+                'template_key': 'disclosure_statement',
+                'fields': {'ai_tool': '{{purpose}} <b>', 'purpose': 'Editing'},
+                'escape': 'html',
+            },
+            content_type='application/json',
+        )
+        self.assertIn('**AI Tool(s) Used:** {{purpose}} &lt;b&gt;', response.json()['content'])
+
+    def test_non_string_escape_is_rejected(self) -> None:
+        for escape in (['html'], {'html': True}):
+            response = self.client.post(
+                '/api/documents/generate',
+                data={'template_key': 'disclosure_statement', 'fields': {}, 'escape': escape},
+                content_type='application/json',
+            )
+            self.assertEqual(response.status_code, 400)
+
+
+class DocumentBatchTest(TestCase):
+    """Tests for the /api/documents/generate/batch endpoint."""
+
+    def setUp(self) -> None:
+        self.client = Client()
+        User.objects.create_user(username='batch@usf.edu', email='batch@usf.edu', password='testpass123')
+        self.client.login(username='batch@usf.edu', password='testpass123')
+
+    def test_csv_upload_streams_jsonl(self) -> None:
+        upload = SimpleUploadedFile('courses.csv', b'course_name,contact_info\nBIO 101,bio@usf.edu\nCHM 201,chm@usf.edu\n')
+        response = self.client.post(
+            '/api/documents/generate/batch',
+            data={'template_key': 'syllabus_ai_statement', 'file': upload},
+        )
+        self.assertEqual(response.status_code, 200)
+        lines = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual(len(lines), 2)
+        self.assertIn('chm@usf.edu', lines[1]['content'])
+
+    def test_json_records_stream_zip(self) -> None:
+        response = self.client.post(
+            '/api/documents/generate/batch?output=zip&name_field=course_name',
+            data={'template_key': 'syllabus_ai_statement', 'records': [{'course_name': 'BIO 101'}, 'bad']},
+            content_type='application/json',
+        )
+        archive = zipfile.ZipFile(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(archive.namelist(), ['BIO_101.md', 'errors.jsonl'])
+
+    def test_json_array_needs_commas_between_records(self) -> None:
+        records = iter_records(io.BytesIO(b'[{"a": 1} {"b": 2}]'), 'json')
+        self.assertEqual(next(records), {'a': 1})
+        with self.assertRaises(ValueError):
+            next(records)
+        split_number = io.BufferedReader(io.BytesIO(b'[12345, {"a": 1}]'), buffer_size=1)
+        with patch('api.services.document_batch.CHUNK_SIZE', 3):
+            self.assertEqual(list(iter_records(split_number, 'json')), [12345, {'a': 1}])
+
+    def test_malformed_json_record_fails_without_reading_on(self) -> None:
+        class UnclosedBytesIO(io.BytesIO):
+            def close(self) -> None:
+                pass  # keep tell() usable after the reader is closed
+
+        stream = UnclosedBytesIO(b'[{"a": nope}, ' + b'{"b": 2}, ' * 10000 + b'{}]')
+        with patch('api.services.document_batch.CHUNK_SIZE', 1024), \
+                patch('api.services.document_batch.MAX_RECORD_CHARS', 4096):
+            with self.assertRaises(ValueError):
+                list(iter_records(stream, 'json'))
+        self.assertLess(stream.tell(), 16 * 1024)
+
+
+class PiiStreamScanTest(SimpleTestCase):
+    """Tests for the chunked PII scan used by /api/verify/scan-pii."""
+
+    def test_stream_scan_matches_full_scan(self) -> None:
+        content = 'student_name,notes\n' + ''.join(f'S{i},"call (813) 555-{i:04d}\nlater"\n' for i in range(150))
+        data = content.encode()
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+        self.assertEqual(scan_csv_stream(chunks), scan_csv_for_pii(content))
+
+    def test_stream_scan_stops_after_sampled_rows(self) -> None:
+        read = []
+
+        def chunks():
+            yield b'id,email\n'
+            for i in range(1000):
+                read.append(i)
+                yield f'{i},user{i}@usf.edu\n'.encode()
+            yield b'\xff\xfe'  # never decoded
+
+        result = scan_csv_stream(chunks())
+        self.assertEqual(result['rowsScanned'], SCAN_ROW_LIMIT)
+        self.assertLess(len(read), SCAN_ROW_LIMIT + 5)
+
+    def test_async_evaluate_rejects_bad_body(self) -> None:
+        factory = AsyncRequestFactory()
+        for body in ['not json', '{"answers": []}']:
+            request = factory.post('/api/ethics/evaluate', body, content_type='application/json')
+            response = asyncio.run(ethics_evaluate_async(request))
+            self.assertEqual(response.status_code, 400)
@@ -1,7 +1,33 @@
-from django.test import TestCase, Client
+import asyncio
+import csv
+import gzip
+import io
+import json
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.test import AsyncRequestFactory, TestCase, Client
+from django.test.utils import CaptureQueriesContext
 from django.contrib.auth.models import User
+from django.utils import timezone
 
-from api.models import UserProfile, Project, Checkpoint
+from api.async_dispatch import json_response, with_async
+from api.models import (
+    AITool, UserProfile, Project, Checkpoint, Decision, CheckpointDefinition, CatalogRetrofitRun, ChangeLogEntry,
+)
+from api.services.change_feed import COMMIT_GRACE
+from api.services.checkpoint_catalog import create_project_checkpoints
+from api.services.events import RESYNC_FRAME, SUBSCRIBER_QUEUE_SIZE, InProcessBroker, get_broker
+from api.services.checkpoint_generator import CATALOG_VERSION, CHECKPOINT_CATALOG
+from api.views.dashboard import dashboard_stats_async
+from api.views.projects import project_list_async
+from api.views.tools import ai_tool_list_async
 
 
 class ProjectListCreateTest(TestCase):
@@ -42,6 +68,21 @@ class ProjectListCreateTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 1)
 
+    def test_projects_share_checkpoint_definitions(self) -> None:
+        for name in ['First Project', 'Second Project']:
+            self.client.post(
+                '/api/projects',
+                data={'name': name, 'ai_use_case': 'data_analysis'},
+                content_type='application/json',
+            )
+        self.assertEqual(Checkpoint.objects.count(), 14)
+        self.assertEqual(CheckpointDefinition.objects.count(), len(CHECKPOINT_CATALOG))
+
+        response = self.client.get('/api/projects')
+        checkpoint = response.json()[0]['checkpoints'][0]
+        self.assertEqual(checkpoint['label'], 'IRB Status Confirmed')
+        self.assertEqual(checkpoint['frameworks'], ['IRB', 'Common Rule'])
+
     def test_create_project_requires_name(self) -> None:
         response = self.client.post(
             '/api/projects',
@@ -74,11 +115,16 @@ class CheckpointToggleTest(TestCase):
             name='Toggle Test',
             ai_use_case='writing',
         )
-        self.checkpoint = Checkpoint.objects.create(
-            project=self.project,
+        definition = CheckpointDefinition.objects.create(
+            catalog_version='test',
             checkpoint_id='irb',
             label='IRB Status',
             category='Regulatory',
+        )
+        self.checkpoint = Checkpoint.objects.create(
+            project=self.project,
+            definition=definition,
+            checkpoint_id='irb',
             assigned_to='pi',
         )
 
@@ -97,3 +143,413 @@ class CheckpointToggleTest(TestCase):
         )
         self.assertEqual(response.status_code, 200)
         self.assertFalse(response.json()['completed'])
+
+
+class RetrofitCheckpointsTest(TestCase):
+    """Tests for the retrofit_checkpoints management command."""
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='retro@usf.edu', email='retro@usf.edu', password='testpass123')
+        self.project = Project.objects.create(user=self.user, name='Old Project', ai_use_case='writing')
+        legacy = CheckpointDefinition.objects.create(
+            catalog_version='legacy-test', checkpoint_id='irb', label='IRB', category='Regulatory',
+            frameworks=['IRB'],
+        )
+        Checkpoint.objects.create(
+            project=self.project, definition=legacy, checkpoint_id='irb', assigned_to='pi', completed=True,
+        )
+
+    def test_adds_missing_and_updates_stale_checkpoints(self) -> None:
+        call_command('retrofit_checkpoints', batch_size=1, stdout=StringIO())
+
+        checkpoints = {cp.checkpoint_id: cp for cp in self.project.checkpoints.select_related('definition')}
+        self.assertEqual(set(checkpoints), {'irb', 'data_classification', 'ai_disclosure', 'ai_writing_disclosure'})
+        self.assertEqual(checkpoints['irb'].definition.frameworks, ['IRB', 'Common Rule'])
+        self.assertTrue(checkpoints['irb'].completed)
+        self.assertIsNotNone(CatalogRetrofitRun.objects.get().finished_at)
+
+    def test_resumes_after_last_processed_project(self) -> None:
+        later = Project.objects.create(user=self.user, name='New Project', ai_use_case='writing')
+        CatalogRetrofitRun.objects.create(catalog_version=CATALOG_VERSION, last_project_id=self.project.id)
+
+        call_command('retrofit_checkpoints', stdout=StringIO())
+
+        self.assertEqual(self.project.checkpoints.count(), 1)
+        self.assertEqual(later.checkpoints.count(), 4)
+
+
+class ProjectDocumentPrefillTest(TestCase):
+    """Tests for generating documents with a project_id."""
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='prefill@usf.edu',
+            email='prefill@usf.edu',
+            password='testpass123',
+            first_name='Prefill User',
+        )
+        self.client.login(username='prefill@usf.edu', password='testpass123')
+        self.tool = AITool.objects.create(name='Copilot', category='code_assistant')
+        self.project = Project.objects.create(
+            user=self.user, name='Prefill Project', description='Speed up analysis', ai_use_case='data_analysis',
+        )
+        self.project.ai_tools.add(self.tool)
+
+    def generate(self, **fields) -> dict:
+        response = self.client.post(
+            '/api/documents/generate',
+            data={'template_key': 'code_documentation', 'project_id': self.project.id, 'fields': fields},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 200)
+        return response.json()
+
+    def test_fields_resolved_from_project_and_overridable(self) -> None:
+        result = self.generate(purpose='Client purpose')
+        self.assertIn('**Project:** Prefill Project', result['content'])
+        self.assertIn('**Tool:** Copilot', result['content'])
+        self.assertIn('**Purpose:** Client purpose', result['content'])
+        self.assertEqual(result['unknown_fields'], [])
+
+    def test_cache_invalidated_on_project_changes(self) -> None:
+        self.generate()
+        # Session, user, access check and the cached field map
+        with self.assertNumQueries(4):
+            self.generate()
+
+        self.project.name = 'Renamed Project'
+        self.project.save()
+        self.tool.name = 'Copilot Enterprise'
+        self.tool.save()
+        self.assertIn('Renamed Project', self.generate()['content'])
+        self.assertIn('Copilot Enterprise', self.generate()['content'])
+
+    def test_other_users_project_not_found(self) -> None:
+        other = User.objects.create_user(username='other@usf.edu', email='other@usf.edu', password='testpass123')
+        self.project.user = other
+        self.project.save()
+        response = self.client.post(
+            '/api/documents/generate',
+            data={'template_key': 'code_documentation', 'project_id': self.project.id},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 404)
+
+    def test_non_integer_project_id_is_rejected(self) -> None:
+        response = self.client.post(
+            '/api/documents/generate',
+            data={'template_key': 'code_documentation', 'project_id': 'abc'},
+            content_type='application/json',
+        )
+        self.assertEqual(response.status_code, 400)
+
+
+class ProjectExportTest(TestCase):
+    """Tests for the /api/projects/<id>/export endpoint."""
+
+    def setUp(self) -> None:
+        self.client = Client()
+        User.objects.create_user(username='export@usf.edu', email='export@usf.edu', password='testpass123')
+        self.client.login(username='export@usf.edu', password='testpass123')
+        response = self.client.post(
+            '/api/projects',
+            data={'name': 'Export Project', 'ai_use_case': 'data_analysis'},
+            content_type='application/json',
+        )
+        self.project = Project.objects.get(id=response.json()['id'])
+
+    def test_export_streams_one_row_per_decision(self) -> None:
+        first, second = self.project.checkpoints.order_by('id')[:2]
+        for i in range(3):
+            Decision.objects.create(project=self.project, checkpoint=second, description=f'second {i}')
+        Decision.objects.create(project=self.project, checkpoint=first, description='first')
+
+        # Session, user, project, then one query each for checkpoints and decisions
+        with self.assertNumQueries(5):
+            response = self.client.get(f'/api/projects/{self.project.id}/export')
+            rows = list(csv.reader(b''.join(response.streaming_content).decode().splitlines()))
+
+        self.assertEqual(rows[0][0], 'checkpoint_id')
+        descriptions = [row[6] for row in rows[1:]]
+        self.assertEqual(descriptions[:4], ['first', 'second 0', 'second 1', 'second 2'])
+        self.assertEqual(len(rows), 1 + 4 + self.project.checkpoints.count() - 2)
+
+    def test_gzip_jsonl_export_is_typed(self) -> None:
+        self.project.checkpoints.filter(id=self.project.checkpoints.first().id).update(completed=True)
+        response = self.client.get(f'/api/projects/{self.project.id}/export?output=jsonl.gz')
+        self.assertEqual(response['Content-Type'], 'application/gzip')
+        lines = gzip.decompress(b''.join(response.streaming_content)).splitlines()
+        first = json.loads(lines[0])
+        self.assertIs(first['completed'], True)
+        self.assertIsNone(first['logged_at'])
+
+    def test_parquet_export_has_typed_schema(self) -> None:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        response = self.client.get(f'/api/projects/{self.project.id}/export?output=parquet')
+        table = pq.read_table(io.BytesIO(b''.join(response.streaming_content)))
+        self.assertEqual(table.num_rows, self.project.checkpoints.count())
+        self.assertEqual(table.schema.field('completed').type, pa.bool_())
+        self.assertEqual(table.schema.field('logged_at').type, pa.timestamp('us', tz='UTC'))
+
+    def test_unknown_output_rejected(self) -> None:
+        response = self.client.get(f'/api/projects/{self.project.id}/export?output=xlsx')
+        self.assertEqual(response.status_code, 400)
+
+
+class ComplianceExportTest(TestCase):
+    """Tests for the /api/export/compliance endpoint."""
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.admin = User.objects.create_user(
+            username='admin@usf.edu', email='admin@usf.edu', password='testpass123', is_staff=True,
+        )
+        for name, use_case, department in [('Bio', 'data_analysis', 'Biology'), ('Chem', 'writing', 'Chemistry')]:
+            owner = User.objects.create_user(username=f'{name}@usf.edu', email=f'{name}@usf.edu')
+            UserProfile.objects.create(user=owner, role='faculty', department=department)
+            project = Project.objects.create(user=owner, name=name, ai_use_case=use_case)
+            create_project_checkpoints(project)
+            Decision.objects.create(project=project, checkpoint=project.checkpoints.first(), description=f'{name} decision')
+
+    def test_requires_admin(self) -> None:
+        User.objects.create_user(username='student@usf.edu', email='student@usf.edu', password='testpass123')
+        self.client.login(username='student@usf.edu', password='testpass123')
+        self.assertEqual(self.client.get('/api/export/compliance').status_code, 403)
+
+    def test_self_registered_admin_role_is_not_enough(self) -> None:
+        self.client.post(
+            '/api/auth/register',
+            data={'email': 'claims@usf.edu', 'password': 'testpass123', 'role': 'admin'},
+            content_type='application/json',
+        )
+        self.client.login(username='claims@usf.edu', password='testpass123')
+        self.assertEqual(self.client.get('/api/export/compliance').status_code, 403)
+
+    def test_filters_and_streams_jsonl(self) -> None:
+        self.client.login(username='admin@usf.edu', password='testpass123')
+        response = self.client.get('/api/export/compliance?output=jsonl&department=biology')
+        records = [json.loads(line) for line in b''.join(response.streaming_content).splitlines()]
+        self.assertEqual([r['name'] for r in records], ['Bio'])
+        self.assertEqual(records[0]['checkpoints'][0]['decisions'][0]['description'], 'Bio decision')
+
+    def test_command_writes_csv_in_chunks(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'export.csv')
+            call_command('export_compliance', output=path, chunk_size=1, stdout=StringIO())
+            with open(path, newline='') as f:
+                rows = list(csv.DictReader(f))
+        self.assertEqual({row['project_name'] for row in rows}, {'Bio', 'Chem'})
+        self.assertEqual(sum(1 for row in rows if row['decision_description']), 2)
+
+    def test_project_without_checkpoints_gets_a_blank_row(self) -> None:
+        owner = User.objects.get(username='Bio@usf.edu')
+        Project.objects.create(user=owner, name='Empty', ai_use_case='writing')
+        self.client.login(username='admin@usf.edu', password='testpass123')
+        response = self.client.get('/api/export/compliance')
+        rows = list(csv.DictReader(b''.join(response.streaming_content).decode().splitlines()))
+        empty = [row for row in rows if row['project_name'] == 'Empty']
+        self.assertEqual(len(empty), 1)
+        self.assertEqual(empty[0]['checkpoint_id'], '')
+
+
+class ChangeFeedTest(TestCase):
+    """Tests for the /api/changes endpoint."""
+
+    def setUp(self) -> None:
+        self.client = Client()
+        self.user = User.objects.create_user(username='sync@usf.edu', email='sync@usf.edu', password='testpass123')
+        self.client.login(username='sync@usf.edu', password='testpass123')
+
+    def test_pages_through_changes_since_cursor(self) -> None:
+        response = self.client.post(
+            '/api/projects',
+            data={'name': 'Synced Project', 'ai_use_case': 'data_analysis'},
+            content_type='application/json',
+        )
+        project_id = int(response.json()['id'])
+        cursor = self.client.get('/api/changes?since=0').json()['cursor']
+
+        self.client.put(f'/api/projects/{project_id}/checkpoints/irb')
+        self.client.post(
+            f'/api/projects/{project_id}/decisions',
+            data={'checkpoint': 'irb', 'description': 'Approved'},
+            content_type='application/json',
+        )
+
+        first = self.client.get(f'/api/changes?since={cursor}&limit=1').json()
+        self.assertTrue(first['hasMore'])
+        self.assertEqual(first['changes'][0]['model'], 'checkpoint')
+        self.assertTrue(first['changes'][0]['data']['completed'])
+
+        rest = self.client.get(f"/api/changes?since={first['cursor']}").json()
+        self.assertFalse(rest['hasMore'])
+        self.assertEqual([c['model'] for c in rest['changes']], ['decision'])
+
+    def test_bulk_created_checkpoints_logged_and_other_projects_hidden(self) -> None:
+        other = User.objects.create_user(username='other@usf.edu', email='other@usf.edu')
+        hidden = Project.objects.create(user=other, name='Hidden', ai_use_case='writing')
+        mine = Project.objects.create(user=self.user, name='Mine', ai_use_case='writing')
+        create_project_checkpoints(mine)
+
+        changes = self.client.get('/api/changes?since=0').json()['changes']
+        self.assertNotIn(hidden.id, {c['projectId'] for c in changes})
+        self.assertEqual(
+            sum(1 for c in changes if c['model'] == 'checkpoint'),
+            mine.checkpoints.count(),
+        )
+
+    def test_removed_member_receives_the_change_that_removed_them(self) -> None:
+        owner = User.objects.create_user(username='owner@usf.edu', email='owner@usf.edu')
+        project = Project.objects.create(user=owner, student_collaborator=self.user, name='Shared', ai_use_case='writing')
+        project.student_collaborator = None
+        project.save()
+        project.name = 'Renamed'
+        project.save()
+        deleted = Project.objects.create(user=self.user, name='Gone', ai_use_case='writing')
+        deleted_id = deleted.id
+        deleted.delete()
+
+        changes = self.client.get('/api/changes?since=0').json()['changes']
+        shared = [c for c in changes if c['projectId'] == project.id]
+        self.assertEqual([c['action'] for c in shared], ['create', 'update'])
+        self.assertIsNone(shared[-1]['data']['studentCollaboratorId'])
+        self.assertEqual(
+            [c['action'] for c in changes if c['projectId'] == deleted_id and c['model'] == 'project'],
+            ['create', 'delete'],
+        )
+
+    def test_cursor_waits_for_late_commits(self) -> None:
+        for i in range(5):
+            Project.objects.create(user=self.user, name=f'Busy {i}', ai_use_case='writing')
+        ids = list(ChangeLogEntry.objects.order_by('id').values_list('id', flat=True))
+        # An entry whose transaction has not committed yet looks like a gap
+        in_flight = ChangeLogEntry.objects.get(id=ids[2])
+        in_flight.delete()
+
+        page = self.client.get('/api/changes?since=0').json()
+        self.assertEqual(page['cursor'], ids[1])
+        self.assertEqual([c['cursor'] for c in page['changes']], ids[:2])
+        self.assertFalse(page['hasMore'])
+
+        # Once the entry after the gap is old, the missing id counts as rolled back
+        ChangeLogEntry.objects.update(changed_at=timezone.now() - COMMIT_GRACE - timedelta(seconds=1))
+        page = self.client.get(f"/api/changes?since={page['cursor']}").json()
+        self.assertEqual([c['cursor'] for c in page['changes']], ids[3:])
+
+    def test_tool_side_m2m_change_logs_projects_in_bulk(self) -> None:
+        def queries_to_link(count: int) -> int:
+            tool = AITool.objects.create(name=f'Shared Tool {count}', category='writing')
+            projects = [Project.objects.create(user=self.user, name=f'P{i}', ai_use_case='writing') for i in range(count)]
+            before = ChangeLogEntry.objects.count()
+            with CaptureQueriesContext(connection) as queries:
+                tool.projects.add(*projects)
+            self.assertEqual(ChangeLogEntry.objects.count(), before + count)
+            return len(queries)
+
+        self.assertEqual(queries_to_link(1), queries_to_link(5))
+
+
+class ProjectEventsTest(TestCase):
+    """Tests for the /api/projects/<id>/events push channel."""
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='live@usf.edu', email='live@usf.edu', password='testpass123')
+        self.project = Project.objects.create(user=self.user, name='Live Project', ai_use_case='writing')
+        create_project_checkpoints(self.project)
+
+    async def test_stream_delivers_published_events(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(f'/api/projects/{self.project.id}/events')
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertEqual(await anext(stream), b'retry: 5000\n\n')
+
+        get_broker().publish(self.project.id, 'checkpoint', {'id': 'ai_disclosure', 'completed': True})
+        frame = await anext(stream)
+        self.assertIn(b'event: checkpoint\n', frame)
+        self.assertIn(b'"completed":true', frame)
+
+        # A client disconnect cancels the pending read, which must unsubscribe
+        pending = asyncio.ensure_future(anext(stream))
+        await asyncio.sleep(0)
+        pending.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await pending
+        self.assertEqual(get_broker().subscriber_count(self.project.id), 0)
+
+    async def test_slow_subscriber_is_told_to_resync(self) -> None:
+        broker = InProcessBroker()
+        subscription = broker.subscribe(self.project.id)
+        for i in range(SUBSCRIBER_QUEUE_SIZE + 1):
+            broker.publish(self.project.id, 'comment', {'n': i})
+        await asyncio.sleep(0)
+        self.assertEqual(subscription.queue.qsize(), 1)
+        self.assertIs(subscription.queue.get_nowait(), RESYNC_FRAME)
+
+    def test_toggle_publishes_after_commit(self) -> None:
+        self.client.login(username='live@usf.edu', password='testpass123')
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.client.put(f'/api/projects/{self.project.id}/checkpoints/ai_disclosure')
+        self.assertEqual(len(callbacks), 1)
+
+    def test_requires_asgi(self) -> None:
+        self.client.login(username='live@usf.edu', password='testpass123')
+        response = self.client.get(f'/api/projects/{self.project.id}/events')
+        self.assertEqual(response.status_code, 501)
+
+
+class AsyncViewsTest(TestCase):
+    """The ASGI-mode read paths return the same payloads as the DRF views."""
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='async@usf.edu', email='async@usf.edu', password='testpass123')
+        UserProfile.objects.create(user=self.user, role='faculty')
+        self.tool = AITool.objects.create(name='ChatGPT', category='llm', status='approved', added_by=self.user)
+        self.project = Project.objects.create(user=self.user, name='Async Project', ai_use_case='writing')
+        self.project.ai_tools.set([self.tool])
+        create_project_checkpoints(self.project)
+        Decision.objects.create(
+            project=self.project, checkpoint=self.project.checkpoints.first(),
+            description='Used for outlines', tool_used=self.tool,
+        )
+        self.client.login(username='async@usf.edu', password='testpass123')
+
+    def _request(self, path: str):
+        request = AsyncRequestFactory().get(path)
+
+        async def auser():
+            return self.user
+        request.auser = auser
+        return request
+
+    async def test_async_views_match_sync_views(self) -> None:
+        cases = [
+            ('/api/projects', project_list_async),
+            ('/api/dashboard/stats?scope=all', dashboard_stats_async),
+            ('/api/tools?status=approved', ai_tool_list_async),
+        ]
+        for path, async_view in cases:
+            with self.subTest(path=path):
+                response = await async_view(self._request(path))
+                expected = await sync_to_async(lambda: self.client.get(path).json())()
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(json.loads(response.content), expected)
+
+    def test_with_async_routes_by_method_in_asgi_mode(self) -> None:
+        async def fast(request):
+            return json_response({'via': 'async'})
+
+        def sync_view(request):
+            return json_response({'via': 'sync'})
+
+        self.assertIs(with_async(fast)(sync_view), sync_view)
+        with self.settings(SERVER_MODE='asgi'):
+            view = with_async(fast)(sync_view)
+        self.assertIs(view.async_view, fast)
+        for method, via in [('get', 'async'), ('post', 'sync')]:
+            response = asyncio.run(view(getattr(AsyncRequestFactory(), method)('/')))
+            self.assertEqual(json.loads(response.content), {'via': via})
@@ -1,7 +1,27 @@
-from django.test import TestCase, Client
+import json
+import tempfile
+import threading
+from io import StringIO
+from pathlib import Path
+from unittest.mock import patch
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase, Client, override_settings
 from django.contrib.auth.models import User
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+from django.core.files.uploadedfile import SimpleUploadedFile
 
-from api.models import UserProfile, AITool
+from api.models import (
+    UserProfile, AITool, Project, Checkpoint, CheckpointDefinition, ChangeLogEntry, Notification, ToolSyncChange,
+    ToolSyncRun,
+)
+from api.services.background import ThreadPoolTaskRunner, get_task_runner
+from api.services.tool_catalog import bump_catalog_version, get_tool_catalog
+from api.services.tool_search import InvertedIndex, get_search_backend, search_tool_ids, tokenize
+from api.services.tool_sync import sync_tool_catalog
+from api.management.commands.seed_tools import SEED_TOOLS
 
 
 class AIToolListCreateTest(TestCase):
@@ -37,6 +57,22 @@ class AIToolListCreateTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(len(response.json()), 1)
 
+    def test_list_query_count_is_constant(self) -> None:
+        for i in range(20):
+            tool = AITool.objects.create(name=f'Tool {i}', category='chatbot', added_by=self.faculty if i % 2 else None)
+            project = Project.objects.create(user=self.student, name=f'Activity {i}', ai_use_case='writing')
+            project.ai_tools.add(tool)
+        self.client.login(username='faculty@usf.edu', password='testpass123')
+        # Session, user, catalog version, the tools with their owners, then the project counts
+        with self.assertNumQueries(5):
+            response = self.client.get('/api/tools')
+        tools = response.json()
+        self.assertEqual(len(tools), 20)
+        self.assertTrue(all(t['projectCount'] == 1 for t in tools))
+        by_name = {t['name']: t for t in tools}
+        self.assertEqual(by_name['Tool 1']['addedBy'], 'Faculty User')
+        self.assertIsNone(by_name['Tool 0']['addedBy'])
+
     def test_faculty_can_create_tool(self) -> None:
         self.client.login(username='faculty@usf.edu', password='testpass123')
         response = self.client.post(
@@ -66,3 +102,472 @@ class AIToolListCreateTest(TestCase):
     def test_unauthenticated_blocked(self) -> None:
         response = self.client.get('/api/tools')
         self.assertEqual(response.status_code, 401)
+
+
+class ToolSearchTest(TestCase):
+    """Tests for ranked, prefix-matching tool search."""
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='search@usf.edu', email='search@usf.edu', password='testpass123')
+        self.client.login(username='search@usf.edu', password='testpass123')
+        self.chatgpt = AITool.objects.create(
+            name='ChatGPT', vendor='OpenAI', category='chatbot', description='General purpose assistant',
+        )
+        self.copilot = AITool.objects.create(
+            name='GitHub Copilot', vendor='GitHub', category='code_assistant',
+            description='Pairs well with ChatGPT for explanations',
+            compliance_guidance={'research': 'Never paste participant identifiers'},
+        )
+        AITool.objects.create(name='Qualtrics', vendor='Qualtrics', category='survey')
+
+    def search(self, query: str, **params) -> list[str]:
+        response = self.client.get('/api/tools', {'search': query, **params})
+        self.assertEqual(response.status_code, 200)
+        return [t['name'] for t in response.json()]
+
+    def test_ranked_prefix_search_across_fields(self) -> None:
+        self.assertEqual(self.search('chat'), ['ChatGPT', 'GitHub Copilot'])
+        self.assertEqual(self.search('chat', limit=1), ['ChatGPT'])
+        self.assertEqual(self.search('participant ident'), ['GitHub Copilot'])
+        self.assertEqual(self.search('openai chat'), ['ChatGPT'])
+        self.assertEqual(self.search('chat', category='code_assistant'), ['GitHub Copilot'])
+        self.assertEqual(self.search('zzz'), [])
+
+    def test_name_infix_only_on_a_miss(self) -> None:
+        self.assertEqual(self.search('gpt'), ['ChatGPT'])
+        self.assertEqual(self.search('hub pilot'), ['GitHub Copilot'])
+        AITool.objects.create(name='GPT Builder', vendor='OpenAI', category='chatbot')
+        self.assertEqual(self.search('gpt'), ['GPT Builder'])
+        for query in ['chat', 'gpt']:
+            with self.subTest(query=query), CaptureQueriesContext(connection) as queries:
+                search_tool_ids(query)
+            self.assertFalse([q['sql'] for q in queries if ' LIKE ' in q['sql']])
+
+    def test_index_follows_saves_and_deletes(self) -> None:
+        self.chatgpt.name = 'OpenAI Assistant'
+        self.chatgpt.save()
+        self.assertEqual(self.search('assist'), ['OpenAI Assistant'])
+        self.copilot.delete()
+        self.assertEqual(self.search('github'), [])
+
+    def test_fallback_index_matches_database_search(self) -> None:
+        index = InvertedIndex(AITool.objects.all())
+        for query in ['chat', 'git cop', 'participant', 'qual']:
+            with self.subTest(query=query):
+                terms = tokenize(query)
+                self.assertEqual(index.search(terms), get_search_backend().search(connection, terms, None))
+
+
+class ToolCatalogTest(TestCase):
+    """Tests for the in-memory, version-stamped tool catalog."""
+
+    def setUp(self) -> None:
+        self.faculty = User.objects.create_user(username='cat@usf.edu', email='cat@usf.edu', password='testpass123')
+        UserProfile.objects.create(user=self.faculty, role='faculty')
+        self.client.login(username='cat@usf.edu', password='testpass123')
+        self.tool = AITool.objects.create(
+            name='Grammarly', category='writing', status='approved', recommended_use_cases=['writing'],
+        )
+        AITool.objects.create(name='Gradescope', category='grading', status='under_review', recommended_use_cases=['grading'])
+
+    def names(self, **params) -> list[str]:
+        return [t['name'] for t in self.client.get('/api/tools', params).json()]
+
+    def test_filters_served_from_memory(self) -> None:
+        self.names()
+        # Session, user, catalog version and project counts per request; use_case adds one compatibility query
+        with self.assertNumQueries(13):
+            self.assertEqual(self.names(status='approved'), ['Grammarly'])
+            self.assertEqual(self.names(use_case='grading'), ['Gradescope'])
+            self.assertEqual(self.names(category='writing', status='under_review'), [])
+
+    def test_edits_invalidate_and_usage_counts_stay_live(self) -> None:
+        self.names()
+        self.client.put(f'/api/tools/{self.tool.id}', {'status': 'not_recommended'}, content_type='application/json')
+        self.assertEqual(self.names(status='not_recommended'), ['Grammarly'])
+
+        catalog = get_tool_catalog()
+        project = Project.objects.create(user=self.faculty, name='Essay feedback', ai_use_case='writing')
+        project.ai_tools.add(self.tool)
+        # Usage counts are read per request, so linking a project keeps the catalog
+        self.assertIs(get_tool_catalog(), catalog)
+        detail = self.client.get(f'/api/tools/{self.tool.id}/detail').json()
+        self.assertEqual(detail['projectCount'], 1)
+        project.delete()
+        self.assertEqual(self.client.get('/api/tools').json()[0]['projectCount'], 0)
+        self.assertEqual([a['name'] for a in detail['activityHistory']], ['Essay feedback'])
+
+    def test_version_bump_from_another_process_rebuilds(self) -> None:
+        catalog = get_tool_catalog()
+        self.assertIs(get_tool_catalog(), catalog)
+        bump_catalog_version()
+        self.assertIsNot(get_tool_catalog(), catalog)
+
+
+class ToolCompatibilityTest(TestCase):
+    """Tests for the use-case compatibility matrix and ranked suggestions."""
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='compat@usf.edu', email='compat@usf.edu', password='testpass123')
+        self.client.login(username='compat@usf.edu', password='testpass123')
+        self.gradescope = AITool.objects.create(
+            name='Gradescope', category='grading', status='approved',
+            ferpa_compliant=True, recommended_use_cases=['grading'],
+        )
+        self.chatgpt = AITool.objects.create(
+            name='ChatGPT', category='chatbot', status='approved', recommended_use_cases=['grading', 'writing'],
+        )
+        AITool.objects.create(name='Quizlet AI', category='other', status='under_review', recommended_use_cases=['grading'])
+
+    def test_use_case_filter_ranks_by_compatibility(self) -> None:
+        tools = self.client.get('/api/tools', {'use_case': 'grading'}).json()
+        self.assertEqual([t['name'] for t in tools], ['Gradescope', 'ChatGPT', 'Quizlet AI'])
+        self.assertEqual(tools[0]['compatibility']['verdict'], 'recommended')
+        self.assertEqual(tools[1]['compatibility']['verdict'], 'caution')
+        self.assertIn('Not FERPA compliant; grading involves student records', tools[1]['compatibility']['reasons'])
+        self.assertEqual(tools[2]['compatibility']['verdict'], 'caution')
+        self.assertEqual(self.client.get('/api/tools', {'use_case': 'grading', 'search': 'chat'}).json()[0]['name'], 'ChatGPT')
+
+    def test_matrix_follows_tool_edits(self) -> None:
+        self.gradescope.status = 'not_recommended'
+        self.gradescope.save()
+        matrix = self.client.get('/api/tools/matrix').json()
+        self.assertIn('writing', matrix['useCases'])
+        by_name = {t['name']: t['useCases'] for t in matrix['tools']}
+        self.assertEqual(by_name['Gradescope']['grading']['verdict'], 'not_recommended')
+        self.assertEqual(by_name['ChatGPT']['writing']['verdict'], 'recommended')
+        self.assertEqual(by_name['ChatGPT']['teaching']['verdict'], 'compatible')
+
+
+class ToolActivityHistoryTest(TestCase):
+    """Tests for the paginated activity history and usage summary on tool detail."""
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(username='hist@usf.edu', email='hist@usf.edu', password='testpass123')
+        self.client.login(username='hist@usf.edu', password='testpass123')
+        self.tool = AITool.objects.create(name='ChatGPT', category='chatbot', status='approved')
+        definition = CheckpointDefinition.objects.create(
+            catalog_version='test', checkpoint_id='irb', label='IRB Status', category='Regulatory',
+        )
+        for i, (use_case, done) in enumerate([('writing', 1), ('writing', 0), ('grading', 2)]):
+            project = Project.objects.create(user=self.user, name=f'Activity {i}', ai_use_case=use_case)
+            project.ai_tools.add(self.tool)
+            for n in range(2):
+                Checkpoint.objects.create(
+                    project=project, definition=definition, checkpoint_id='irb', assigned_to='pi', completed=n < done,
+                )
+
+    def detail(self, **params) -> dict:
+        return self.client.get(f'/api/tools/{self.tool.id}/detail', params).json()
+
+    def test_history_is_paginated_newest_first(self) -> None:
+        first = self.detail(page_size=2)
+        self.assertEqual([a['name'] for a in first['activityHistory']], ['Activity 2', 'Activity 1'])
+        self.assertEqual(first['activityHistory'][0]['compliancePct'], 100)
+        self.assertTrue(first['activityPage']['hasMore'])
+        second = self.detail(page=2, page_size=2)
+        self.assertEqual([a['name'] for a in second['activityHistory']], ['Activity 0'])
+        self.assertEqual(second['activityHistory'][0]['compliancePct'], 50)
+        self.assertFalse(second['activityPage']['hasMore'])
+        self.assertEqual(self.client.get(f'/api/tools/{self.tool.id}/detail', {'page': 'x'}).status_code, 400)
+
+    def test_summary_groups_by_use_case(self) -> None:
+        summary = self.detail(page_size=1)['usageSummary']
+        self.assertEqual(summary['activityCount'], 3)
+        self.assertEqual(summary['compliancePct'], 50)
+        self.assertEqual(summary['byUseCase'], [
+            {'useCase': 'writing', 'activityCount': 2, 'compliancePct': 25},
+            {'useCase': 'grading', 'activityCount': 1, 'compliancePct': 100},
+        ])
+
+    def test_query_count_is_constant(self) -> None:
+        self.detail()
+        # Session, user, catalog version, project count, the page and the summary
+        with self.assertNumQueries(6):
+            self.detail()
+
+
+class SeedToolsTest(TestCase):
+    """Tests for the bulk, idempotent seed_tools command."""
+
+    def seed(self, *args: str) -> str:
+        out = StringIO()
+        call_command('seed_tools', *args, stdout=out)
+        return out.getvalue()
+
+    def test_reseeding_writes_nothing(self) -> None:
+        self.seed()
+        self.assertEqual(AITool.objects.count(), len(SEED_TOOLS))
+        self.assertEqual(ChangeLogEntry.objects.filter(model='tool', action='create').count(), len(SEED_TOOLS))
+        self.assertEqual(search_tool_ids('chatg'), [AITool.objects.get(name='ChatGPT').id])
+        # One fetch of the existing tools, no writes
+        with self.assertNumQueries(1):
+            out = self.seed()
+        self.assertIn(f'0 created, 0 updated, {len(SEED_TOOLS)} unchanged', out)
+
+    def test_file_updates_only_changed_fields(self) -> None:
+        self.seed()
+        chatgpt = AITool.objects.get(name='ChatGPT')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'tools.csv'
+            path.write_text(
+                'name,category,status,ferpa_compliant,recommended_use_cases,guidance.grading\n'
+                'ChatGPT,chatbot,not_recommended,no,writing;literature;qualitative;teaching,\n'
+                'Campus LLM,chatbot,approved,yes,grading,Use freely.\n'
+            )
+            dry = self.seed('--file', str(path), '--dry-run')
+            self.assertIn("status: 'approved' -> 'not_recommended'", dry)
+            self.assertFalse(AITool.objects.filter(name='Campus LLM').exists())
+            self.seed('--file', str(path))
+
+        chatgpt.refresh_from_db()
+        self.assertEqual(chatgpt.status, 'not_recommended')
+        entry = ChangeLogEntry.objects.filter(model='tool', object_id=chatgpt.id).latest('id')
+        self.assertEqual((entry.action, entry.data['status']), ('update', 'not_recommended'))
+        self.assertIn('grading', chatgpt.compliance_guidance)  # columns absent from the file are kept
+        campus = AITool.objects.get(name='Campus LLM')
+        self.assertEqual(campus.compliance_guidance, {'grading': 'Use freely.'})
+        self.assertTrue(campus.ferpa_compliant)
+        self.assertEqual(campus.compatibility.get(use_case='grading').verdict, 'recommended')
+        self.assertEqual([t['name'] for t in get_tool_catalog().filter(status='not_recommended')], ['ChatGPT'])
+
+    def test_invalid_rows_are_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'tools.json'
+            path.write_text(json.dumps([{'name': 'X', 'category': 'nope'}]))
+            with self.assertRaisesMessage(CommandError, 'invalid category'):
+                self.seed('--file', str(path))
+            path.write_text(json.dumps([{'name': 'X', 'category': 'chatbot', 'retains_data': 'yes'}]))
+            with self.assertRaisesMessage(CommandError, 'X: invalid retains_data'):
+                self.seed('--file', str(path))
+            path.write_text(json.dumps([{'name': 'X', 'category': 'chatbot', 'recommended_use_cases': 'grading'}]))
+            with self.assertRaisesMessage(CommandError, 'recommended_use_cases must be a list'):
+                self.seed('--file', str(path))
+
+
+class ToolSyncTest(TestCase):
+    """Tests for streaming catalog sync from a JSONL export."""
+
+    def setUp(self) -> None:
+        self.faculty = User.objects.create_user(username='sync@usf.edu', email='sync@usf.edu', password='testpass123')
+        UserProfile.objects.create(user=self.faculty, role='faculty')
+        self.client.login(username='sync@usf.edu', password='testpass123')
+        self.copilot = AITool.objects.create(name='Copilot', vendor='GitHub', category='code_assistant')
+
+    @staticmethod
+    def jsonl(*records: dict | str) -> bytes:
+        return '\n'.join(r if isinstance(r, str) else json.dumps(r, ensure_ascii=False) for r in records).encode()
+
+    def test_streams_batches_and_records_changes(self) -> None:
+        data = self.jsonl(
+            {'external_id': 'P-1', 'name': 'Copilot', 'vendor': 'GitHub', 'status': 'approved'},
+            {'external_id': 'P-2', 'name': 'Elicit', 'vendor': 'Ought', 'category': 'research', 'description': 'Résumé'},
+            'not json',
+            {'external_id': 'P-3', 'name': 'Mystery'},
+            {'external_id': 'P-2', 'name': 'Elicit', 'vendor': 'Ought', 'category': 'research', 'status': 'approved'},
+        )
+        # Chunks that split lines and multi-byte characters still decode
+        chunks = [data[i:i + 7] for i in range(0, len(data), 7)]
+        run = sync_tool_catalog(chunks, source='catalog.jsonl', batch_size=2)
+
+        self.assertEqual((run.records_read, run.created, run.updated, run.failed), (5, 1, 2, 2))
+        self.assertEqual(run.errors[0], 'Line 3: invalid JSON (Expecting value)')
+        self.assertIn('category is required', run.errors[1])
+        self.copilot.refresh_from_db()
+        self.assertEqual((self.copilot.external_id, self.copilot.status), ('P-1', 'approved'))
+        elicit = AITool.objects.get(external_id='P-2')
+        self.assertEqual((elicit.status, elicit.description), ('approved', 'Résumé'))
+        change = ToolSyncChange.objects.get(run=run, tool=self.copilot)
+        self.assertEqual(change.changes['status'], ['under_review', 'approved'])
+        feed = ChangeLogEntry.objects.filter(model='tool').order_by('object_id', 'id')
+        self.assertEqual(
+            [(e.object_id, e.action) for e in feed.filter(object_id__in=[self.copilot.id, elicit.id])],
+            [(self.copilot.id, 'create'), (self.copilot.id, 'update'), (elicit.id, 'create'), (elicit.id, 'update')],
+        )
+        self.assertEqual(feed.filter(object_id=self.copilot.id).last().data['status'], 'approved')
+        self.assertEqual(self.client.get('/api/tools', {'search': 'elic'}).json()[0]['name'], 'Elicit')
+
+        rerun = sync_tool_catalog([data], source='catalog.jsonl')
+        self.assertEqual((rerun.created, rerun.updated, rerun.unchanged), (0, 0, 2))
+
+    def test_bad_values_and_bytes_become_run_errors(self) -> None:
+        data = self.jsonl(
+            {'name': 'Elicit', 'vendor': 'Ought', 'category': 'research', 'retains_data': 'yes'},
+            {'name': 'Consensus', 'vendor': 'Consensus', 'category': 'research', 'hipaa_compliant': '1'},
+            {'name': 'Scite', 'vendor': 'Scite', 'category': 'research'},
+        )
+        upload = SimpleUploadedFile('feed.jsonl', b'{"name": "Bad \xff"}\n' + data)
+        response = self.client.post('/api/tools/sync', {'file': upload})
+        self.assertEqual(response.status_code, 201)
+        run = response.json()
+        self.assertEqual((run['created'], run['failed']), (2, 2))
+        self.assertEqual(run['errors'][0], 'Line 1: not valid UTF-8')
+        self.assertIn('Line 2: Elicit: invalid retains_data', run['errors'][1])
+        self.assertIsNotNone(run['finishedAt'])
+        self.assertTrue(AITool.objects.get(name='Consensus').hipaa_compliant)
+
+    def test_run_is_finished_when_a_batch_fails(self) -> None:
+        data = self.jsonl({'name': 'Elicit', 'vendor': 'Ought', 'category': 'research'})
+        with patch('api.services.tool_sync.apply_seed_plan', side_effect=RuntimeError('disk full')):
+            with self.assertRaises(RuntimeError):
+                sync_tool_catalog([data], source='catalog.jsonl')
+        self.assertIsNotNone(ToolSyncRun.objects.get(source='catalog.jsonl').finished_at)
+
+    def test_upload_api_and_run_history(self) -> None:
+        upload = SimpleUploadedFile('feed.jsonl', self.jsonl(
+            {'name': 'Copilot', 'vendor': 'GitHub', 'ferpa_compliant': True},
+        ))
+        response = self.client.post('/api/tools/sync', {'file': upload, 'dry_run': 'true'})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()['updated'], 1)
+        self.copilot.refresh_from_db()
+        self.assertFalse(self.copilot.ferpa_compliant)
+
+        runs = self.client.get('/api/tools/sync/runs').json()
+        self.assertEqual([r['source'] for r in runs], ['feed.jsonl'])
+        detail = self.client.get(f'/api/tools/sync/runs/{runs[0]["id"]}').json()
+        self.assertEqual(detail['changes'], [])
+
+    def test_sync_is_faculty_only(self) -> None:
+        User.objects.create_user(username='s@usf.edu', password='testpass123')
+        self.client.login(username='s@usf.edu', password='testpass123')
+        self.assertEqual(self.client.get('/api/tools/sync/runs').status_code, 403)
+
+
+class ToolRiskTest(TestCase):
+    """Tests for stored risk scores, risk sorting and bulk scoring."""
+
+    def setUp(self) -> None:
+        User.objects.create_user(username='risk@usf.edu', email='risk@usf.edu', password='testpass123')
+        self.client.login(username='risk@usf.edu', password='testpass123')
+        self.local = AITool.objects.create(
+            name='Local LLM', category='chatbot', status='approved', retains_data=False, sends_to_third_party=False,
+            ferpa_compliant=True, compliance_guidance={'grading': 'Runs on campus hardware.'},
+        )
+        self.chatgpt = AITool.objects.create(name='ChatGPT', category='chatbot', status='approved')
+        self.beta = AITool.objects.create(name='Beta Grader', category='grading', status='under_review',
+                                          has_enterprise_plan=True)
+
+    def test_scores_are_stored_and_refreshed_on_save(self) -> None:
+        self.assertEqual((self.local.risk_score, self.chatgpt.risk_score, self.beta.risk_score), (0, 40, 45))
+        self.chatgpt.status = 'not_recommended'
+        self.chatgpt.save()
+        self.chatgpt.refresh_from_db()
+        self.assertEqual(self.chatgpt.risk_score, 80)
+        row = self.chatgpt.compatibility.get(use_case='grading')
+        self.assertEqual(row.risk_score, 100)
+        self.assertIn('Not FERPA compliant; required for grading', row.risk_factors)
+
+    def test_list_sorts_and_filters_by_risk(self) -> None:
+        def names(**params) -> list[str]:
+            return [t['name'] for t in self.client.get('/api/tools', params).json()]
+
+        self.assertEqual(names(sort='-risk'), ['Beta Grader', 'ChatGPT', 'Local LLM'])
+        self.assertEqual(names(risk_level='medium'), ['Beta Grader', 'ChatGPT'])
+        self.assertEqual(names(max_risk='40', sort='risk'), ['Local LLM', 'ChatGPT'])
+        tools = self.client.get('/api/tools', {'risk_level': 'low'}).json()
+        self.assertEqual(tools[0]['riskLevel'], 'low')
+
+    def test_bulk_scoring_for_a_use_case(self) -> None:
+        with self.assertNumQueries(3):
+            response = self.client.post('/api/tools/risk', {'use_case': 'grading'}, content_type='application/json')
+        scores = response.json()['tools']
+        self.assertEqual([s['name'] for s in scores], ['Local LLM', 'ChatGPT', 'Beta Grader'])
+        self.assertEqual([s['riskLevel'] for s in scores], ['low', 'high', 'high'])
+
+        # A use case no tool lists is scored on the fly
+        response = self.client.post('/api/tools/risk', {'use_case': 'podcasting', 'tool_ids': [self.local.id]},
+                                    content_type='application/json')
+        self.assertEqual(response.json()['tools'][0]['riskFactors'], ['No compliance guidance for podcasting'])
+        response = self.client.post('/api/tools/risk', {'use_case': 'grading', 'tool_ids': 'all'},
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+
+
+@override_settings(BACKGROUND_TASK_RUNNER='api.services.background.ImmediateTaskRunner')
+class ToolRiskPropagationTest(TestCase):
+    """Tests for flagging projects and notifying members when a tool is not recommended."""
+
+    def setUp(self) -> None:
+        get_task_runner.cache_clear()
+        self.addCleanup(get_task_runner.cache_clear)
+        self.faculty = User.objects.create_user(username='prop@usf.edu', email='prop@usf.edu', password='testpass123')
+        UserProfile.objects.create(user=self.faculty, role='faculty')
+        self.owner = User.objects.create_user(username='owner@usf.edu', email='owner@usf.edu', password='testpass123')
+        self.client.login(username='prop@usf.edu', password='testpass123')
+
+        self.tool = AITool.objects.create(name='ChatGPT', category='chatbot', status='approved')
+        self.banned = AITool.objects.create(name='Banned Bot', category='chatbot', status='not_recommended')
+        self.advised = Project.objects.create(user=self.owner, faculty_advisor=self.faculty, name='Advised',
+                                              ai_use_case='writing')
+        self.solo = Project.objects.create(user=self.owner, name='Solo', ai_use_case='writing')
+        self.tool.projects.add(self.advised, self.solo)
+        self.solo.ai_tools.add(self.banned)
+
+    def set_status(self, tool_status: str) -> None:
+        sent = Notification.objects.count()
+        with self.captureOnCommitCallbacks() as callbacks:
+            response = self.client.put(f'/api/tools/{self.tool.id}', {'status': tool_status},
+                                       content_type='application/json')
+            self.assertEqual(response.status_code, 200)
+        # Nothing was propagated during the request; tasks wait for commit
+        self.assertEqual(Notification.objects.count(), sent)
+        for callback in callbacks:
+            callback()
+
+    def flags(self) -> tuple[bool, bool]:
+        return tuple(Project.objects.filter(id__in=[self.advised.id, self.solo.id]).order_by('name')
+                     .values_list('tool_risk_flag', flat=True))
+
+    def test_not_recommended_flags_projects_and_notifies(self) -> None:
+        self.assertEqual(self.flags(), (False, True))  # Solo already uses Banned Bot
+        self.set_status('not_recommended')
+        self.assertEqual(self.flags(), (True, True))
+        # Owner of both projects, advisor of one
+        self.assertEqual(Notification.objects.filter(tool=self.tool).count(), 3)
+        self.assertEqual(self.client.get('/api/notifications').json()['unreadCount'], 1)
+        self.client.post('/api/notifications/read', {}, content_type='application/json')
+        self.assertEqual(self.client.get('/api/notifications').json()['unreadCount'], 0)
+
+    def test_restoring_status_keeps_flags_from_other_tools(self) -> None:
+        self.set_status('not_recommended')
+        self.set_status('approved')
+        self.assertEqual(self.flags(), (False, True))
+        # Saving without a status change sends nothing new
+        self.set_status('not_recommended')
+        self.set_status('not_recommended')
+        self.assertEqual(Notification.objects.filter(tool=self.tool).count(), 6)
+
+    def test_project_tool_changes_refresh_the_flag(self) -> None:
+        self.solo.ai_tools.remove(self.banned)
+        self.assertEqual(self.flags(), (False, False))
+        self.advised.ai_tools.add(self.banned)
+        self.assertEqual(self.flags(), (True, False))
+        self.client.force_login(self.owner)
+        projects = {p['name']: p for p in self.client.get('/api/projects').json()}
+        self.assertTrue(projects['Advised']['toolRiskFlag'])
+
+    def test_seeded_status_change_propagates(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'tools.json'
+            path.write_text(json.dumps([{'name': 'ChatGPT', 'status': 'not_recommended'}]))
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command('seed_tools', '--file', str(path), stdout=StringIO())
+        self.assertEqual(self.flags(), (True, True))
+        self.assertEqual(Notification.objects.filter(tool=self.tool).count(), 3)
+
+    def test_deleting_a_tool_clears_its_flags(self) -> None:
+        self.banned.delete()
+        self.assertEqual(self.flags(), (False, False))
+
+    def test_thread_pool_runner_runs_tasks_off_the_request_thread(self) -> None:
+        ran_on: list[str] = []
+        done = threading.Event()
+
+        def task() -> None:
+            ran_on.append(threading.current_thread().name)
+            done.set()
+
+        ThreadPoolTaskRunner().submit(task)
+        self.assertTrue(done.wait(5))
+        self.assertTrue(ran_on[0].startswith('raise-task'))
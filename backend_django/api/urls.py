@@ -2,14 +2,20 @@ from django.urls import path
 
 from .views.auth import register, login_view, logout_view, me
 from .views.projects import project_list_create, project_detail, checkpoint_toggle, decision_create
-from .views.tools import ai_tool_list_create, ai_tool_update, ai_tool_detail
+from .views.tools import (
+    ai_tool_list_create, ai_tool_matrix, ai_tool_risk, ai_tool_update, ai_tool_detail,
+    ai_tool_sync, ai_tool_sync_runs, ai_tool_sync_run_detail,
+)
 from .views.dashboard import dashboard_stats
 from .views.comments import checkpoint_comments
-from .views.ethics import ethics_start, ethics_node, ethics_evaluate, ethics_scenarios
-from .views.templates import template_list, template_detail, document_generate
+from .views.ethics import ethics_start, ethics_node, ethics_bundle, ethics_evaluate, ethics_scenarios
+from .views.templates import template_list, template_detail, document_generate, document_generate_batch
 from .views.assessment import assessment_questions, assessment_submit
 from .views.research import submit_consent, start_session, record_response, complete_session
-from .views.export import project_export
+from .views.export import project_export, compliance_export
+from .views.changes import change_feed
+from .views.events import project_events
+from .views.notifications import notification_list, notifications_mark_read
 from .views.verification import scan_file_for_pii, classify_data
 
 urlpatterns = [
@@ -25,12 +31,24 @@ urlpatterns = [
     path('projects/<int:project_id>/checkpoints/<str:checkpoint_id>', checkpoint_toggle, name='checkpoint-toggle'),
     path('projects/<int:project_id>/decisions', decision_create, name='decision-create'),
     path('projects/<int:project_id>/export', project_export, name='project-export'),
+    path('projects/<int:project_id>/events', project_events, name='project-events'),
+
+    # Institution-wide compliance export (admins)
+    path('export/compliance', compliance_export, name='compliance-export'),
+
+    # Incremental change feed for sync clients
+    path('changes', change_feed, name='change-feed'),
 
     # Dashboard endpoint
     path('dashboard/stats', dashboard_stats, name='dashboard-stats'),
 
     # AI Tool Registry endpoints
     path('tools', ai_tool_list_create, name='tool-list-create'),
+    path('tools/matrix', ai_tool_matrix, name='tool-matrix'),
+    path('tools/risk', ai_tool_risk, name='tool-risk'),
+    path('tools/sync', ai_tool_sync, name='tool-sync'),
+    path('tools/sync/runs', ai_tool_sync_runs, name='tool-sync-runs'),
+    path('tools/sync/runs/<int:run_id>', ai_tool_sync_run_detail, name='tool-sync-run-detail'),
     path('tools/<int:tool_id>', ai_tool_update, name='tool-update'),
     path('tools/<int:tool_id>/detail', ai_tool_detail, name='tool-detail'),
 
@@ -49,6 +67,7 @@ urlpatterns = [
     # Ethics Assistant endpoints
     path('ethics/start', ethics_start, name='ethics-start'),
     path('ethics/node/<str:node_key>', ethics_node, name='ethics-node'),
+    path('ethics/bundle', ethics_bundle, name='ethics-bundle'),
     path('ethics/evaluate', ethics_evaluate, name='ethics-evaluate'),
     path('ethics/scenarios', ethics_scenarios, name='ethics-scenarios'),
 
@@ -56,6 +75,7 @@ urlpatterns = [
     path('templates', template_list, name='template-list'),
     path('templates/<str:template_key>', template_detail, name='template-detail'),
     path('documents/generate', document_generate, name='document-generate'),
+    path('documents/generate/batch', document_generate_batch, name='document-generate-batch'),
 
     # Template/Document aliases (frontend uses these paths)
     path('ethics/templates', template_list, name='template-list-alias'),
@@ -69,4 +89,8 @@ urlpatterns = [
     # Assessment endpoints
     path('assessment/questions', assessment_questions, name='assessment-questions'),
     path('assessment/submit', assessment_submit, name='assessment-submit'),
+
+    # Notifications
+    path('notifications', notification_list, name='notification-list'),
+    path('notifications/read', notifications_mark_read, name='notifications-read'),
 ]
@@ -1,13 +1,19 @@
 from .auth import register, login_view, logout_view, me
 from .projects import project_list_create, project_detail, checkpoint_toggle, decision_create
-from .tools import ai_tool_list_create, ai_tool_update, ai_tool_detail
+from .tools import (
+    ai_tool_list_create, ai_tool_matrix, ai_tool_risk, ai_tool_update, ai_tool_detail,
+    ai_tool_sync, ai_tool_sync_runs, ai_tool_sync_run_detail,
+)
 from .dashboard import dashboard_stats
 from .comments import checkpoint_comments
-from .ethics import ethics_start, ethics_node, ethics_evaluate, ethics_scenarios
-from .templates import template_list, template_detail, document_generate
+from .ethics import ethics_start, ethics_node, ethics_bundle, ethics_evaluate, ethics_scenarios
+from .templates import template_list, template_detail, document_generate, document_generate_batch
 from .assessment import assessment_questions, assessment_submit
 from .research import submit_consent, start_session, record_response, complete_session
-from .export import project_export
+from .export import project_export, compliance_export
+from .changes import change_feed
+from .events import project_events
+from .notifications import notification_list, notifications_mark_read
 
 __all__ = [
     # Auth
@@ -22,7 +28,12 @@ __all__ = [
     'decision_create',
     # Tools
     'ai_tool_list_create',
+    'ai_tool_matrix',
+    'ai_tool_risk',
     'ai_tool_update',
+    'ai_tool_sync',
+    'ai_tool_sync_runs',
+    'ai_tool_sync_run_detail',
     # Dashboard
     'dashboard_stats',
     # Comments
@@ -30,12 +41,14 @@ __all__ = [
     # Ethics
     'ethics_start',
     'ethics_node',
+    'ethics_bundle',
     'ethics_evaluate',
     'ethics_scenarios',
     # Templates
     'template_list',
     'template_detail',
     'document_generate',
+    'document_generate_batch',
     # Assessment
     'assessment_questions',
     'assessment_submit',
@@ -46,4 +59,11 @@ __all__ = [
     'complete_session',
     # Export
     'project_export',
+    'compliance_export',
+    # Sync
+    'change_feed',
+    'project_events',
+    # Notifications
+    'notification_list',
+    'notifications_mark_read',
 ]
@@ -0,0 +1,40 @@
+from rest_framework.decorators import api_view
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+
+from api.services.change_feed import (
+    CHANGES_PAGE_SIZE,
+    MAX_CHANGES_PAGE_SIZE,
+    changes_since,
+    serialize_change,
+)
+from .export import is_compliance_admin
+
+
+@api_view(['GET'])
+def change_feed(request: Request) -> Response:
+    """Changes after a cursor, for clients that sync incrementally.
+
+    Start with ``since=0`` and pass the returned ``cursor`` back on the next
+    poll; keep paging while ``hasMore`` is true. Staff see every change;
+    other users see changes to projects they were members of at the time
+    (including the change that removed them) plus the tool registry.
+    """
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    try:
+        since = int(request.query_params.get('since', 0))
+        limit = int(request.query_params.get('limit', CHANGES_PAGE_SIZE))
+    except ValueError:
+        return Response({"error": "since and limit must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+    limit = max(1, min(limit, MAX_CHANGES_PAGE_SIZE))
+
+    user_id = None if is_compliance_admin(request.user) else request.user.id
+    entries, has_more, cursor = changes_since(since, limit, user_id)
+    return Response({
+        'changes': [serialize_change(e) for e in entries],
+        'cursor': cursor,
+        'hasMore': has_more,
+    })
@@ -4,6 +4,7 @@ from rest_framework.response import Response
 from rest_framework import status
 
 from api.models import Project, Checkpoint, CheckpointComment
+from api.services.events import publish_project_event
 
 
 @api_view(['GET', 'POST'])
@@ -53,10 +54,12 @@ def checkpoint_comments(request: Request, project_id: int, checkpoint_id: str) -
     if hasattr(request.user, 'profile'):
         user_role = request.user.profile.role
 
-    return Response({
+    result = {
         'id': comment.id,
         'text': comment.text,
         'userName': request.user.first_name or request.user.email,
         'userRole': user_role,
         'createdAt': comment.created_at.isoformat(),
-    }, status=status.HTTP_201_CREATED)
+    }
+    publish_project_event(project.id, 'comment', {'checkpoint': checkpoint.checkpoint_id, 'comment': result})
+    return Response(result, status=status.HTTP_201_CREATED)
@@ -1,62 +1,84 @@
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
-from django.db.models import Count
+from django.db.models import Q, QuerySet
+from django.http import HttpRequest, HttpResponse
 
-from django.db.models import Q
+from api.async_dispatch import json_response, with_async
+from api.models import Project, Decision, UserProfile
+from api.services.tool_catalog import ToolCatalog, get_tool_catalog, project_counts
 
-from api.models import Project, Decision, AITool, UserProfile
+CRITICAL_CHECKPOINTS = {
+    'irb', 'data_deidentified', 'participant_consent',
+    'ferpa_compliance', 'grading_fairness', 'decision_impact',
+}
+MEDIUM_CHECKPOINTS = {
+    'bias_audit', 'human_review', 'ai_disclosure',
+    'human_override', 'admin_bias_audit', 'content_accuracy',
+}
 
 
-@api_view(['GET'])
-def dashboard_stats(request: Request) -> Response:
-    """Personalized dashboard stats filtered by role and scope."""
-    if not request.user.is_authenticated:
-        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
-
-    profile, _ = UserProfile.objects.get_or_create(user=request.user, defaults={'role': 'student'})
-    scope = request.query_params.get('scope', 'mine')
-
+def _dashboard_querysets(user, role: str, scope: str) -> tuple[QuerySet[Project], QuerySet[Decision]]:
     # Students see own + where they're involved. Faculty can toggle scope.
-    if profile.role == 'student' or scope == 'mine':
+    if role == 'student' or scope == 'mine':
         projects_qs = Project.objects.filter(
-            Q(user=request.user) | Q(faculty_advisor=request.user) | Q(student_collaborator=request.user)
+            Q(user=user) | Q(faculty_advisor=user) | Q(student_collaborator=user)
         ).distinct()
         decisions_qs = Decision.objects.filter(
-            Q(project__user=request.user) | Q(project__faculty_advisor=request.user) | Q(project__student_collaborator=request.user)
+            Q(project__user=user) | Q(project__faculty_advisor=user) | Q(project__student_collaborator=user)
         ).distinct()
     else:
         projects_qs = Project.objects.all()
         decisions_qs = Decision.objects.all()
 
-    projects_qs = projects_qs.select_related('user').prefetch_related('checkpoints', 'decisions')
-    total_activities = projects_qs.count()
+    projects_qs = projects_qs.select_related('user').prefetch_related('checkpoints')
+    decisions_qs = decisions_qs.select_related('project__user', 'checkpoint__definition').order_by('-logged_at')[:10]
+    return projects_qs, decisions_qs
 
+
+def _tool_stats(catalog: ToolCatalog, counts: dict[int, int]) -> dict[str, Any]:
+    """Registry totals and the five most used tools, from the tool catalog and project counts."""
+    used = [t for t in catalog.filter() if counts.get(t['id'])]
+    most_used = sorted(used, key=lambda t: counts[t['id']], reverse=True)[:5]
+    return {
+        'total': len(catalog.tools),
+        'byStatus': {
+            tool_status: len(catalog.by_status.get(tool_status, []))
+            for tool_status in ('approved', 'under_review', 'not_recommended')
+        },
+        'mostUsed': [
+            {'id': t['id'], 'name': t['name'], 'category': t['category'], 'count': counts[t['id']]}
+            for t in most_used
+        ],
+    }
+
+
+def _build_stats(
+    user,
+    profile: UserProfile,
+    scope: str,
+    projects: list[Project],
+    recent_decisions: list[Decision],
+    tool_stats: dict[str, Any],
+) -> dict[str, Any]:
+    """Assemble the dashboard payload from already-fetched rows."""
     activities: list[dict[str, Any]] = []
     risk_counts: dict[str, int] = {'high': 0, 'medium': 0, 'low': 0}
     total_compliance = 0
 
-    critical_ids = {
-        'irb', 'data_deidentified', 'participant_consent',
-        'ferpa_compliance', 'grading_fairness', 'decision_impact',
-    }
-    medium_ids = {
-        'bias_audit', 'human_review', 'ai_disclosure',
-        'human_override', 'admin_bias_audit', 'content_accuracy',
-    }
-
-    for p in projects_qs:
+    for p in projects:
         cps = list(p.checkpoints.all())
         total_cp = len(cps)
         done_cp = sum(1 for c in cps if c.completed)
         pct = round((done_cp / total_cp) * 100) if total_cp > 0 else 0
         total_compliance += pct
 
-        incomplete_critical = [c for c in cps if not c.completed and c.checkpoint_id in critical_ids]
-        incomplete_medium = [c for c in cps if not c.completed and c.checkpoint_id in medium_ids]
+        incomplete_critical = [c for c in cps if not c.completed and c.checkpoint_id in CRITICAL_CHECKPOINTS]
+        incomplete_medium = [c for c in cps if not c.completed and c.checkpoint_id in MEDIUM_CHECKPOINTS]
 
         if incomplete_critical:
             risk = 'high'
@@ -79,34 +101,18 @@ def dashboard_stats(request: Request) -> Response:
             'checkpointsTotal': total_cp,
         })
 
+    total_activities = len(projects)
     avg_compliance = round(total_compliance / total_activities) if total_activities > 0 else 0
 
-    recent_decisions = decisions_qs.select_related('project', 'checkpoint').order_by('-logged_at')[:10]
     recent_feed = [{
         'activityName': d.project.name,
-        'checkpoint': d.checkpoint.label,
+        'checkpoint': d.checkpoint.definition.label,
         'description': d.description,
         'loggedAt': d.logged_at.isoformat(),
         'owner': d.project.user.first_name or d.project.user.email,
     } for d in recent_decisions]
 
-    # Tool stats
-    tool_stats: dict[str, Any] = {
-        'total': AITool.objects.count(),
-        'byStatus': {
-            'approved': AITool.objects.filter(status='approved').count(),
-            'under_review': AITool.objects.filter(status='under_review').count(),
-            'not_recommended': AITool.objects.filter(status='not_recommended').count(),
-        },
-        'mostUsed': [
-            {'id': t.id, 'name': t.name, 'category': t.category, 'count': t.usage_count}
-            for t in AITool.objects.annotate(
-                usage_count=Count('projects')
-            ).filter(usage_count__gt=0).order_by('-usage_count')[:5]
-        ],
-    }
-
-    return Response({
+    return {
         'totalActivities': total_activities,
         'avgCompliance': avg_compliance,
         'riskBreakdown': risk_counts,
@@ -115,5 +121,43 @@ def dashboard_stats(request: Request) -> Response:
         'toolStats': tool_stats,
         'scope': scope,
         'userRole': profile.role,
-        'userName': request.user.first_name or request.user.email,
-    })
+        'userName': user.first_name or user.email,
+    }
+
+
+async def dashboard_stats_async(request: HttpRequest) -> HttpResponse:
+    """GET /api/dashboard/stats on the async ORM (ASGI mode)."""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return json_response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    profile, _ = await UserProfile.objects.aget_or_create(user=user, defaults={'role': 'student'})
+    scope = request.GET.get('scope', 'mine')
+    projects_qs, decisions_qs = _dashboard_querysets(user, profile.role, scope)
+
+    stats = _build_stats(
+        user, profile, scope,
+        projects=[p async for p in projects_qs],
+        recent_decisions=[d async for d in decisions_qs],
+        tool_stats=_tool_stats(await sync_to_async(get_tool_catalog)(), await sync_to_async(project_counts)()),
+    )
+    return json_response(stats)
+
+
+@with_async(dashboard_stats_async)
+@api_view(['GET'])
+def dashboard_stats(request: Request) -> Response:
+    """Personalized dashboard stats filtered by role and scope."""
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    profile, _ = UserProfile.objects.get_or_create(user=request.user, defaults={'role': 'student'})
+    scope = request.query_params.get('scope', 'mine')
+    projects_qs, decisions_qs = _dashboard_querysets(request.user, profile.role, scope)
+
+    return Response(_build_stats(
+        request.user, profile, scope,
+        projects=list(projects_qs),
+        recent_decisions=list(decisions_qs),
+        tool_stats=_tool_stats(get_tool_catalog(), project_counts()),
+    ))
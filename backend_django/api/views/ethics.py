@@ -1,45 +1,113 @@
+import json
 from typing import Any
 
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
+from django.http import HttpRequest, HttpResponse
 
+from api.async_dispatch import json_response, with_async
+from api.prerendered import PrerenderedPayload, prerendered_response
 from api.services.ethics_engine import (
-    get_decision_node,
-    process_decision_path,
+    DECISION_TREE,
+    build_decision_bundle,
+    evaluate_decision_path_json,
     RESEARCH_SCENARIOS,
 )
 
+# Rendered once per process; the tree and scenarios only change on deploy
+NODE_PAYLOADS: dict[str, PrerenderedPayload] = {
+    key: PrerenderedPayload.from_data({"key": key, **node}) for key, node in DECISION_TREE.items()
+}
+SCENARIOS_PAYLOAD = PrerenderedPayload.from_data(RESEARCH_SCENARIOS)
+DECISION_BUNDLE = build_decision_bundle()
+BUNDLE_PAYLOAD = PrerenderedPayload.from_data(DECISION_BUNDLE, version=DECISION_BUNDLE["version"])
 
+
+# The ethics endpoints read only module-level data, so in ASGI mode they
+# are served straight from the event loop.
+
+async def ethics_start_async(request: HttpRequest) -> HttpResponse:
+    return prerendered_response(request, NODE_PAYLOADS["start"])
+
+
+async def ethics_node_async(request: HttpRequest, node_key: str) -> HttpResponse:
+    payload = NODE_PAYLOADS.get(node_key)
+    if not payload:
+        return json_response({"error": "Node not found"}, status=status.HTTP_404_NOT_FOUND)
+    return prerendered_response(request, payload)
+
+
+async def ethics_bundle_async(request: HttpRequest) -> HttpResponse:
+    return prerendered_response(request, BUNDLE_PAYLOAD)
+
+
+async def ethics_evaluate_async(request: HttpRequest) -> HttpResponse:
+    try:
+        body = json.loads(request.body or b'{}')
+    except ValueError:
+        return json_response({"error": "Invalid JSON"}, status=status.HTTP_400_BAD_REQUEST)
+    answers = body.get('answers', {}) if isinstance(body, dict) else None
+    if not isinstance(answers, dict):
+        return json_response({"error": "answers must be an object"}, status=status.HTTP_400_BAD_REQUEST)
+    return HttpResponse(evaluate_decision_path_json(answers), content_type='application/json')
+
+
+async def ethics_scenarios_async(request: HttpRequest) -> HttpResponse:
+    return prerendered_response(request, SCENARIOS_PAYLOAD)
+
+
+@with_async(ethics_start_async)
 @api_view(['GET'])
-def ethics_start(request: Request) -> Response:
+def ethics_start(request: Request) -> HttpResponse:
     """Get the starting node of the decision tree."""
-    node = get_decision_node("start")
-    return Response({"key": "start", **node})
+    return prerendered_response(request, NODE_PAYLOADS["start"])
 
 
+@with_async(ethics_node_async)
 @api_view(['GET'])
-def ethics_node(request: Request, node_key: str) -> Response:
+def ethics_node(request: Request, node_key: str) -> HttpResponse | Response:
     """Get a specific node in the decision tree."""
-    node = get_decision_node(node_key)
-    if not node:
+    payload = NODE_PAYLOADS.get(node_key)
+    if not payload:
         return Response(
             {"error": "Node not found"},
             status=status.HTTP_404_NOT_FOUND
         )
-    return Response({"key": node_key, **node})
+    return prerendered_response(request, payload)
+
+
+@with_async(ethics_bundle_async)
+@api_view(['GET'])
+def ethics_bundle(request: Request) -> HttpResponse:
+    """Get the full decision tree, terminal results and template metadata.
 
+    The ETag is the bundle version, so a client holding the current copy
+    gets a 304 when it sends If-None-Match.
+    """
+    return prerendered_response(request, BUNDLE_PAYLOAD)
 
+
+@with_async(ethics_evaluate_async, methods=('POST',))
 @api_view(['POST'])
-def ethics_evaluate(request: Request) -> Response:
-    """Evaluate the complete decision path and return results."""
+def ethics_evaluate(request: Request) -> HttpResponse | Response:
+    """Evaluate the complete decision path and return results.
+
+    Results come pre-rendered from the evaluation cache, so this skips
+    DRF's renderer and returns the JSON bytes directly.
+    """
     answers: dict[str, Any] = request.data.get('answers', {})
-    result = process_decision_path(answers)
-    return Response(result)
+    if not isinstance(answers, dict):
+        return Response(
+            {"error": "answers must be an object"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return HttpResponse(evaluate_decision_path_json(answers), content_type='application/json')
 
 
+@with_async(ethics_scenarios_async)
 @api_view(['GET'])
-def ethics_scenarios(request: Request) -> Response:
+def ethics_scenarios(request: Request) -> HttpResponse:
     """Get all available research scenarios."""
-    return Response(RESEARCH_SCENARIOS)
+    return prerendered_response(request, SCENARIOS_PAYLOAD)
@@ -0,0 +1,56 @@
+import asyncio
+from collections.abc import AsyncIterator
+
+from asgiref.sync import sync_to_async
+from django.core.handlers.asgi import ASGIRequest
+from django.db.models import Q
+from django.http import HttpRequest, JsonResponse, StreamingHttpResponse
+
+from api.models import Project
+from api.services.events import KEEPALIVE_SECONDS, RESYNC_FRAME, get_broker
+
+
+async def _event_stream(project_id: int) -> AsyncIterator[bytes]:
+    broker = get_broker()
+    subscription = broker.subscribe(project_id)
+    try:
+        yield b'retry: 5000\n\n'
+        while True:
+            try:
+                frame = await asyncio.wait_for(subscription.queue.get(), KEEPALIVE_SECONDS)
+            except asyncio.TimeoutError:
+                yield b': keepalive\n\n'
+                continue
+            yield frame
+            if frame is RESYNC_FRAME:
+                return
+    finally:
+        broker.unsubscribe(subscription)
+
+
+async def project_events(request: HttpRequest, project_id: int) -> StreamingHttpResponse | JsonResponse:
+    """Server-sent events for one project: checkpoint, decision and comment.
+
+    Plain async Django view rather than a DRF one, since DRF views cannot
+    hold a response open. Needs the ASGI server; under WSGI every stream
+    would pin a worker thread, so the endpoint refuses instead.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return JsonResponse({"error": "Not logged in"}, status=401)
+
+    has_access = await sync_to_async(
+        Project.objects.filter(
+            Q(user=user) | Q(faculty_advisor=user) | Q(student_collaborator=user), id=project_id
+        ).exists
+    )()
+    if not has_access:
+        return JsonResponse({"error": "Activity not found"}, status=404)
+
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse({"error": "Live updates need the ASGI server"}, status=501)
+
+    response = StreamingHttpResponse(_event_stream(project_id), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'  # stop nginx from buffering the stream
+    return response
@@ -1,18 +1,40 @@
-import csv
-import io
+import datetime
 
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
-from django.http import HttpResponse
+from django.http import StreamingHttpResponse
+from django.utils.dateparse import parse_date
 
 from api.models import Project
+from api.services.compliance_export import (
+    filter_export_projects,
+    stream_bulk_export,
+    stream_project_export,
+)
+from api.services.export_formats import EXPORT_FORMATS, ExportFormat
+
+
+def _export_format(request: Request) -> ExportFormat | Response:
+    """The format picked by ``?output=`` (default csv), or an error response."""
+    name = request.query_params.get('output', 'csv')
+    export_format = EXPORT_FORMATS.get(name)
+    if export_format is None:
+        return Response(
+            {"error": f"output must be one of: {', '.join(EXPORT_FORMATS)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+    return export_format
 
 
 @api_view(['GET'])
-def project_export(request: Request, project_id: int) -> HttpResponse | Response:
-    """Export a project compliance report as CSV."""
+def project_export(request: Request, project_id: int) -> StreamingHttpResponse | Response:
+    """Export a project compliance report, streamed row by row.
+
+    ``?output=`` picks the format: csv (default), csv.gz, csv.zst, jsonl,
+    jsonl.gz, jsonl.zst or parquet.
+    """
     if not request.user.is_authenticated:
         return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
 
@@ -21,35 +43,72 @@ def project_export(request: Request, project_id: int) -> HttpResponse | Response
     except Project.DoesNotExist:
         return Response({"error": "Project not found"}, status=status.HTTP_404_NOT_FOUND)
 
-    output = io.StringIO()
-    writer = csv.writer(output)
-
-    # Header row
-    writer.writerow([
-        'checkpoint_id', 'label', 'category', 'assigned_to',
-        'completed', 'completed_at',
-        'decision_description', 'decision_notes', 'proof_type', 'proof_value', 'logged_at'
-    ])
-
-    # One row per checkpoint; decisions are repeated per checkpoint
-    for cp in project.checkpoints.all().order_by('id'):
-        decisions = project.decisions.filter(checkpoint=cp).order_by('logged_at')
-        if decisions.exists():
-            for d in decisions:
-                writer.writerow([
-                    cp.checkpoint_id, cp.label, cp.category, cp.assigned_to,
-                    cp.completed, cp.completed_at.isoformat() if cp.completed_at else '',
-                    d.description, d.notes or '', d.proof_type or '', d.proof_value or '',
-                    d.logged_at.isoformat(),
-                ])
-        else:
-            writer.writerow([
-                cp.checkpoint_id, cp.label, cp.category, cp.assigned_to,
-                cp.completed, cp.completed_at.isoformat() if cp.completed_at else '',
-                '', '', '', '', '',
-            ])
-
-    filename = f"{project.name.replace(' ', '_')}_compliance.csv"
-    response = HttpResponse(output.getvalue(), content_type='text/csv')
+    export_format = _export_format(request)
+    if isinstance(export_format, Response):
+        return export_format
+
+    filename = f"{project.name.replace(' ', '_')}_compliance.{export_format.name}"
+    response = StreamingHttpResponse(
+        stream_project_export(project, export_format),
+        content_type=export_format.content_type,
+    )
     response['Content-Disposition'] = f'attachment; filename="{filename}"'
     return response
+
+
+def is_compliance_admin(user) -> bool:
+    """Staff accounts only.
+
+    Not the profile role: users pick that themselves when they register.
+    """
+    return user.is_active and user.is_staff
+
+
+def _parse_date_param(request: Request, name: str) -> datetime.date | None:
+    value = request.query_params.get(name)
+    if not value:
+        return None
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise ValueError(f"{name} must be a date (YYYY-MM-DD)")
+    return parsed
+
+
+@api_view(['GET'])
+def compliance_export(request: Request) -> StreamingHttpResponse | Response:
+    """Export every project's checkpoints and decisions for institutional audits.
+
+    Filters: ``use_case``, ``department``, ``created_after`` and
+    ``created_before`` (inclusive dates). ``?output=`` takes the same
+    formats as project_export; JSON Lines gives one nested record per
+    project. Admins only.
+    """
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+    if not is_compliance_admin(request.user):
+        return Response({"error": "Admin access required"}, status=status.HTTP_403_FORBIDDEN)
+
+    export_format = _export_format(request)
+    if isinstance(export_format, Response):
+        return export_format
+    try:
+        created_after = _parse_date_param(request, 'created_after')
+        created_before = _parse_date_param(request, 'created_before')
+    except ValueError as exc:
+        return Response({"error": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+    projects = filter_export_projects(
+        use_case=request.query_params.get('use_case'),
+        created_after=created_after,
+        created_before=created_before,
+        department=request.query_params.get('department'),
+    )
+    response = StreamingHttpResponse(
+        stream_bulk_export(projects, export_format),
+        content_type=export_format.content_type,
+    )
+    response['Content-Disposition'] = f'attachment; filename="compliance_export.{export_format.name}"'
+    return response
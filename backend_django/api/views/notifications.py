@@ -0,0 +1,55 @@
+from typing import Any
+
+from rest_framework.decorators import api_view
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework import status
+from django.utils import timezone
+
+from api.models import Notification
+
+NOTIFICATION_LIMIT = 50
+
+
+def serialize_notification(notification: Notification) -> dict[str, Any]:
+    return {
+        'id': notification.id,
+        'kind': notification.kind,
+        'message': notification.message,
+        'projectId': str(notification.project_id) if notification.project_id else None,
+        'toolId': notification.tool_id,
+        'createdAt': notification.created_at.isoformat(),
+        'readAt': notification.read_at.isoformat() if notification.read_at else None,
+    }
+
+
+@api_view(['GET'])
+def notification_list(request: Request) -> Response:
+    """The user's latest notifications and unread count; ``unread=true`` for unread only."""
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    notifications = Notification.objects.filter(user=request.user)
+    unread_count = notifications.filter(read_at__isnull=True).count()
+    if request.query_params.get('unread') == 'true':
+        notifications = notifications.filter(read_at__isnull=True)
+    return Response({
+        'unreadCount': unread_count,
+        'notifications': [serialize_notification(n) for n in notifications[:NOTIFICATION_LIMIT]],
+    })
+
+
+@api_view(['POST'])
+def notifications_mark_read(request: Request) -> Response:
+    """Mark the given notification ``ids`` read, or all of them when none are given."""
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    ids = request.data.get('ids')
+    unread = Notification.objects.filter(user=request.user, read_at__isnull=True)
+    if ids is not None:
+        if not isinstance(ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in ids):
+            return Response({"error": "ids must be a list of notification ids"}, status=status.HTTP_400_BAD_REQUEST)
+        unread = unread.filter(id__in=ids)
+    marked = unread.update(read_at=timezone.now())
+    return Response({'marked': marked})
@@ -7,17 +7,34 @@ from rest_framework import status
 from django.utils import timezone
 
 from django.contrib.auth.models import User
-from django.db.models import Q
+from django.db.models import Prefetch, Q
+from django.http import HttpRequest, HttpResponse
 
+from api.async_dispatch import json_response, with_async
 from api.models import Project, Checkpoint, Decision, AITool, UserProfile
-from api.services.checkpoint_generator import generate_checkpoints_for_use_case
+from api.services.checkpoint_catalog import (
+    create_project_checkpoints,
+    serialize_definition,
+    with_checkpoint_definitions,
+)
+from api.services.events import publish_project_event
+
+
+def with_project_relations(queryset):
+    """Fetch everything serialize_project() reads, so serializing runs no queries."""
+    return with_checkpoint_definitions(queryset).select_related(
+        'user', 'faculty_advisor', 'student_collaborator',
+    ).prefetch_related(
+        Prefetch('decisions', queryset=Decision.objects.select_related('tool_used', 'checkpoint').order_by('-logged_at')),
+        'ai_tools',
+    )
 
 
 def get_user_projects(user):
     """Get projects owned by user OR where user is faculty advisor or student collaborator."""
-    return Project.objects.filter(
+    return with_project_relations(Project.objects.filter(
         Q(user=user) | Q(faculty_advisor=user) | Q(student_collaborator=user)
-    ).distinct().order_by('-created_at')
+    ).distinct().order_by('-created_at'))
 
 
 def user_can_access_project(user, project):
@@ -30,26 +47,23 @@ def serialize_project(project: Project) -> dict[str, Any]:
 
     Uses manual dict serialization to match the camelCase format
     the frontend expects. A proper DRF serializer migration is planned
-    as a follow-up step.
+    as a follow-up step. Callers should fetch the project through
+    with_project_relations(); serializing then needs no further queries,
+    which the async list view relies on.
     """
     checkpoints: list[dict[str, Any]] = []
-    for cp in project.checkpoints.all().order_by('id'):
+    for cp in project.checkpoints.all():
         checkpoints.append({
             'id': cp.checkpoint_id,
             'dbId': cp.id,
-            'label': cp.label,
-            'category': cp.category,
+            **serialize_definition(cp.definition),
             'assignedTo': cp.assigned_to,
             'completed': cp.completed,
             'completedAt': cp.completed_at.isoformat() if cp.completed_at else None,
-            'what': cp.what,
-            'why': cp.why,
-            'how': cp.how,
-            'frameworks': cp.frameworks or [],
         })
 
     decisions: list[dict[str, Any]] = []
-    for d in project.decisions.select_related('tool_used').order_by('-logged_at'):
+    for d in project.decisions.all():
         decisions.append({
             'id': str(d.id),
             'checkpoint': d.checkpoint.checkpoint_id,
@@ -67,6 +81,7 @@ def serialize_project(project: Project) -> dict[str, Any]:
         'description': project.description,
         'aiUseCase': project.ai_use_case,
         'status': project.status,
+        'toolRiskFlag': project.tool_risk_flag,
         'createdAt': project.created_at.isoformat(),
         'owner': project.user.first_name or project.user.email,
         'ownerEmail': project.user.email,
@@ -87,6 +102,16 @@ def serialize_project(project: Project) -> dict[str, Any]:
     }
 
 
+async def project_list_async(request: HttpRequest) -> HttpResponse:
+    """GET /api/projects on the async ORM (ASGI mode)."""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return json_response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+    projects = [p async for p in get_user_projects(user)]
+    return json_response([serialize_project(p) for p in projects])
+
+
+@with_async(project_list_async)
 @api_view(['GET', 'POST'])
 def project_list_create(request: Request) -> Response:
     """List all projects for the user, or create a new one."""
@@ -132,9 +157,7 @@ def project_list_create(request: Request) -> Response:
     )
 
     # Generate checkpoints
-    checkpoint_defs = generate_checkpoints_for_use_case(ai_use_case)
-    for cp_def in checkpoint_defs:
-        Checkpoint.objects.create(project=project, **cp_def)
+    create_project_checkpoints(project)
 
     # Link AI tools if provided
     ai_tool_ids = request.data.get('ai_tool_ids', [])
@@ -142,6 +165,7 @@ def project_list_create(request: Request) -> Response:
         tools = AITool.objects.filter(id__in=ai_tool_ids)
         project.ai_tools.set(tools)
 
+    project = with_project_relations(Project.objects.all()).get(id=project.id)
     return Response(serialize_project(project), status=status.HTTP_201_CREATED)
 
 
@@ -152,7 +176,7 @@ def project_detail(request: Request, project_id: int) -> Response:
         return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
 
     try:
-        project = Project.objects.get(id=project_id)
+        project = with_project_relations(Project.objects.all()).get(id=project_id)
     except Project.DoesNotExist:
         return Response({"error": "Activity not found"}, status=status.HTTP_404_NOT_FOUND)
 
@@ -218,11 +242,13 @@ def checkpoint_toggle(request: Request, project_id: int, checkpoint_id: str) ->
     checkpoint.completed_at = timezone.now() if checkpoint.completed else None
     checkpoint.save()
 
-    return Response({
+    result = {
         "id": checkpoint.checkpoint_id,
         "completed": checkpoint.completed,
         "completedAt": checkpoint.completed_at.isoformat() if checkpoint.completed_at else None,
-    })
+    }
+    publish_project_event(project.id, 'checkpoint', result)
+    return Response(result)
 
 
 @api_view(['POST'])
@@ -279,7 +305,7 @@ def decision_create(request: Request, project_id: int) -> Response:
         checkpoint.completed_at = timezone.now()
         checkpoint.save()
 
-    return Response({
+    result = {
         'id': str(decision.id),
         'checkpoint': checkpoint.checkpoint_id,
         'description': decision.description,
@@ -290,4 +316,6 @@ def decision_create(request: Request, project_id: int) -> Response:
         'loggedAt': decision.logged_at.isoformat(),
         'checkpointCompleted': checkpoint.completed,
         'checkpointCompletedAt': checkpoint.completed_at.isoformat() if checkpoint.completed_at else None,
-    }, status=status.HTTP_201_CREATED)
+    }
+    publish_project_event(project.id, 'decision', result)
+    return Response(result, status=status.HTTP_201_CREATED)
@@ -4,51 +4,160 @@ from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
+from django.db.models import Q
+from django.http import HttpResponse, StreamingHttpResponse
 
+from api.models import Project
+from api.prerendered import PrerenderedPayload, prerendered_response
+from api.services.document_batch import (
+    INPUT_FORMATS,
+    OUTPUT_FORMATS,
+    detect_input_format,
+    iter_records,
+    render_records,
+    stream_jsonl,
+    stream_zip,
+)
 from api.services.ethics_engine import (
+    ESCAPERS,
     get_all_templates,
-    get_template,
     generate_document,
 )
+from api.services.project_fields import prefill_fields
+
+# Rendered once per process; templates only change on deploy
+TEMPLATE_LIST_PAYLOAD = PrerenderedPayload.from_data([
+    {
+        "key": key,
+        "name": t["name"],
+        "description": t["description"]
+    }
+    for key, t in get_all_templates().items()
+])
+TEMPLATE_PAYLOADS: dict[str, PrerenderedPayload] = {
+    key: PrerenderedPayload.from_data({"key": key, **t}) for key, t in get_all_templates().items()
+}
 
 
 @api_view(['GET'])
-def template_list(request: Request) -> Response:
+def template_list(request: Request) -> HttpResponse:
     """Get all available document templates."""
-    templates = get_all_templates()
-    return Response([
-        {
-            "key": key,
-            "name": t["name"],
-            "description": t["description"]
-        }
-        for key, t in templates.items()
-    ])
+    return prerendered_response(request, TEMPLATE_LIST_PAYLOAD)
 
 
 @api_view(['GET'])
-def template_detail(request: Request, template_key: str) -> Response:
+def template_detail(request: Request, template_key: str) -> HttpResponse | Response:
     """Get a specific template."""
-    template = get_template(template_key)
-    if not template:
+    payload = TEMPLATE_PAYLOADS.get(template_key)
+    if not payload:
         return Response(
             {"error": "Template not found"},
             status=status.HTTP_404_NOT_FOUND
         )
-    return Response({"key": template_key, **template})
+    return prerendered_response(request, payload)
 
 
 @api_view(['POST'])
 def document_generate(request: Request) -> Response:
-    """Generate a document from a template with filled values."""
+    """Generate a document from a template with filled values.
+
+    With a ``project_id``, fields the project already records (name, people,
+    AI tools, decision history) are filled in server-side; any fields sent
+    by the client take precedence.
+    """
     template_key: str | None = request.data.get('template_key')
     # Accept both 'fields' and 'field_values' for compatibility
     fields: dict[str, Any] = request.data.get('fields') or request.data.get('field_values', {})
+    escape: str | None = request.data.get('escape')
+    if escape and (not isinstance(escape, str) or escape not in ESCAPERS):
+        return Response(
+            {"error": f"escape must be one of: {', '.join(ESCAPERS)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    project_id = request.data.get('project_id')
+    if project_id:
+        if not request.user.is_authenticated:
+            return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+        try:
+            project_id = int(project_id)
+        except (TypeError, ValueError):
+            return Response({"error": "project_id must be an integer"}, status=status.HTTP_400_BAD_REQUEST)
+        user = request.user
+        accessible = Project.objects.filter(
+            Q(user=user) | Q(faculty_advisor=user) | Q(student_collaborator=user), id=project_id
+        ).exists()
+        prefilled = prefill_fields(template_key, project_id, fields) if accessible else None
+        if prefilled is None:
+            return Response({"error": "Activity not found"}, status=status.HTTP_404_NOT_FOUND)
+        fields = prefilled
 
-    result = generate_document(template_key, fields)
+    result = generate_document(template_key, fields, escape)
     if not result:
         return Response(
             {"error": "Template not found"},
             status=status.HTTP_404_NOT_FOUND
         )
     return Response(result)
+
+
+@api_view(['POST'])
+def document_generate_batch(request: Request) -> StreamingHttpResponse | Response:
+    """Mail-merge one template against many records and stream the results.
+
+    Records come either from an uploaded ``file`` (JSON array, JSONL or CSV,
+    picked by ``input_format`` or the file extension) or from a ``records``
+    list in a JSON body. ``?output=zip`` returns one markdown file per
+    record; the default is JSON Lines.
+    """
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    template_key: str | None = request.data.get('template_key')
+    if template_key not in get_all_templates():
+        return Response(
+            {"error": "Template not found"},
+            status=status.HTTP_404_NOT_FOUND
+        )
+
+    output_format = request.query_params.get('output', 'jsonl')
+    if output_format not in OUTPUT_FORMATS:
+        return Response(
+            {"error": f"output must be one of: {', '.join(OUTPUT_FORMATS)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    escape: str | None = request.data.get('escape') or None
+    if escape and (not isinstance(escape, str) or escape not in ESCAPERS):
+        return Response(
+            {"error": f"escape must be one of: {', '.join(ESCAPERS)}"},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+    uploaded_file = request.FILES.get('file')
+    if uploaded_file:
+        input_format = request.data.get('input_format') or detect_input_format(uploaded_file.name)
+        if input_format not in INPUT_FORMATS:
+            return Response(
+                {"error": f"input_format must be one of: {', '.join(INPUT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        records = iter_records(uploaded_file.file, input_format)
+    else:
+        records = request.data.get('records')
+        if not isinstance(records, list):
+            return Response(
+                {"error": "Upload a file or send a list of records"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+    documents = render_records(template_key, records, escape)
+    if output_format == 'zip':
+        response = StreamingHttpResponse(
+            stream_zip(documents, request.query_params.get('name_field')),
+            content_type='application/zip',
+        )
+        response['Content-Disposition'] = f'attachment; filename="{template_key}_documents.zip"'
+    else:
+        response = StreamingHttpResponse(stream_jsonl(documents), content_type='application/x-ndjson')
+    return response
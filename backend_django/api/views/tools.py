@@ -1,66 +1,135 @@
 from typing import Any
 
+from asgiref.sync import sync_to_async
 from rest_framework.decorators import api_view
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
+from django.db.models import Count, Q
+from django.http import HttpRequest, HttpResponse, QueryDict
+
+from api.async_dispatch import json_response, with_async
+from api.models import AITool, UserProfile, Project, ToolSyncRun
+from api.services.background import enqueue_task
+from api.services.project_risk import propagate_tool_status
+from api.services.tool_catalog import get_tool_catalog, project_counts, serialize_ai_tool
+from api.services.tool_compatibility import (
+    compatibility_matrix,
+    ranked_tools_for_use_case,
+    risk_for_use_case,
+    serialize_compatibility,
+)
+from api.services.tool_risk import MAX_RISK, risk_range
+from api.services.tool_search import search_tool_ids
+from api.services.tool_sync import serialize_sync_change, serialize_sync_run, sync_tool_catalog
+
+ACTIVITY_PAGE_SIZE = 25
+MAX_ACTIVITY_PAGE_SIZE = 100
+SYNC_RUN_LIMIT = 20
+MAX_RISK_BATCH = 1000
+RISK_SORTS = {'risk': False, '-risk': True}  # sort value -> descending
+
+
+def search_ranking(params: QueryDict) -> list[int] | None:
+    """Ranked ids for the ``search`` parameter, or None when not searching.
+
+    ``limit`` caps the number of matches, for typeahead.
+    """
+    search = params.get('search', '').strip()
+    if not search:
+        return None
+    try:
+        limit = max(1, int(params['limit'])) if params.get('limit') else None
+    except ValueError:
+        limit = None
+    return search_tool_ids(search, limit)
+
+
+def risk_bounds(params: QueryDict) -> tuple[int, int] | None:
+    """Inclusive risk score range from ``risk_level`` and ``max_risk``; invalid values are ignored."""
+    low, high = risk_range(params.get('risk_level', '')) or (0, MAX_RISK)
+    try:
+        high = min(high, int(params['max_risk'])) if params.get('max_risk') else high
+    except ValueError:
+        pass
+    return (low, high) if (low, high) != (0, MAX_RISK) else None
+
+
+def list_ai_tools(params: QueryDict) -> list[dict[str, Any]]:
+    """Serialized tools matching the list endpoint's parameters.
+
+    Filters are answered from the in-memory tool catalog. ``search`` and
+    ``use_case`` each take one indexed query and return tools in rank
+    order (a search wins over use-case ranking); other listings are in
+    name order. With ``use_case`` every tool carries its compatibility.
+
+    ``risk_level``/``max_risk`` filter and ``sort=risk`` (or ``-risk``)
+    orders by the stored risk score: the use case's when ``use_case`` is
+    given, else the tool's overall score.
+    """
+    ranked_ids = search_ranking(params)
+    use_case = params.get('use_case', '').strip()
+    compatibility = None
+    if use_case:
+        compatibility = {row['tool_id']: row for row in ranked_tools_for_use_case(use_case)}
+        if ranked_ids is None:
+            ranked_ids = list(compatibility)
+        else:
+            ranked_ids = [tool_id for tool_id in ranked_ids if tool_id in compatibility]
+
+    tools = get_tool_catalog().filter(
+        tool_type=params.get('tool_type'),
+        category=params.get('category'),
+        status=params.get('status'),
+        ids=ranked_ids,
+    )
+    counts = project_counts()
+    tools = [{**t, 'projectCount': counts.get(t['id'], 0)} for t in tools]
+    if compatibility is not None:
+        for t in tools:
+            t['compatibility'] = serialize_compatibility(compatibility[t['id']])
+
+    def risk_of(tool: dict[str, Any]) -> int:
+        return tool['compatibility']['riskScore'] if compatibility is not None else tool['riskScore']
+
+    bounds = risk_bounds(params)
+    if bounds is not None:
+        tools = [t for t in tools if bounds[0] <= risk_of(t) <= bounds[1]]
+    if ranked_ids is not None:
+        position = {tool_id: i for i, tool_id in enumerate(ranked_ids)}
+        tools = sorted(tools, key=lambda t: position[t['id']])
+    sort = params.get('sort', '')
+    if sort in RISK_SORTS:
+        # Stable, so equal scores keep rank or name order
+        tools = sorted(tools, key=risk_of, reverse=RISK_SORTS[sort])
+    return tools
 
-from api.models import AITool, UserProfile, Project
-
-
-def serialize_ai_tool(tool: AITool, include_guidance: bool = False) -> dict[str, Any]:
-    """Serialize an AITool instance to a camelCase dict for the frontend."""
-    result = {
-        'id': tool.id,
-        'toolType': tool.tool_type,
-        'toolTypeDisplay': tool.get_tool_type_display(),
-        'name': tool.name,
-        'description': tool.description,
-        'vendor': tool.vendor,
-        'category': tool.category,
-        'categoryDisplay': tool.get_category_display(),
-        'status': tool.status,
-        'statusDisplay': tool.get_status_display(),
-        'riskNotes': tool.risk_notes,
-        'websiteUrl': tool.website_url,
-        'addedBy': tool.added_by.first_name or tool.added_by.email if tool.added_by else None,
-        'createdAt': tool.created_at.isoformat(),
-        'projectCount': tool.projects.count(),
-        # Data handling
-        'retainsData': tool.retains_data,
-        'dataRetentionDetails': tool.data_retention_details,
-        'sendsToThirdParty': tool.sends_to_third_party,
-        'hipaaCompliant': tool.hipaa_compliant,
-        'ferpaCompliant': tool.ferpa_compliant,
-        'hasEnterprisePlan': tool.has_enterprise_plan,
-        'recommendedUseCases': tool.recommended_use_cases or [],
-    }
-    if include_guidance:
-        result['complianceGuidance'] = tool.compliance_guidance or {}
-    return result
 
+async def ai_tool_list_async(request: HttpRequest) -> HttpResponse:
+    """GET /api/tools in ASGI mode; mostly served from the in-memory catalog."""
+    user = await request.auser()
+    if not user.is_authenticated:
+        return json_response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+    return json_response(await sync_to_async(list_ai_tools)(request.GET))
 
+
+@with_async(ai_tool_list_async)
 @api_view(['GET', 'POST'])
 def ai_tool_list_create(request: Request) -> Response:
-    """List all AI tools, or create a new one (faculty only)."""
+    """List AI tools, or create a new one (faculty only).
+
+    Filters: ``tool_type``, ``category``, ``status``. ``use_case`` returns
+    the tools recommended for that project use case, best fit first, for
+    the project-creation wizard. ``search`` runs a ranked full-text,
+    prefix-matching search over names, vendors, descriptions, risk notes
+    and compliance guidance. ``risk_level``, ``max_risk`` and
+    ``sort=risk``/``-risk`` use the stored risk scores.
+    """
     if not request.user.is_authenticated:
         return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
 
     if request.method == 'GET':
-        tools = AITool.objects.all()
-        tool_type = request.query_params.get('tool_type')
-        category = request.query_params.get('category')
-        tool_status = request.query_params.get('status')
-        search = request.query_params.get('search', '').strip()
-        if tool_type:
-            tools = tools.filter(tool_type=tool_type)
-        if category:
-            tools = tools.filter(category=category)
-        if tool_status:
-            tools = tools.filter(status=tool_status)
-        if search:
-            tools = tools.filter(name__icontains=search)
-        return Response([serialize_ai_tool(t) for t in tools])
+        return Response(list_ai_tools(request.query_params))
 
     # POST -- faculty only
     profile, _ = UserProfile.objects.get_or_create(user=request.user, defaults={'role': 'student'})
@@ -86,9 +155,51 @@ def ai_tool_list_create(request: Request) -> Response:
     return Response(serialize_ai_tool(tool), status=status.HTTP_201_CREATED)
 
 
+@api_view(['GET'])
+def ai_tool_matrix(request: Request) -> Response:
+    """Compatibility of every tool with every project use case.
+
+    Each cell has a verdict (recommended, compatible, caution,
+    not_recommended), a score and the reasons behind it.
+    """
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+    return Response(compatibility_matrix())
+
+
+@api_view(['POST'])
+def ai_tool_risk(request: Request) -> Response:
+    """Score many tools for one use case.
+
+    Body: ``use_case`` and optionally ``tool_ids`` (at most 1000; all tools
+    when omitted). Returns each tool's risk score, level and factors,
+    lowest risk first.
+    """
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    use_case = str(request.data.get('use_case', '')).strip()
+    if not use_case:
+        return Response({"error": "use_case is required"}, status=status.HTTP_400_BAD_REQUEST)
+    tool_ids = request.data.get('tool_ids')
+    if tool_ids is not None:
+        if not isinstance(tool_ids, list) or not all(isinstance(i, int) and not isinstance(i, bool) for i in tool_ids):
+            return Response({"error": "tool_ids must be a list of tool ids"}, status=status.HTTP_400_BAD_REQUEST)
+        if len(tool_ids) > MAX_RISK_BATCH:
+            return Response({"error": f"At most {MAX_RISK_BATCH} tools per request"},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+    return Response({'useCase': use_case, 'tools': risk_for_use_case(use_case, tool_ids)})
+
+
 @api_view(['PUT'])
 def ai_tool_update(request: Request, tool_id: int) -> Response:
-    """Update an existing AI tool (faculty only)."""
+    """Update an existing AI tool (faculty only).
+
+    A status change to or from not_recommended is propagated to the
+    projects using the tool (risk flag, owner and advisor notifications)
+    in the background, after the response.
+    """
     if not request.user.is_authenticated:
         return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
 
@@ -101,46 +212,170 @@ def ai_tool_update(request: Request, tool_id: int) -> Response:
     except AITool.DoesNotExist:
         return Response({"error": "Tool not found"}, status=status.HTTP_404_NOT_FOUND)
 
+    previous_status = tool.status
     for field in ['name', 'description', 'vendor', 'category', 'status', 'risk_notes', 'tool_type', 'website_url']:
         if field in request.data:
             setattr(tool, field, request.data[field])
     tool.save()
+    if tool.status != previous_status and 'not_recommended' in (tool.status, previous_status):
+        enqueue_task(propagate_tool_status, tool.id)
 
     return Response(serialize_ai_tool(tool))
 
 
+def _completion_pct(done: int, total: int) -> int:
+    return round((done / total) * 100) if total > 0 else 0
+
+
+def _checkpoint_counts() -> dict[str, Count]:
+    return {
+        'checkpoints_total': Count('checkpoints'),
+        'checkpoints_done': Count('checkpoints', filter=Q(checkpoints__completed=True)),
+    }
+
+
+def tool_usage_summary(tool_id: int) -> dict[str, Any]:
+    """Activity count and checkpoint completion for a tool, overall and per use case.
+
+    One grouped query. Completion is done/total over all checkpoints of
+    the activities, so larger checklists weigh more.
+    """
+    groups = Project.objects.filter(ai_tools=tool_id).order_by().values('ai_use_case').annotate(
+        activities=Count('id', distinct=True), **_checkpoint_counts(),
+    )
+    by_use_case = [
+        {
+            'useCase': g['ai_use_case'],
+            'activityCount': g['activities'],
+            'compliancePct': _completion_pct(g['checkpoints_done'], g['checkpoints_total']),
+        }
+        for g in sorted(groups, key=lambda g: (-g['activities'], g['ai_use_case']))
+    ]
+    done = sum(g['checkpoints_done'] for g in groups)
+    total = sum(g['checkpoints_total'] for g in groups)
+    return {
+        'activityCount': sum(g['activities'] for g in groups),
+        'compliancePct': _completion_pct(done, total),
+        'checkpointsDone': done,
+        'checkpointsTotal': total,
+        'byUseCase': by_use_case,
+    }
+
+
+def tool_activity_page(tool_id: int, page: int, page_size: int) -> tuple[list[dict[str, Any]], bool]:
+    """One page of the activities using a tool, newest first, and whether more follow."""
+    offset = (page - 1) * page_size
+    projects = Project.objects.filter(ai_tools=tool_id).select_related('user').annotate(
+        **_checkpoint_counts(),
+    ).order_by('-created_at', '-id')[offset:offset + page_size + 1]
+    activities = [{
+        'id': str(p.id),
+        'name': p.name,
+        'owner': p.user.first_name or p.user.email,
+        'aiUseCase': p.ai_use_case,
+        'compliancePct': _completion_pct(p.checkpoints_done, p.checkpoints_total),
+        'checkpointsDone': p.checkpoints_done,
+        'checkpointsTotal': p.checkpoints_total,
+        'createdAt': p.created_at.isoformat(),
+    } for p in projects]
+    return activities[:page_size], len(activities) > page_size
+
+
 @api_view(['GET'])
 def ai_tool_detail(request: Request, tool_id: int) -> Response:
-    """Get tool details with compliance guidance and activity history."""
+    """Get tool details with compliance guidance and activity history.
+
+    The history is paginated with ``page`` (from 1) and ``page_size``
+    (default 25, at most 100); ``usageSummary`` covers every activity.
+    """
     if not request.user.is_authenticated:
         return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
 
     try:
-        tool = AITool.objects.get(id=tool_id)
-    except AITool.DoesNotExist:
-        return Response({"error": "Tool not found"}, status=status.HTTP_404_NOT_FOUND)
+        page = int(request.query_params.get('page', 1))
+        page_size = int(request.query_params.get('page_size', ACTIVITY_PAGE_SIZE))
+    except ValueError:
+        return Response({"error": "page and page_size must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+    page = max(page, 1)
+    page_size = max(1, min(page_size, MAX_ACTIVITY_PAGE_SIZE))
 
-    tool_data = serialize_ai_tool(tool, include_guidance=True)
+    tool_data = get_tool_catalog().get(tool_id, include_guidance=True)
+    if tool_data is None:
+        return Response({"error": "Tool not found"}, status=status.HTTP_404_NOT_FOUND)
+    tool_data['projectCount'] = project_counts(tool_id).get(tool_id, 0)
 
     # Activity history — projects using this tool with their use case and compliance status
-    projects_using = tool.projects.select_related('user').prefetch_related('checkpoints').all()
-    activity_history = []
-    for p in projects_using:
-        cps = list(p.checkpoints.all())
-        total = len(cps)
-        done = sum(1 for c in cps if c.completed)
-        pct = round((done / total) * 100) if total > 0 else 0
-        activity_history.append({
-            'id': str(p.id),
-            'name': p.name,
-            'owner': p.user.first_name or p.user.email,
-            'aiUseCase': p.ai_use_case,
-            'compliancePct': pct,
-            'checkpointsDone': done,
-            'checkpointsTotal': total,
-            'createdAt': p.created_at.isoformat(),
-        })
-
-    tool_data['activityHistory'] = activity_history
+    activities, has_more = tool_activity_page(tool_id, page, page_size)
+    tool_data['activityHistory'] = activities
+    tool_data['activityPage'] = {'page': page, 'pageSize': page_size, 'hasMore': has_more}
+    tool_data['usageSummary'] = tool_usage_summary(tool_id)
 
     return Response(tool_data)
+
+
+def _faculty_only(request: Request, action: str) -> Response | None:
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+    profile, _ = UserProfile.objects.get_or_create(user=request.user, defaults={'role': 'student'})
+    if profile.role != 'faculty':
+        return Response({"error": f"Only faculty can {action}"}, status=status.HTTP_403_FORBIDDEN)
+    return None
+
+
+@api_view(['POST'])
+def ai_tool_sync(request: Request) -> Response:
+    """Sync the registry from an uploaded JSONL catalog export (faculty only).
+
+    The upload is streamed in batches; ``dry_run=true`` counts changes
+    without writing tools. Returns the recorded run, whose errors include
+    invalid records and lines that are not UTF-8.
+    """
+    denied = _faculty_only(request, 'sync tools')
+    if denied:
+        return denied
+
+    uploaded_file = request.FILES.get('file')
+    if not uploaded_file:
+        return Response({"error": "No file provided"}, status=status.HTTP_400_BAD_REQUEST)
+    run = sync_tool_catalog(
+        uploaded_file.chunks(),
+        source=uploaded_file.name,
+        user=request.user,
+        dry_run=str(request.data.get('dry_run', '')).lower() == 'true',
+    )
+    return Response(serialize_sync_run(run), status=status.HTTP_201_CREATED)
+
+
+@api_view(['GET'])
+def ai_tool_sync_runs(request: Request) -> Response:
+    """Recent catalog sync runs, newest first (faculty only)."""
+    denied = _faculty_only(request, 'view tool syncs')
+    if denied:
+        return denied
+    runs = ToolSyncRun.objects.select_related('started_by').order_by('-started_at', '-id')[:SYNC_RUN_LIMIT]
+    return Response([serialize_sync_run(run) for run in runs])
+
+
+@api_view(['GET'])
+def ai_tool_sync_run_detail(request: Request, run_id: int) -> Response:
+    """One sync run with a page of its per-tool changes (faculty only)."""
+    denied = _faculty_only(request, 'view tool syncs')
+    if denied:
+        return denied
+    try:
+        page = max(int(request.query_params.get('page', 1)), 1)
+        page_size = max(1, min(int(request.query_params.get('page_size', ACTIVITY_PAGE_SIZE)), MAX_ACTIVITY_PAGE_SIZE))
+    except ValueError:
+        return Response({"error": "page and page_size must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+    try:
+        run = ToolSyncRun.objects.select_related('started_by').get(id=run_id)
+    except ToolSyncRun.DoesNotExist:
+        return Response({"error": "Sync run not found"}, status=status.HTTP_404_NOT_FOUND)
+
+    offset = (page - 1) * page_size
+    changes = list(run.changes.all()[offset:offset + page_size + 1])
+    return Response({
+        **serialize_sync_run(run),
+        'changes': [serialize_sync_change(change) for change in changes[:page_size]],
+        'changesPage': {'page': page, 'pageSize': page_size, 'hasMore': len(changes) > page_size},
+    })
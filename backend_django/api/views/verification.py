@@ -3,53 +3,44 @@
 Provides file-based scanning for PII detection, FERPA compliance checks,
 and keyword-based data classification suggestions.
 """
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from django.core.files.uploadedfile import UploadedFile
+from django.http import HttpRequest, HttpResponse
 from rest_framework.decorators import api_view, parser_classes
 from rest_framework.parsers import MultiPartParser, FormParser
 from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework import status
 
-from api.services.pii_scanner import scan_csv_for_pii, classify_data_from_description
+from api.async_dispatch import json_response, with_async
+from api.services.pii_scanner import scan_csv_stream, classify_data_from_description
 
 
-@api_view(['POST'])
-@parser_classes([MultiPartParser, FormParser])
-def scan_file_for_pii(request: Request) -> Response:
-    """Upload a CSV file and scan it for personally identifiable information."""
-    if not request.user.is_authenticated:
-        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
-
-    uploaded_file = request.FILES.get('file')
+def _scan_upload(uploaded_file: UploadedFile | None, scan_type: str) -> tuple[dict[str, Any], int]:
+    """Validate and scan an uploaded CSV; returns the payload and status code."""
     if not uploaded_file:
-        return Response({"error": "No file uploaded"}, status=status.HTTP_400_BAD_REQUEST)
+        return {"error": "No file uploaded"}, status.HTTP_400_BAD_REQUEST
 
     # Check file type
     filename = uploaded_file.name.lower()
     if not filename.endswith('.csv'):
-        return Response(
-            {"error": "Only CSV files are supported for PII scanning"},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return {"error": "Only CSV files are supported for PII scanning"}, status.HTTP_400_BAD_REQUEST
 
     # Check file size (max 10MB)
     if uploaded_file.size > 10 * 1024 * 1024:
-        return Response(
-            {"error": "File too large. Maximum size is 10MB."},
-            status=status.HTTP_400_BAD_REQUEST
-        )
+        return {"error": "File too large. Maximum size is 10MB."}, status.HTTP_400_BAD_REQUEST
 
+    # Decoded chunk by chunk; reading stops once the sampled rows are in
     try:
-        content = uploaded_file.read().decode('utf-8')
+        result = scan_csv_stream(uploaded_file.chunks())
     except UnicodeDecodeError:
-        return Response(
+        return (
             {"error": "Could not read file. Please ensure it is a valid UTF-8 CSV."},
-            status=status.HTTP_400_BAD_REQUEST
+            status.HTTP_400_BAD_REQUEST,
         )
 
-    # Determine scan type from query param
-    scan_type = request.data.get('scan_type', 'pii')
-    result = scan_csv_for_pii(content)
-
     # For FERPA scans, add extra context
     if scan_type == 'ferpa':
         ferpa_fields = ['grade', 'enrollment', 'id_number']
@@ -61,7 +52,39 @@ def scan_file_for_pii(request: Request) -> Response:
                 if ferpa_findings else 'No student education record patterns detected',
         }
 
-    return Response(result)
+    return result, status.HTTP_200_OK
+
+
+def _scan_request_upload(request: HttpRequest) -> tuple[dict[str, Any], int]:
+    return _scan_upload(request.FILES.get('file'), request.POST.get('scan_type', 'pii'))
+
+
+async def scan_file_for_pii_async(request: HttpRequest) -> HttpResponse:
+    """POST /api/verify/scan-pii in ASGI mode.
+
+    The ASGI server receives the upload body without holding a thread; the
+    multipart parse and scan then run in a worker thread of their own so a
+    large file blocks neither the event loop nor the shared sync thread.
+    """
+    user = await request.auser()
+    if not user.is_authenticated:
+        return json_response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    payload, code = await sync_to_async(_scan_request_upload, thread_sensitive=False)(request)
+    return json_response(payload, status=code)
+
+
+@with_async(scan_file_for_pii_async, methods=('POST',))
+@api_view(['POST'])
+@parser_classes([MultiPartParser, FormParser])
+def scan_file_for_pii(request: Request) -> Response:
+    """Upload a CSV file and scan it for personally identifiable information."""
+    if not request.user.is_authenticated:
+        return Response({"error": "Not logged in"}, status=status.HTTP_401_UNAUTHORIZED)
+
+    # Determine scan type from query param
+    payload, code = _scan_upload(request.FILES.get('file'), request.data.get('scan_type', 'pii'))
+    return Response(payload, status=code)
 
 
 @api_view(['POST'])
@@ -0,0 +1,156 @@
+"""Load-test the read endpoints against a running server, WSGI or ASGI.
+
+Start one server, run this against it, then do the same for the other:
+
+    # WSGI: one worker process, 8 threads
+    pip install gunicorn
+    gunicorn raise_project.wsgi -w 1 --threads 8 -b 127.0.0.1:8000
+
+    # ASGI: one worker process, async views for the hot endpoints
+    pip install uvicorn
+    uvicorn raise_project.asgi:application --port 8001
+
+    python benchmarks/asgi_vs_wsgi.py --url http://127.0.0.1:8000 --email me@usf.edu --password ...
+    python benchmarks/asgi_vs_wsgi.py --url http://127.0.0.1:8001 --email me@usf.edu --password ...
+
+Reports requests/second and p50/p99 latency per endpoint. Uses only the
+standard library (asyncio streams with keep-alive connections), so the
+client itself is not the bottleneck at a few hundred connections.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+DEFAULT_PATHS = [
+    '/api/projects',
+    '/api/dashboard/stats',
+    '/api/tools',
+    '/api/ethics/start',
+    '/api/ethics/bundle',
+]
+
+
+class Connection:
+    """One keep-alive HTTP/1.1 connection."""
+
+    def __init__(self, host: str, port: int, cookie: str) -> None:
+        self.host = host
+        self.port = port
+        self.cookie = cookie
+        self.reader: asyncio.StreamReader | None = None
+        self.writer: asyncio.StreamWriter | None = None
+
+    async def request(self, method: str, path: str, body: bytes = b'') -> tuple[int, dict[str, str], bytes]:
+        if self.writer is None:
+            self.reader, self.writer = await asyncio.open_connection(self.host, self.port)
+        head = (
+            f'{method} {path} HTTP/1.1\r\n'
+            f'Host: {self.host}:{self.port}\r\n'
+            f'Cookie: {self.cookie}\r\n'
+            f'Content-Type: application/json\r\n'
+            f'Content-Length: {len(body)}\r\n\r\n'
+        )
+        self.writer.write(head.encode() + body)
+        await self.writer.drain()
+
+        status_line = await self.reader.readline()
+        status = int(status_line.split()[1])
+        headers: dict[str, str] = {}
+        while (line := await self.reader.readline()) not in (b'\r\n', b''):
+            name, _, value = line.decode().partition(':')
+            name = name.strip().lower()
+            if name in headers:  # repeated headers, e.g. Set-Cookie
+                headers[name] += '\n' + value.strip()
+            else:
+                headers[name] = value.strip()
+        if 'content-length' in headers:
+            payload = await self.reader.readexactly(int(headers['content-length']))
+        else:
+            payload = await self.reader.read()
+        if headers.get('connection', '').lower() == 'close' or 'content-length' not in headers:
+            await self.close()
+        return status, headers, payload
+
+    async def close(self) -> None:
+        if self.writer is not None:
+            self.writer.close()
+            self.writer = None
+
+
+async def login(host: str, port: int, email: str, password: str) -> str:
+    """Log in and return the Cookie header value for the session."""
+    conn = Connection(host, port, cookie='')
+    body = json.dumps({'email': email, 'password': password}).encode()
+    status, headers, _ = await conn.request('POST', '/api/auth/login', body)
+    await conn.close()
+    if status != 200:
+        raise SystemExit(f'Login failed with HTTP {status}')
+    cookies = headers.get('set-cookie', '').split('\n')
+    return '; '.join(cookie.split(';', 1)[0] for cookie in cookies if cookie)
+
+
+async def run_endpoint(host: str, port: int, cookie: str, path: str, concurrency: int, total: int) -> dict:
+    latencies: list[float] = []
+    errors = 0
+    remaining = total
+
+    async def worker() -> None:
+        nonlocal remaining, errors
+        conn = Connection(host, port, cookie)
+        try:
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                try:
+                    status, _, _ = await conn.request('GET', path)
+                except (OSError, asyncio.IncompleteReadError, ValueError, IndexError):
+                    errors += 1
+                    await conn.close()
+                    continue
+                latencies.append(time.perf_counter() - started)
+                if status != 200:
+                    errors += 1
+        finally:
+            await conn.close()
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        'path': path,
+        'requests': len(latencies),
+        'errors': errors,
+        'rps': len(latencies) / elapsed if elapsed else 0.0,
+        'p50_ms': statistics.median(latencies) * 1000 if latencies else 0.0,
+        'p99_ms': latencies[int(len(latencies) * 0.99) - 1] * 1000 if latencies else 0.0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--url', default='http://127.0.0.1:8000')
+    parser.add_argument('--email', required=True)
+    parser.add_argument('--password', required=True)
+    parser.add_argument('--concurrency', type=int, default=100)
+    parser.add_argument('--requests', type=int, default=2000, help='Requests per endpoint')
+    parser.add_argument('--path', action='append', dest='paths', help='Endpoint to hit (repeatable)')
+    args = parser.parse_args()
+
+    url = urlsplit(args.url)
+    host, port = url.hostname, url.port or 80
+    cookie = await login(host, port, args.email, args.password)
+
+    print(f'{args.url}  concurrency={args.concurrency}  requests/endpoint={args.requests}')
+    print(f'{"endpoint":<28}{"req/s":>10}{"p50 ms":>10}{"p99 ms":>10}{"errors":>8}')
+    for path in args.paths or DEFAULT_PATHS:
+        result = await run_endpoint(host, port, cookie, path, args.concurrency, args.requests)
+        print(f'{path:<28}{result["rps"]:>10.1f}{result["p50_ms"]:>10.1f}{result["p99_ms"]:>10.1f}{result["errors"]:>8}')
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
@@ -12,5 +12,7 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'raise_project.settings')
+# Serve the hot read endpoints from async views (api/async_dispatch.py)
+os.environ.setdefault('RAISE_SERVER_MODE', 'asgi')
 
 application = get_asgi_application()
@@ -10,6 +10,7 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/6.0/ref/settings/
 """
 
+import os
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -73,6 +74,11 @@ TEMPLATES = [
 ]
 
 WSGI_APPLICATION = 'raise_project.wsgi.application'
+ASGI_APPLICATION = 'raise_project.asgi.application'
+
+# 'wsgi' or 'asgi'. In ASGI mode the hot read endpoints run as async views
+# (see api/async_dispatch.py); raise_project/asgi.py selects it by default.
+SERVER_MODE = os.environ.get('RAISE_SERVER_MODE', 'wsgi')
 
 
 # Database
@@ -149,10 +155,13 @@ X_FRAME_OPTIONS = 'DENY'
 SESSION_COOKIE_HTTPONLY = True
 SESSION_COOKIE_SAMESITE = 'Lax'
 
-# Cache (used for login rate limiting)
+# Cache (login rate limiting, project field maps, tool catalog version).
+# Shared through the database so every worker process sees the same
+# entries. Migration api 0020 creates the table.
 CACHES = {
     'default': {
-        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+        'LOCATION': 'raise_cache',
     }
 }
 
@@ -32,6 +32,7 @@ function AIToolRegistry({ user, role, onLogout, onBack, onViewDashboard }) {
   const [searchQuery, setSearchQuery] = useState('');
   const [categoryFilter, setCategoryFilter] = useState('');
   const [typeFilter, setTypeFilter] = useState('all');
+  const [sortBy, setSortBy] = useState('name');
   const [showAddModal, setShowAddModal] = useState(false);
   const [editingTool, setEditingTool] = useState(null);
   const [formData, setFormData] = useState({ name: '', description: '', vendor: '', category: '', tool_type: 'ai', risk_notes: '', website_url: '' });
@@ -67,6 +68,22 @@ function AIToolRegistry({ user, role, onLogout, onBack, onViewDashboard }) {
     }
   }
 
+  async function loadMoreActivity() {
+    const next = selectedTool.activityPage.page + 1;
+    setLoadingDetail(true);
+    try {
+      const data = await fetchToolDetail(selectedTool.id, next);
+      setSelectedTool(prev => ({
+        ...data,
+        activityHistory: [...prev.activityHistory, ...data.activityHistory],
+      }));
+    } catch (err) {
+      console.error('Failed to load more activity', err);
+    } finally {
+      setLoadingDetail(false);
+    }
+  }
+
   async function handleSave() {
     if (!formData.name.trim() || !formData.category) return;
     setSaving(true);
@@ -115,6 +132,8 @@ function AIToolRegistry({ user, role, onLogout, onBack, onViewDashboard }) {
     if (typeFilter !== 'all' && t.toolType !== typeFilter) return false;
     return true;
   });
+  // Tools arrive in name order; sort is stable, so equal scores stay alphabetical
+  if (sortBy === 'risk') filtered.sort((a, b) => a.riskScore - b.riskScore);
 
   const aiTools = filtered.filter(t => t.toolType === 'ai');
   const generalTools = filtered.filter(t => (t.toolType || 'ai') === 'general');
@@ -205,6 +224,10 @@ function AIToolRegistry({ user, role, onLogout, onBack, onViewDashboard }) {
             <button className={`type-btn ${typeFilter === 'ai' ? 'active' : ''}`} onClick={() => setTypeFilter('ai')}>AI Tools</button>
             <button className={`type-btn ${typeFilter === 'general' ? 'active' : ''}`} onClick={() => setTypeFilter('general')}>Productivity & Research</button>
           </div>
+          <select className="tool-sort" value={sortBy} onChange={(e) => setSortBy(e.target.value)}>
+            <option value="name">Sort by name</option>
+            <option value="risk">Lowest risk first</option>
+          </select>
           {isFaculty && (
             <button className="pl-add-btn" onClick={() => openAddModal('ai')}>+ Add Tool</button>
           )}
@@ -233,6 +256,7 @@ function AIToolRegistry({ user, role, onLogout, onBack, onViewDashboard }) {
                         {tool.hipaaCompliant && <span className="data-flag good">HIPAA Compliant</span>}
                         {!tool.retainsData && <span className="data-flag good">No Data Retention</span>}
                         {tool.retainsData && <span className="data-flag neutral">Data Retained</span>}
+                        <span className={`data-flag risk-${tool.riskLevel}`}>{tool.riskLevel} risk</span>
                       </div>
                       <div className="tool-card-footer">
                         <span className="tool-view-details">View details &rarr;</span>
@@ -421,7 +445,15 @@ function AIToolRegistry({ user, role, onLogout, onBack, onViewDashboard }) {
             {/* Institutional Usage */}
             {selectedTool.activityHistory && selectedTool.activityHistory.length > 0 && (
               <div className="td-section">
-                <h3 className="td-section-title">Institutional Usage ({selectedTool.activityHistory.length})</h3>
+                <h3 className="td-section-title">Institutional Usage ({selectedTool.usageSummary.activityCount})</h3>
+                <p className="td-note">
+                  {selectedTool.usageSummary.compliancePct}% of checkpoints complete
+                  {selectedTool.usageSummary.byUseCase.length > 1 && (
+                    <> &middot; {selectedTool.usageSummary.byUseCase.map(u =>
+                      `${u.useCase.replace(/_/g, ' ')}: ${u.activityCount} (${u.compliancePct}%)`
+                    ).join(', ')}</>
+                  )}
+                </p>
                 <table className="td-usage-table">
                   <thead>
                     <tr>
@@ -442,6 +474,11 @@ function AIToolRegistry({ user, role, onLogout, onBack, onViewDashboard }) {
                     ))}
                   </tbody>
                 </table>
+                {selectedTool.activityPage.hasMore && (
+                  <button className="btn-secondary" onClick={loadMoreActivity} disabled={loadingDetail}>
+                    {loadingDetail ? 'Loading...' : 'Load more'}
+                  </button>
+                )}
               </div>
             )}
 
@@ -1,7 +1,7 @@
 import { useState, useEffect } from 'react';
 import { fetchCheckpointComments, postCheckpointComment } from '../services/api';
 
-function CheckpointComments({ projectId, checkpointId }) {
+function CheckpointComments({ projectId, checkpointId, liveComment }) {
   const [comments, setComments] = useState([]);
   const [loading, setLoading] = useState(true);
   const [newComment, setNewComment] = useState('');
@@ -11,6 +11,12 @@ function CheckpointComments({ projectId, checkpointId }) {
     loadComments();
   }, [projectId, checkpointId]);
 
+  // Comments posted by collaborators arrive over the project's event stream
+  useEffect(() => {
+    if (!liveComment || liveComment.checkpoint !== checkpointId) return;
+    setComments(prev => prev.some(c => c.id === liveComment.comment.id) ? prev : [...prev, liveComment.comment]);
+  }, [liveComment]);
+
   async function loadComments() {
     try {
       const data = await fetchCheckpointComments(projectId, checkpointId);
@@ -27,7 +33,7 @@ function CheckpointComments({ projectId, checkpointId }) {
     setPosting(true);
     try {
       const comment = await postCheckpointComment(projectId, checkpointId, newComment.trim());
-      setComments([...comments, comment]);
+      setComments(prev => prev.some(c => c.id === comment.id) ? prev : [...prev, comment]);
       setNewComment('');
     } catch (err) {
       console.error('Failed to post comment', err);
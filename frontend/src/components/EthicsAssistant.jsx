@@ -1,8 +1,9 @@
 import { useState, useEffect } from 'react';
-import { fetchEthicsStart, fetchEthicsNode, evaluateEthicsPath, startSession, recordResponse, completeSession } from '../services/api';
+import { fetchEthicsBundle, evaluateEthicsPath, startSession, recordResponse, completeSession } from '../services/api';
 import EthicsResult from './EthicsResult';
 
 function EthicsAssistant({ onBack }) {
+  const [bundle, setBundle] = useState(null);
   const [currentNode, setCurrentNode] = useState(null);
   const [answers, setAnswers] = useState({});
   const [history, setHistory] = useState([]);
@@ -21,8 +22,9 @@ function EthicsAssistant({ onBack }) {
 
   async function loadStartNode() {
     try {
-      const node = await fetchEthicsStart();
-      setCurrentNode(node);
+      const tree = bundle || await fetchEthicsBundle();
+      setBundle(tree);
+      setCurrentNode(tree.nodes[tree.root]);
     } catch (err) {
       console.error('Failed to load', err);
     } finally {
@@ -58,16 +60,8 @@ function EthicsAssistant({ onBack }) {
         setLoading(false);
       }
     } else {
-      // Load next node
-      setLoading(true);
-      try {
-        const node = await fetchEthicsNode(nextNodeKey);
-        setCurrentNode(node);
-      } catch (err) {
-        console.error('Failed to load node', err);
-      } finally {
-        setLoading(false);
-      }
+      // Next node comes from the bundle loaded at start
+      setCurrentNode(bundle.nodes[nextNodeKey]);
     }
   }
 
@@ -1,6 +1,6 @@
 import { useState, useEffect } from 'react';
 import html2pdf from 'html2pdf.js';
-import { toggleCheckpoint, logDecision, fetchProject, updateProject, fetchTools, scanFileForPII, classifyData } from '../services/api';
+import { toggleCheckpoint, logDecision, fetchProject, updateProject, fetchTools, scanFileForPII, classifyData, subscribeToProjectEvents } from '../services/api';
 import CheckpointComments from './CheckpointComments';
 import UserMenu from './UserMenu';
 
@@ -55,10 +55,37 @@ function ProjectDashboard({ project: initialProject, user, role, onBack, onLogou
   const [editError, setEditError] = useState('');
   const [availableTools, setAvailableTools] = useState([]);
 
+  const [liveComment, setLiveComment] = useState(null);
+
   useEffect(() => {
     fetchTools().then(setAvailableTools).catch(() => {});
   }, []);
 
+  // Apply collaborators' changes as they happen instead of refetching
+  useEffect(() => {
+    return subscribeToProjectEvents(project.id, {
+      checkpoint: (event) => setProject(prev => ({
+        ...prev,
+        checkpoints: prev.checkpoints.map(cp =>
+          cp.id === event.id ? { ...cp, completed: event.completed, completedAt: event.completedAt } : cp
+        ),
+      })),
+      decision: (event) => setProject(prev => ({
+        ...prev,
+        checkpoints: prev.checkpoints.map(cp =>
+          cp.id === event.checkpoint
+            ? { ...cp, completed: event.checkpointCompleted, completedAt: event.checkpointCompletedAt }
+            : cp
+        ),
+        decisions: (prev.decisions || []).some(d => d.id === event.id)
+          ? prev.decisions
+          : [event, ...(prev.decisions || [])],
+      })),
+      comment: setLiveComment,
+      resync: () => refreshProject(),
+    });
+  }, [project.id]);
+
   // Refresh project data from API
   async function refreshProject() {
     try {
@@ -685,7 +712,7 @@ function ProjectDashboard({ project: initialProject, user, role, onBack, onLogou
                               </div>
                             );
                           })()}
-                          <CheckpointComments projectId={project.id} checkpointId={checkpoint.id} />
+                          <CheckpointComments projectId={project.id} checkpointId={checkpoint.id} liveComment={liveComment} />
                         </div>
                       )}
                     </div>
@@ -11,6 +11,7 @@ function ProjectList({ user, role, onSelectProject, onLogout, onViewDashboard, o
   const [creating, setCreating] = useState(false);
   const [createError, setCreateError] = useState('');
   const [availableTools, setAvailableTools] = useState([]);
+  const [suggestedTools, setSuggestedTools] = useState([]);
   const [editingProject, setEditingProject] = useState(null);
   const [editFacultyEmail, setEditFacultyEmail] = useState('');
   const [editSaving, setEditSaving] = useState(false);
@@ -26,6 +27,21 @@ function ProjectList({ user, role, onSelectProject, onLogout, onViewDashboard, o
     }
   }, [showCreateModal]);
 
+  // Tools recommended for the chosen use case, best fit first
+  useEffect(() => {
+    if (!showCreateModal || !newProject.aiUseCase) {
+      setSuggestedTools([]);
+      return;
+    }
+    fetchTools({ use_case: newProject.aiUseCase }).then(setSuggestedTools).catch(() => setSuggestedTools([]));
+  }, [showCreateModal, newProject.aiUseCase]);
+
+  const suggestionById = Object.fromEntries(suggestedTools.map((t) => [t.id, t.compatibility]));
+  const pickerTools = [
+    ...suggestedTools,
+    ...availableTools.filter((t) => !suggestionById[t.id]),
+  ].filter((t) => t.status !== 'not_recommended');
+
   async function loadProjects() {
     try {
       const data = await fetchProjects();
@@ -180,6 +196,9 @@ function ProjectList({ user, role, onSelectProject, onLogout, onViewDashboard, o
                     </span>
                   </div>
                   <p className="project-description">{project.description || 'No description'}</p>
+                  {project.toolRiskFlag && (
+                    <p className="project-risk-flag">Uses a tool that is no longer recommended</p>
+                  )}
 
                   <div className="project-progress">
                     <div className="progress-bar-container">
@@ -299,7 +318,7 @@ function ProjectList({ user, role, onSelectProject, onLogout, onViewDashboard, o
               <div className="form-group">
                 <label>Tools Used (optional)</label>
                 <div className="tool-multiselect">
-                  {availableTools.filter(t => t.status !== 'not_recommended').map(tool => (
+                  {pickerTools.map(tool => (
                     <label key={tool.id} className="tool-option">
                       <input
                         type="checkbox"
@@ -312,10 +331,18 @@ function ProjectList({ user, role, onSelectProject, onLogout, onViewDashboard, o
                         }}
                       />
                       <span className="tool-option-name">{tool.name}</span>
+                      {suggestionById[tool.id] && (
+                        <span
+                          className={`tool-option-status ${suggestionById[tool.id].verdict}`}
+                          title={suggestionById[tool.id].reasons.join('\n')}
+                        >
+                          {suggestionById[tool.id].verdict === 'caution' ? 'Caution' : 'Suggested'}
+                        </span>
+                      )}
                     </label>
                   ))}
                 </div>
-                <p className="form-hint">Select tools from the institutional registry</p>
+                <p className="form-hint">Select tools from the institutional registry; tools suggested for your use case are listed first</p>
               </div>
             )}
 
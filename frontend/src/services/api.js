@@ -86,9 +86,45 @@ export async function updateTool(toolId, data) {
   return res.data;
 }
 
-export async function fetchToolDetail(toolId) {
-  const res = await api.get(`/tools/${toolId}/detail`);
-  return res.data;
+// Tool detail with one page of its activity history
+export async function fetchToolDetail(toolId, page = 1) {
+  const res = await api.get(`/tools/${toolId}/detail`, { params: { page } });
+  return res.data;
+}
+
+// Compatibility of every tool with every project use case
+export async function fetchToolMatrix() {
+  const res = await api.get('/tools/matrix');
+  return res.data;
+}
+
+// Live Updates
+// Set once a stream fails before opening: the server is not running in
+// ASGI mode (the endpoint answers 501), so later dashboards skip it.
+let liveUpdatesUnavailable = false;
+
+// Checkpoint, decision and comment events for one project. Returns a
+// function that closes the stream. On 'resync' the server has dropped
+// events, so the caller should refetch the project.
+export function subscribeToProjectEvents(projectId, handlers) {
+  if (liveUpdatesUnavailable) {
+    return () => {};
+  }
+  const source = new EventSource(`${api.defaults.baseURL}/projects/${projectId}/events`, { withCredentials: true });
+  let opened = false;
+  source.addEventListener('open', () => { opened = true; });
+  source.addEventListener('error', () => {
+    // After a drop the browser reconnects by itself; a stream that never
+    // opened would only be retried forever
+    if (!opened) {
+      liveUpdatesUnavailable = true;
+      source.close();
+    }
+  });
+  for (const [eventType, handler] of Object.entries(handlers)) {
+    source.addEventListener(eventType, (e) => handler(JSON.parse(e.data)));
+  }
+  return () => source.close();
 }
 
 // Checkpoint Comments
@@ -198,6 +234,12 @@ export async function fetchEthicsNode(nodeKey) {
   return res.data;
 }
 
+// Whole decision tree in one request; the browser revalidates it by ETag
+export async function fetchEthicsBundle() {
+  const res = await api.get('/ethics/bundle');
+  return res.data;
+}
+
 export async function evaluateEthicsPath(answers) {
   const res = await api.post('/ethics/evaluate', { answers });
   return res.data;
@@ -214,10 +256,12 @@ export async function fetchTemplate(templateKey) {
   return res.data;
 }
 
-export async function generateDocument(templateKey, fieldValues) {
+export async function generateDocument(templateKey, fieldValues, projectId = null) {
+  // With a projectId the server fills in project name, tools and history
   const res = await api.post('/ethics/generate', {
     template_key: templateKey,
-    fields: fieldValues
+    fields: fieldValues,
+    ...(projectId ? { project_id: projectId } : {})
   });
   return res.data;
 }